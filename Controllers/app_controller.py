@@ -1,24 +1,40 @@
 ﻿from __future__ import annotations
 
+import sys
+import time
 import tkinter as tk
+from functools import partial
 from tkinter import messagebox
-from typing import Dict, Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
+import metrics
 from business_rules import (
-    PANIC_THRESHOLD,
-    REPORT_TYPES,
     STATUS_NORMAL,
-    STATUS_PANIC,
-    can_accept_report,
-    can_verify_rumour,
-    filter_rumours_by_status,
-    filter_rumours_by_verified,
+    SUMMARY_PANIC,
+    SUMMARY_VERIFIED_FALSE,
+    SUMMARY_VERIFIED_TRUE,
     get_status_display,
-    should_trigger_panic,
 )
-from config import DATA_DIR
-from Models import ReportModel, RumourModel, UserModel
-from Views import LoginView, RumourDetailView, RumourListView, SummaryView
+from config import (
+    BACKGROUND_IO,
+    IO_MAX_PENDING,
+    IO_POLL_MS,
+    IO_RETRY_MAX_MS,
+    METRICS_DUMP_INTERVAL_MS,
+    METRICS_PATH,
+    PANIC_COOLDOWN_CHECK_MS,
+    PRELOAD_MODELS,
+    RUMOUR_SAVE_INTERVAL_MS,
+    RUMOUR_WRITE_BEHIND,
+    SEARCH_INDEX_CHUNK,
+    STARTUP_TIMING,
+    SYNC_INTERVAL_MS,
+)
+from Models import ChangeEvent, ModelLoader
+from Models.events import RELOADED, REPORT_ADDED
+from Models.search_index import is_searchable
+from Services import IOWorker, RumourService, ServiceError
+from Views import DebugPanel, LoginView, RumourDetailView, RumourListView, SummaryView
 
 
 class AppController:
@@ -27,128 +43,478 @@ class AppController:
     def __init__(self, root: tk.Tk) -> None:
         """Initialize the application controller."""
         self.root = root
-        # โหลด Models จากไฟล์ JSON
-        self.rumour_model = RumourModel(DATA_DIR / "rumours.json")
-        self.report_model = ReportModel(DATA_DIR / "reports.json")
-        self.user_model = UserModel(DATA_DIR / "users.json")
+        # เวลาที่ใช้ในแต่ละขั้นของการเริ่มโปรแกรม (วินาที) สำหรับ RUMOUR_STARTUP_TIMING
+        self.startup_times: Dict[str, float] = {}
+        # Models ตาม storage backend ที่ตั้งค่าไว้ (JSON หรือ SQLite) ถูกโหลดเมื่อใช้ครั้งแรก
+        self.models = ModelLoader(background_io=BACKGROUND_IO)
+        # ตรรกะธุรกิจทั้งหมดอยู่ใน service (controller ทำหน้าที่แสดงผลและข้อความแจ้งเตือน)
+        self._service: Optional[RumourService] = None
+        # version ของหมวดสรุปที่ summary view แสดงอยู่ และข่าวลือที่จำนวนรายงานเปลี่ยนหลังจากนั้น
+        self._summary_version: Optional[int] = None
+        self._summary_updated_ids: Dict[str, None] = {}
+        # การเปลี่ยนแปลงจาก model ที่รอแก้ใน view (รวมกันแล้วแก้ครั้งเดียวเมื่อ Tk ว่าง)
+        self._changed_ids: Dict[str, None] = {}
+        self._data_reloaded = False
+        # มีข่าวลือที่ field เปลี่ยน (เข้าหรือออกจากเงื่อนไขกรอง/ค้นหาของ list view ได้)
+        self._list_stale = False
+        self._changes_scheduled = False
+        # thread เบื้องหลังสำหรับเขียนไฟล์ (ผลลัพธ์ถูกดึงกลับมาด้วย root.after)
+        self.io_worker: Optional[IOWorker] = IOWorker(IO_MAX_PENDING) if BACKGROUND_IO else None
+        self._flush_scheduled = False
+        self._io_polling = False
+        # model ที่บันทึกล้มเหลว -> (จำนวนครั้งที่ล้มเหลวติดกัน, เวลา time.monotonic() ที่จะลองใหม่)
+        self._io_failures: Dict[str, Tuple[int, float]] = {}
+        self.debug_panel: Optional[DebugPanel] = None
+        # ข้อความค้นหาที่ list view แสดงผลอยู่ ("" = แสดงข่าวลือทั้งหมด)
+        self.search_query = ""
+        # ตัวกรองของ list view และ summary view (เงื่อนไขของ RumourService.query, {} = ไม่กรอง)
+        self.list_filters: Dict[str, Any] = {}
+        self.summary_filters: Dict[str, Any] = {}
 
         # เก็บข้อมูลผู้ใช้ปัจจุบัน
         self.current_user_id: Optional[str] = None
         self.current_user: Optional[Dict] = None
 
-        # สร้าง Views 
+        # สร้างเฉพาะหน้า login ก่อน หน้าอื่นสร้างเมื่อเปิดครั้งแรก (ดู _view)
+        started = time.perf_counter()
+        self._views: Dict[str, tk.Frame] = {}
         self.login_view = LoginView(root, self)
-        self.list_view = RumourListView(root, self)
-        self.detail_view = RumourDetailView(root, self)
-        self.summary_view = SummaryView(root, self)
+        self.login_view.grid(row=0, column=0, sticky="nsew")
+        self.startup_times["views"] = time.perf_counter() - started
 
-        for view in (self.login_view, self.list_view, self.detail_view, self.summary_view):
-            view.grid(row=0, column=0, sticky="nsew")
+        # แถบสถานะการบันทึก ("Saving…") ใต้ทุกหน้าจอ
+        self.io_status = tk.Label(root, text="", anchor="e", fg="gray")
+        self.io_status.grid(row=1, column=0, sticky="ew", padx=8)
 
         self.login_view.after_login = self.show_list_view
         self.login_view.tkraise()
 
+        # บันทึกข้อมูลที่ค้างอยู่เป็นระยะ และก่อนปิดโปรแกรม
+        self.root.protocol("WM_DELETE_WINDOW", self.shutdown)
+        if RUMOUR_WRITE_BEHIND and not self.io_worker:
+            self.root.after(RUMOUR_SAVE_INTERVAL_MS, self._flush_periodically)
+        # รับการเปลี่ยนแปลงจาก process อื่นที่ใช้ Data/ ร่วมกัน
+        if SYNC_INTERVAL_MS:
+            self.root.after(SYNC_INTERVAL_MS, self._sync_periodically)
+        # ข่าวลือ panic ที่ไม่มีรายงานเข้ามาเร็วแล้วกลับเป็นปกติ
+        if PANIC_COOLDOWN_CHECK_MS:
+            self.root.after(PANIC_COOLDOWN_CHECK_MS, self._cool_down_periodically)
+        # สถิติประสิทธิภาพ: เขียนไฟล์เป็นระยะ และหน้าต่าง debug ที่ซ่อนไว้ (Ctrl+Shift+D)
+        self.root.after(METRICS_DUMP_INTERVAL_MS, self._dump_metrics_periodically)
+        self.root.bind_all("<Control-Shift-D>", self.toggle_debug_panel)
+        # โหลดข่าวลือและรายงานเบื้องหลังระหว่างที่ผู้ใช้กรอก User ID
+        if PRELOAD_MODELS:
+            self.root.after_idle(self.models.preload)
+
+    @property
+    def rumour_model(self) -> Any:
+        """The rumour model (loaded on first access)."""
+        return self.models.get("rumours")
+
+    @property
+    def report_model(self) -> Any:
+        """The report model (loaded on first access)."""
+        return self.models.get("reports")
+
+    @property
+    def user_model(self) -> Any:
+        """The user model (loaded on first access)."""
+        return self.models.get("users")
+
+    @property
+    def service(self) -> RumourService:
+        """The service on top of the three models, created (and the data loaded) on first use."""
+        if self._service is None:
+            started = time.perf_counter()
+            self._service = RumourService(self.rumour_model, self.report_model, self.user_model)
+            self.startup_times["data"] = time.perf_counter() - started
+            if STARTUP_TIMING:
+                self._print_load_times()
+            # view แก้เฉพาะแถวที่ได้รับผลจากการเปลี่ยนแปลงแต่ละครั้ง แทนการวาดใหม่ทั้งหน้า
+            self._service.rumour_model.changes.subscribe(self._on_model_change)
+            self._service.report_model.changes.subscribe(self._on_model_change)
+            # สร้างดัชนีค้นหาทีละส่วนเมื่อหน้าต่างว่าง
+            self.root.after_idle(self._build_search_index_step)
+        return self._service
+
+    def _print_load_times(self) -> None:
+        """Print how long each model took to load and how long the first data access waited."""
+        loads = []
+        for name, seconds in self.models.load_times.items():
+            cached = getattr(self.models.get(name), "loaded_from_cache", False)
+            loads.append(f"{name} {seconds:.2f}s{' (cache)' if cached else ''}")
+        print(f"startup: data ready, waited {self.startup_times['data']:.2f}s ({', '.join(loads)})", file=sys.stderr)
+
+    def _view(self, name: str, view_type: type) -> Any:
+        """The view ``name``, built and placed on first use."""
+        view = self._views.get(name)
+        if view is None:
+            with metrics.timer("view_build", view=name):
+                view = self._views[name] = view_type(self.root, self)
+            view.grid(row=0, column=0, sticky="nsew")
+        return view
+
+    @property
+    def list_view(self) -> RumourListView:
+        """The rumour list view."""
+        return self._view("list", RumourListView)
+
+    @property
+    def detail_view(self) -> RumourDetailView:
+        """The rumour detail view."""
+        return self._view("detail", RumourDetailView)
+
+    @property
+    def summary_view(self) -> SummaryView:
+        """The summary view."""
+        return self._view("summary", SummaryView)
+
+    def _flush_periodically(self) -> None:
+        """Write pending rumour changes and schedule the next flush."""
+        if self.models.is_loaded("rumours"):
+            self.rumour_model.flush()
+        self.root.after(RUMOUR_SAVE_INTERVAL_MS, self._flush_periodically)
+
+    def _schedule_flush(self) -> None:
+        """Write changes in the background once the current Tk callback has finished."""
+        if self.io_worker and not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after_idle(self._start_flush)
+
+    def _saved_models(self) -> Tuple[Tuple[str, Any], ...]:
+        """The (name, model) pairs written by the I/O worker."""
+        return (("rumours", self.rumour_model), ("reports", self.report_model))
+
+    @metrics.timed("action", action="start_flush")
+    def _start_flush(self) -> None:
+        """Hand each model's pending changes to the I/O worker (if it has room and is not backing off)."""
+        self._flush_scheduled = False
+        now = time.monotonic()
+        for name, model in self._saved_models():
+            # worker เต็ม: เก็บการแก้ไขไว้ในหน่วยความจำ แล้วเขียนรวมกันในรอบถัดไป
+            if not self.io_worker.has_capacity:
+                break
+            # บันทึกครั้งก่อนล้มเหลว: รอจนถึงเวลาลองใหม่
+            if name in self._io_failures and self._io_failures[name][1] > now:
+                continue
+            job = model.begin_flush()
+            if job:
+                self.io_worker.submit(job, partial(self._flush_done, name, model))
+        self._update_io_status()
+        if not self._io_polling and (self.io_worker.pending or self._has_unsaved()):
+            self._io_polling = True
+            self.root.after(self._next_poll_ms(), self._poll_io)
+
+    def _next_poll_ms(self) -> int:
+        """Delay before the next poll: the poll interval, or the earliest retry when only failed saves wait."""
+        if self.io_worker.pending:
+            return IO_POLL_MS
+        retry_at = []
+        for name, model in self._saved_models():
+            if model.is_dirty:
+                if name not in self._io_failures:
+                    return IO_POLL_MS
+                retry_at.append(self._io_failures[name][1])
+        if not retry_at:
+            return IO_POLL_MS
+        return max(IO_POLL_MS, int((min(retry_at) - time.monotonic()) * 1000))
+
+    def _flush_done(self, name: str, model: Any, result: Any, error: Optional[BaseException]) -> None:
+        """Finish a background write on the Tk thread; a failed model is retried with exponential backoff."""
+        model.end_flush(None if error else result)
+        failures = self._io_failures.pop(name, (0, 0.0))[0]
+        if error is None:
+            if failures:
+                print(f"Background save of {name} succeeded after {failures} failed attempts", file=sys.stderr)
+            return
+        if not failures:
+            # พิมพ์เฉพาะครั้งแรก ความล้มเหลวซ้ำ (เช่น ดิสก์เต็ม) ไม่ต้องพิมพ์ทุกรอบ
+            print(f"Background save of {name} failed: {error!r}", file=sys.stderr)
+        failures += 1
+        delay_ms = min(IO_RETRY_MAX_MS, IO_POLL_MS * 2**failures)
+        self._io_failures[name] = (failures, time.monotonic() + delay_ms / 1000)
+
+    def _poll_io(self) -> None:
+        """Collect finished writes, start writes for changes made meanwhile, and keep polling while busy."""
+        self._io_polling = False
+        self.io_worker.poll()
+        if self._has_unsaved():
+            self._start_flush()
+        else:
+            self._update_io_status()
+            if self.io_worker.pending:
+                self._io_polling = True
+                self.root.after(IO_POLL_MS, self._poll_io)
+
+    def _has_unsaved(self) -> bool:
+        """Whether any model holds changes not yet handed to the worker."""
+        return self.rumour_model.is_dirty or self.report_model.is_dirty
+
+    def _update_io_status(self) -> None:
+        """Show whether a save is running (or failed and will be retried)."""
+        if self._io_failures:
+            self.io_status.config(text="Save failed – retrying…", fg="red")
+        elif self.io_worker.pending or self._has_unsaved():
+            self.io_status.config(text="Saving…", fg="gray")
+        else:
+            self.io_status.config(text="")
+
+    @metrics.timed("action", action="sync")
+    def _sync(self) -> List[str]:
+        """Merge changes saved by other processes; return the affected rumour IDs."""
+        changed = self.service.sync()
+        if changed:
+            # SQLite ไม่ส่ง event สำหรับการเปลี่ยนแปลงของ connection อื่น จึงส่งต่อให้ view เอง
+            self._queue_changes(changed)
+            # อาจมีข่าวลือที่เปลี่ยนเป็น panic ซึ่งต้องบันทึก
+            self._schedule_flush()
+        return changed
+
+    def _sync_periodically(self) -> None:
+        """Merge changes from other processes (the views patch themselves) and schedule the next check."""
+        # ยังไม่ได้โหลดข้อมูล (หน้า login): ไม่มีอะไรต้องรวม
+        if self._service is not None:
+            self._sync()
+        self.root.after(SYNC_INTERVAL_MS, self._sync_periodically)
+
+    @metrics.timed("action", action="cool_down")
+    def _cool_down_periodically(self) -> None:
+        """Return cooled-down panic rumours to normal and schedule the next check."""
+        if self._service is not None and self._service.cool_down():
+            self._schedule_flush()
+        self.root.after(PANIC_COOLDOWN_CHECK_MS, self._cool_down_periodically)
+
+    def _on_model_change(self, event: ChangeEvent) -> None:
+        """Note one model change; the views are patched once the current burst of changes is over."""
+        if event.kind == RELOADED:
+            self._data_reloaded = True
+            self._queue_changes(())
+        else:
+            # รายงานใหม่เปลี่ยนเฉพาะจำนวนรายงาน ไม่เปลี่ยนว่าข่าวลือตรงตัวกรองหรือไม่
+            self._queue_changes((event.rumour_id,), fields_changed=event.kind != REPORT_ADDED)
+
+    def _queue_changes(self, rumour_ids: Iterable[str], fields_changed: bool = True) -> None:
+        """Remember changed rumours and schedule one view update for the next idle cycle.
+
+        ``fields_changed`` is False when only report counts changed, so a
+        filtered or searched list keeps the same rumours.
+        """
+        for rumour_id in rumour_ids:
+            self._changed_ids[rumour_id] = None
+        self._list_stale = self._list_stale or fields_changed
+        if not self._changes_scheduled:
+            self._changes_scheduled = True
+            self.root.after_idle(self._apply_changes)
+
+    @metrics.timed("action", action="apply_changes")
+    def _apply_changes(self) -> None:
+        """Patch the built views with the changes collected since the last idle cycle."""
+        self._changes_scheduled = False
+        changed, self._changed_ids = self._changed_ids, {}
+        reloaded, self._data_reloaded = self._data_reloaded, False
+        list_stale, self._list_stale = self._list_stale, False
+        report_counts = self.report_model.get_report_counts()
+        if "list" in self._views:
+            if list_stale and (self.search_query or self.list_filters):
+                # ผลกรอง/ค้นหาเป็นรายการคงที่: ดึงใหม่ ให้ข่าวลือที่ออกจากเงื่อนไขหายไปและที่เข้าเงื่อนไขปรากฏ
+                with metrics.timer("render", view="list_requery"):
+                    self.list_view.replace_data(self._list_rumours(), report_counts)
+            else:
+                # แก้เฉพาะแถวที่มองเห็นซึ่งข้อความเปลี่ยน (ลำดับอาจเปลี่ยนตามจำนวนรายงาน)
+                with metrics.timer("render", view="list_patch"):
+                    self.list_view.patch_rows(report_counts)
+        if "detail" in self._views:
+            shown = self.detail_view.rumour
+            rumour_id = shown.get("rumourId") if shown else None
+            if rumour_id is not None and (reloaded or rumour_id in changed):
+                with metrics.timer("render", view="detail_patch"):
+                    self.detail_view.update_rumour(self.rumour_model.get_by_id(rumour_id), report_counts)
+        self._summary_updated_ids.update(changed)
+        if reloaded:
+            self._summary_version = None
+        elif "summary" in self._views and self._summary_version is not None:
+            self._render_summary(report_counts, delta_only=True)
+
+    def _build_search_index_step(self) -> None:
+        """Index the next chunk of rumours for search, then yield to the event loop."""
+        if not self.rumour_model.build_search_index(SEARCH_INDEX_CHUNK):
+            self.root.after(1, self._build_search_index_step)
+
+    def dump_metrics(self) -> None:
+        """Write the recorded metrics to ``METRICS_PATH`` (Prometheus text, or JSON for ``*.json``)."""
+        try:
+            metrics.dump(METRICS_PATH)
+        except OSError as exc:
+            print(f"Writing metrics failed: {exc!r}", file=sys.stderr)
+
+    def _dump_metrics_periodically(self) -> None:
+        """Write the metrics file (when recording) and schedule the next dump."""
+        if metrics.is_enabled():
+            self.dump_metrics()
+        self.root.after(METRICS_DUMP_INTERVAL_MS, self._dump_metrics_periodically)
+
+    def toggle_debug_panel(self, event: Optional[tk.Event] = None) -> None:
+        """Open the metrics debug panel, or close it if it is open."""
+        if self.debug_panel is not None and self.debug_panel.winfo_exists():
+            self.debug_panel.destroy()
+            self.debug_panel = None
+        else:
+            self.debug_panel = DebugPanel(self.root, self)
+
+    def shutdown(self) -> None:
+        """Flush pending changes and close the application window."""
+        if self.io_worker:
+            # รอให้การเขียนเบื้องหลังเสร็จ แล้วเขียนส่วนที่เหลือทันที
+            self.io_worker.close()
+        models = self.models.loaded()
+        for name in ("rumours", "reports"):
+            if name in models:
+                models[name].flush()
+                # ให้การเปิดโปรแกรมครั้งถัดไปอ่านข้อมูลจาก cache แทนการ parse JSON
+                models[name].write_cache()
+        if metrics.is_enabled():
+            self.dump_metrics()
+        self.root.destroy()
+
+    @metrics.timed("action", action="show_list_view")
     def show_list_view(self) -> None:
         """Display the rumour list view."""
-        # ดึงข่าวลือทั้งหมด และจำนวนรายงาน
-        rumours = self.rumour_model.get_all()
+        self._sync()
+        # ดึงจำนวนรายงาน และลำดับข่าวลือที่เรียงไว้แล้ว (ไม่ต้อง sort ใหม่ทุกครั้ง)
         report_counts = self.report_model.get_report_counts()
-        # เรียงลำดับตามจำนวนรายงาน และ credibility score (น้อยไปมาก)
-        sorted_rumours = sorted(
-            rumours,
-            key=lambda r: (report_counts.get(r.get("rumourId"), 0), r.get("credibilityScore", 0)),
-            reverse=True,
-        )
-        self.list_view.set_data(sorted_rumours, report_counts)
+        with metrics.timer("rank"):
+            rumours = self._list_rumours()
+        with metrics.timer("render", view="list"):
+            self.list_view.set_data(rumours, report_counts)
         self.list_view.tkraise()  # แสดง list view หน้าจอ
 
+    def _list_rumours(self) -> Sequence[Dict]:
+        """The rumours for the list view: search hits, filtered rumours or the whole ranking."""
+        if self.search_query:
+            return self.service.search(self.search_query, **self.list_filters)
+        if self.list_filters:
+            # ใช้ดัชนีรองเลือกเฉพาะข่าวลือที่ตรงเงื่อนไข
+            return list(self.service.query(**self.list_filters))
+        # ลำดับที่เรียงไว้แล้ว ปรับตัวเองเมื่อข้อมูลเปลี่ยน
+        return self.service.get_ranking()
+
+    def search_rumours(self, query: str) -> None:
+        """Show the rumours matching ``query`` in the list view (all rumours when empty or too short)."""
+        # คำค้นสั้นเกินไป (ตัวอักษรเดียว) ตรงแทบทุกข่าวลือ: แสดงทั้งหมดไปก่อนจนกว่าจะพิมพ์เพิ่ม
+        self.search_query = query.strip() if is_searchable(query) else ""
+        self.show_list_view()
+
+    def filter_rumours(self, criteria: Dict[str, Any]) -> None:
+        """Show only the rumours matching ``criteria`` in the list view (all rumours when empty)."""
+        self.list_filters = criteria
+        self.show_list_view()
+
+    def filter_summary(self, criteria: Dict[str, Any]) -> None:
+        """Narrow the summary view down to ``criteria`` (e.g. one source or a date range)."""
+        self.summary_filters = criteria
+        self._summary_version = None  # แสดงใหม่ทั้งหมด
+        self.show_summary_view()
+
+    @metrics.timed("action", action="show_detail_view")
     def show_detail_view(self, rumour_id: Optional[str]) -> None:
         """Display the rumour detail view."""
         report_counts = self.report_model.get_report_counts()
         rumour = self.rumour_model.get_by_id(rumour_id) if rumour_id else None
-        self.detail_view.set_rumour(rumour, report_counts)
+        with metrics.timer("render", view="detail"):
+            self.detail_view.set_rumour(rumour, report_counts)
         self.detail_view.tkraise()
 
+    @metrics.timed("action", action="show_summary_view")
     def show_summary_view(self) -> None:
         """Display the summary view."""
-        # ดึงจำนวนรายงานและข่าวลือทั้งหมด
-        report_counts = self.report_model.get_report_counts()
-        rumours = self.rumour_model.get_all()
-        # แยกข่าวลือตามประเภท: ฉุกเฉิน, ยืนยันจริง, ยืนยันเท็จ
-        panic_rumours = filter_rumours_by_status(rumours, STATUS_PANIC)
-        verified_true_rumours = filter_rumours_by_verified(rumours, True)
-        verified_false_rumours = filter_rumours_by_verified(rumours, False)
-        self.summary_view.set_data(panic_rumours, verified_true_rumours, verified_false_rumours, report_counts)
+        self._sync()
+        self._render_summary(self.report_model.get_report_counts())
         self.summary_view.tkraise()  # แสดง summary view หน้าจอ
 
-    def submit_report(self, rumour_id: str, report_type: str, description: str) -> None:
-        """Submit a report for a rumour."""
-        # ตรวจสอบว่าผู้ใช้ได้เข้าสู่ระบบแล้วหรือไม่
-        if not self.current_user_id:
-            messagebox.showerror("Error", "Please login first")
-            return
-
-        # ตรวจสอบความถูกต้องของ rumour_id
-        rumour = self.validate_rumour_id(rumour_id)
-        if not rumour:
-            messagebox.showerror("Error", "Rumour not found")
-            return
-
-        # ตรวจสอบว่าข่าวลือสามารถรับรายงาน
-        is_verified = self.rumour_model.is_verified(rumour)
-        user_reported = self.report_model.has_report(self.current_user_id, rumour_id)
-        if not can_accept_report(rumour, user_reported, is_verified):
-            if is_verified:
-                messagebox.showwarning("Warning", "Verified rumours cannot be reported")
-            else:
-                messagebox.showwarning("Warning", "You already reported this rumour")
+    def _render_summary(self, report_counts: Mapping[str, int], delta_only: bool = False) -> None:
+        """Bring the summary view up to date, sending only the changes since the last render when possible.
+
+        With ``delta_only`` nothing is redrawn when the changes are not
+        available (e.g. SQLite); the view is then rebuilt when next shown.
+        """
+        changes = None
+        if self._summary_version is not None:
+            changes = self.rumour_model.get_bucket_changes(self._summary_version)
+        if changes is None and delta_only:
+            self._summary_version = None
             return
+        if changes is None:
+            # แสดงครั้งแรก (หรือข้อมูลถูกโหลดใหม่ / เปลี่ยนตัวกรอง): ดึงข่าวลือทั้ง 3 หมวด
+            # จาก bucket ที่เก็บไว้ หรือจาก query เมื่อมีตัวกรอง
+            summary = self.service.get_summary(**self.summary_filters)
+            with metrics.timer("render", view="summary"):
+                self.summary_view.set_data(
+                    summary[SUMMARY_PANIC],
+                    summary[SUMMARY_VERIFIED_TRUE],
+                    summary[SUMMARY_VERIFIED_FALSE],
+                    report_counts,
+                )
+        else:
+            # ส่งเฉพาะการเปลี่ยนแปลงตั้งแต่การแสดงครั้งก่อน
+            get_rumour = self.rumour_model.get_by_id
+            with metrics.timer("render", view="summary_delta"):
+                self.summary_view.apply_changes(
+                    [(name, action, get_rumour(rumour_id)) for name, action, rumour_id in changes],
+                    [get_rumour(rumour_id) for rumour_id in self._summary_updated_ids],
+                    report_counts,
+                )
+        # การเปลี่ยนแปลงแบบ delta ไม่รู้จักตัวกรอง จึงแสดงใหม่ทั้งหมดทุกครั้งที่มีตัวกรอง
+        self._summary_version = None if self.summary_filters else self.rumour_model.change_version
+        self._summary_updated_ids = {}
+
+    def _show_problem(self, problem: ServiceError) -> None:
+        """Show a rejected request in a message box."""
+        if problem.level == "error":
+            messagebox.showerror("Error", problem.message)
+        else:
+            messagebox.showwarning("Warning", problem.message)
 
-        if not report_type:
-            messagebox.showwarning("Warning", "Report type is required")
+    def submit_report(self, rumour_id: str, report_type: str, description: str) -> None:
+        """Submit a report for a rumour."""
+        try:
+            # จับเวลาเฉพาะการประมวลผล ไม่รวมเวลาที่ผู้ใช้อ่านกล่องข้อความ
+            with metrics.timer("action", action="submit_report"):
+                self.service.submit_report(self.current_user_id, rumour_id, report_type, description)
+        except ServiceError as problem:
+            self._show_problem(problem)
             return
+        self._schedule_flush()
 
-        # บันทึกรายงาน
-        self.report_model.add_report(self.current_user_id, rumour_id, report_type, description)
-        report_counts = self.report_model.get_report_counts()
-        # ตรวจสอบว่าควรเปลี่ยนสถานะเป็น panic หรือไม่
-        if should_trigger_panic(report_counts.get(rumour_id, 0)):
-            self.rumour_model.update_status(rumour_id, STATUS_PANIC)
-
+        # view ที่เกี่ยวข้องแก้ตัวเองจาก event ของ model จึงล้างเฉพาะช่องเลือกประเภท
         messagebox.showinfo("Success", "Report submitted")
-        self.show_detail_view(rumour_id)
+        self.detail_view.clear_inputs()
+
+    @metrics.timed("action", action="submit_reports")
+    def submit_reports(self, items: Iterable[Tuple[str, str]]) -> List[Dict]:
+        """Submit many (rumourId, reportType) reports; returns one result per item."""
+        results = self.service.submit_reports(self.current_user_id, items)
+        self._schedule_flush()
+        return results
 
     def verify_rumour(self, rumour_id: str, decision: str) -> None:
         """Verify a rumour as an inspector."""
-        # ตรวจสอบว่า user ได้เข้าสู่ระบบหรือไม่
-        if not self.current_user_id:
-            messagebox.showerror("Error", "Please login first")
-            return
-
-        # ตรวจสอบว่าผู้ใช้สามารถยืนยันข่าวลือได้หรือไม่
-        if not can_verify_rumour({}, self.is_inspector()):
-            messagebox.showwarning("Warning", "Only inspectors can verify rumours")
-            return
-
-        # ตรวจสอบว่าเลือกผลลัพธ์หรือไม่
-        if decision not in {"true", "false"}:
-            messagebox.showwarning("Warning", "Select a verification result")
-            return
-
-        # ตรวจสอบความถูกต้องของ rumour_id
-        rumour = self.validate_rumour_id(rumour_id)
-        if not rumour:
-            messagebox.showerror("Error", "Rumour not found")
-            return
-
-        # อัปเดตผลยืนยัน
-        verified_result = decision == "true"
-        if not self.rumour_model.update_verified(rumour_id, verified_result, self.current_user_id):
-            messagebox.showerror("Error", "Failed to verify rumour")
+        try:
+            with metrics.timer("action", action="verify_rumour"):
+                self.service.verify_rumour(self.current_user_id, rumour_id, decision)
+        except ServiceError as problem:
+            self._show_problem(problem)
             return
+        self._schedule_flush()
 
         messagebox.showinfo("Success", "Rumour verified")
-        self.show_detail_view(rumour_id)
+        self.detail_view.clear_inputs()
+
+    @metrics.timed("action", action="verify_rumours")
+    def verify_rumours(self, items: Iterable[Tuple[str, str]]) -> List[Dict]:
+        """Verify many (rumourId, decision) items; returns one result per item."""
+        results = self.service.verify_rumours(self.current_user_id, items)
+        self._schedule_flush()
+        return results
 
     def get_status_label(self, rumour: Dict) -> str:
         """Get human-readable status label."""
@@ -161,7 +527,7 @@ class AppController:
 
     def validate_rumour_id(self, rumour_id: str) -> Optional[Dict]:
         """Validate rumour ID and return rumour data, or None if not found."""
-        return self.rumour_model.get_by_id(rumour_id)
+        return self.service.get_rumour(rumour_id)
 
     def can_show_report_frame(self, rumour: Dict) -> bool:
         """Check if report frame should be shown for this rumour."""
@@ -173,6 +539,7 @@ class AppController:
         # แสดงการยืนยันเฉพาะผู้ตรวจสอบ
         return self.is_inspector()
 
+    @metrics.timed("action", action="login")
     def set_current_user(self, user_id: str, user: Dict) -> None:
         """Set the current logged-in user."""
         # บันทึกผู้ใช้ปัจจุบัน
@@ -185,18 +552,27 @@ class AppController:
 
     def is_inspector(self) -> bool:
         """Check if current user is an inspector."""
-        if not self.current_user_id:
-            return False
-        return self.user_model.is_inspector(self.current_user_id)
+        return self.service.is_inspector(self.current_user_id)
 
     def validate_user(self, user_id: str) -> Optional[Dict]:
         """Validate and return user by ID, or None if not found."""
+        # อ่านเฉพาะ users.json: การ login ไม่ต้องรอโหลดข่าวลือและรายงาน
         return self.user_model.get_by_id(user_id)
 
+    @metrics.timed("action", action="logout")
     def logout(self) -> None:
         """Logout current user and return to login screen."""
         self.current_user_id = None
         self.current_user = None
+        self.search_query = ""
+        self.list_filters = {}
+        self.summary_filters = {}
+        self._summary_version = None
+        if "list" in self._views:
+            self.list_view.clear_search()
+            self.list_view.filter_bar.reset()
+        if "summary" in self._views:
+            self.summary_view.filter_bar.reset()
         self.root.title("Rumour Tracking System")
         self.login_view.tkraise()
 
@@ -4,5 +4,31 @@
 from .rumour_model import RumourModel
 from .user_model import UserModel
 from .report_model import ReportModel
+from .records import ReportRecord, RumourRecord
+from .ranking_index import RankingIndex
+from .search_index import SearchIndex, SearchResults
+from .query_index import QueryIndex, RumourQuery
+from .events import ChangeEvent, ChangeFeed
+from .sqlite_models import SQLiteDatabase, SQLiteRumourModel, SQLiteReportModel, SQLiteUserModel
+from .factory import ModelLoader, create_models
 
-__all__ = ['RumourModel', 'UserModel', 'ReportModel']
+__all__ = [
+    'RumourModel',
+    'UserModel',
+    'ReportModel',
+    'RumourRecord',
+    'ReportRecord',
+    'RankingIndex',
+    'SearchIndex',
+    'SearchResults',
+    'QueryIndex',
+    'RumourQuery',
+    'ChangeEvent',
+    'ChangeFeed',
+    'SQLiteDatabase',
+    'SQLiteRumourModel',
+    'SQLiteReportModel',
+    'SQLiteUserModel',
+    'ModelLoader',
+    'create_models',
+]
@@ -0,0 +1,57 @@
+"""Change events published by the models, so views can update only what changed."""
+from __future__ import annotations
+
+from typing import Callable, List, NamedTuple, Optional
+
+# ชนิดของการเปลี่ยนแปลง (rumour_id คือข่าวลือที่ได้รับผล)
+RUMOUR_ADDED = "rumour_added"
+STATUS_CHANGED = "status_changed"
+RUMOUR_VERIFIED = "rumour_verified"
+RUMOUR_CHANGED = "rumour_changed"  # process อื่นแก้ไข field ใดก็ได้
+REPORT_ADDED = "report_added"
+RELOADED = "reloaded"  # ข้อมูลถูกโหลดใหม่ทั้งหมด (rumour_id เป็น None)
+
+
+class ChangeEvent(NamedTuple):
+    """One change to a model's data."""
+
+    kind: str
+    rumour_id: Optional[str]
+
+
+ChangeListener = Callable[[ChangeEvent], None]
+
+
+class ChangeFeed:
+    """The listeners of one model's change events.
+
+    Events are delivered synchronously on the thread that made the change,
+    right after it is applied in memory (a save may still be pending), one
+    event per changed rumour: batching them into redraws is up to the
+    listener. Publishing costs one check when nobody listens.
+    """
+
+    __slots__ = ("_listeners",)
+
+    def __init__(self) -> None:
+        """Create a feed without listeners."""
+        self._listeners: List[ChangeListener] = []
+
+    def subscribe(self, listener: ChangeListener) -> Callable[[], None]:
+        """Call ``listener`` with every future event; return a function that unsubscribes it."""
+        self._listeners.append(listener)
+
+        def unsubscribe() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return unsubscribe
+
+    def publish(self, kind: str, rumour_id: Optional[str] = None) -> None:
+        """Deliver one event to every listener."""
+        if not self._listeners:
+            return
+        event = ChangeEvent(kind, rumour_id)
+        # คัดลอกรายชื่อ เผื่อ listener ยกเลิกการรับระหว่างส่ง
+        for listener in tuple(self._listeners):
+            listener(event)
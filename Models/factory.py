@@ -0,0 +1,135 @@
+"""Create the three models for the storage backend selected in config (all at once or on first use)."""
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, Optional, Tuple
+
+from config import (
+    DATA_DIR,
+    ID_BLOCK_SIZE,
+    REPORT_JOURNAL_COMPACT_BYTES,
+    REPORT_JOURNAL_ENABLED,
+    REPORT_JOURNAL_FSYNC,
+    RUMOUR_WRITE_BEHIND,
+    SNAPSHOT_CACHE_ENABLED,
+    SQLITE_PATH,
+    STORAGE_BACKEND,
+)
+
+from .report_model import ReportModel
+from .rumour_model import RumourModel
+from .sqlite_models import SQLiteDatabase, SQLiteReportModel, SQLiteRumourModel, SQLiteUserModel
+from .user_model import UserModel
+
+
+def create_models(backend: str = STORAGE_BACKEND, background_io: bool = False) -> Tuple:
+    """Create (rumour_model, report_model, user_model) for the given backend.
+
+    With ``background_io`` the JSON models keep changes in memory and the
+    caller writes them with ``begin_flush()`` / ``end_flush()`` on a worker.
+    """
+    loader = ModelLoader(backend, background_io)
+    return loader.get("rumours"), loader.get("reports"), loader.get("users")
+
+
+class ModelLoader:
+    """Create the models of a storage backend one at a time, on first use.
+
+    ``get("users")`` loads only the users file, so a screen that needs one
+    model does not wait for the others. ``preload()`` starts loading models
+    on a background thread (JSON backend only: SQLite connections belong to
+    the thread that opened them); ``get()`` then waits for that load instead
+    of starting a second one. Models are handed out on the calling thread
+    only, so the loading thread never shares a model while it is used.
+    """
+
+    # users ก่อน เพราะหน้า login ใช้ตรวจ User ID
+    NAMES = ("users", "rumours", "reports")
+
+    def __init__(self, backend: str = STORAGE_BACKEND, background_io: bool = False) -> None:
+        """Prepare to load the models of ``backend`` (``background_io`` as in ``create_models``)."""
+        if backend not in ("json", "sqlite"):
+            raise ValueError(f"Unknown storage backend: {backend}")
+        self.backend = backend
+        self._background_io = background_io
+        self._models: Dict[str, Any] = {}
+        # โมเดลที่กำลังโหลดใน thread เบื้องหลัง
+        self._loading: Dict[str, Future] = {}
+        self._database: Optional[SQLiteDatabase] = None
+        # เวลาที่ใช้โหลดแต่ละโมเดล (วินาที) สำหรับ RUMOUR_STARTUP_TIMING
+        self.load_times: Dict[str, float] = {}
+
+    def _create(self, name: str) -> Any:
+        """Load one model (on any thread)."""
+        start = time.perf_counter()
+        if self.backend == "sqlite":
+            if self._database is None:
+                self._database = SQLiteDatabase(SQLITE_PATH)
+            model_type = {"rumours": SQLiteRumourModel, "reports": SQLiteReportModel, "users": SQLiteUserModel}[name]
+            model = model_type(self._database)
+        elif name == "rumours":
+            model = RumourModel(
+                DATA_DIR / "rumours.json",
+                write_behind=RUMOUR_WRITE_BEHIND or self._background_io,
+                snapshot_cache=SNAPSHOT_CACHE_ENABLED,
+                id_block=ID_BLOCK_SIZE,
+            )
+        elif name == "reports":
+            model = ReportModel(
+                DATA_DIR / "reports.json",
+                journal=REPORT_JOURNAL_ENABLED,
+                fsync=REPORT_JOURNAL_FSYNC,
+                compact_bytes=REPORT_JOURNAL_COMPACT_BYTES,
+                write_behind=self._background_io,
+                snapshot_cache=SNAPSHOT_CACHE_ENABLED,
+                id_block=ID_BLOCK_SIZE,
+            )
+        elif name == "users":
+            model = UserModel(DATA_DIR / "users.json")
+        else:
+            raise KeyError(name)
+        self.load_times[name] = time.perf_counter() - start
+        return model
+
+    def get(self, name: str) -> Any:
+        """The model ``name`` ("rumours", "reports" or "users"), loading it now if needed."""
+        model = self._models.get(name)
+        if model is None:
+            future = self._loading.pop(name, None)
+            # ถ้ากำลังโหลดเบื้องหลังอยู่ รอผลนั้น (ข้อผิดพลาดจากการโหลดถูกส่งต่อมาที่นี่)
+            model = future.result() if future is not None else self._create(name)
+            self._models[name] = model
+        return model
+
+    def is_loaded(self, name: str) -> bool:
+        """Whether ``get(name)`` would return without loading or waiting."""
+        future = self._loading.get(name)
+        return name in self._models or (future is not None and future.done())
+
+    def loaded(self) -> Dict[str, Any]:
+        """The models handed out so far, by name."""
+        return dict(self._models)
+
+    def preload(self, *names: str) -> None:
+        """Start loading the given models (default: all) on a background thread, in order."""
+        if self.backend != "json":
+            return
+        pending = [name for name in names or self.NAMES if name not in self._models and name not in self._loading]
+        if not pending:
+            return
+        futures = {name: Future() for name in pending}
+        self._loading.update(futures)
+
+        def load() -> None:
+            for name, future in futures.items():
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(self._create(name))
+                except BaseException as exc:
+                    future.set_exception(exc)
+
+        # daemon: ปิดโปรแกรมได้ทันทีแม้ยังโหลดไม่เสร็จ
+        threading.Thread(target=load, name="model-preload", daemon=True).start()
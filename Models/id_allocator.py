@@ -0,0 +1,86 @@
+"""Allocation of new rumour and report IDs without scanning the data on every insert."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Callable, Optional
+
+from .storage import FileLock, atomic_write_json
+
+DEFAULT_BLOCK = 100
+
+
+def id_number(value: object, prefix: str = "") -> Optional[int]:
+    """Number part of an ID such as ``"10000123"`` or ``"R0042"`` (with ``prefix="R"``); None if it has another form."""
+    if not isinstance(value, str) or not value.startswith(prefix):
+        return None
+    digits = value[len(prefix) :]
+    return int(digits) if digits.isdigit() else None
+
+
+class IdAllocator:
+    """Hands out increasing ID numbers from blocks reserved in a shared counter file.
+
+    The counter file (``<name>.ids``, JSON ``{"next": n}``) holds the first
+    number no process has reserved yet. A process reserves ``block`` numbers
+    at a time under the counter's own file lock, then allocates from that
+    block in memory, so an insert costs O(1) and processes sharing the data
+    never hand out the same number. Numbers left in a block when a process
+    exits are skipped (IDs may have gaps, but never repeat).
+
+    The highest number already in the data is a floor for every block: it
+    is scanned once on first use (``scan``) and kept current with
+    ``observe``, so existing IDs and data written without a counter file
+    (older versions, imports) stay compatible. Numbers beyond the current
+    block belong to other processes' blocks and do not affect it.
+    """
+
+    def __init__(self, data_path: Path, scan: Callable[[], int], block: int = DEFAULT_BLOCK) -> None:
+        """Allocate IDs for ``data_path``; ``scan`` returns the highest ID number in the data (0 if none)."""
+        self.path = data_path.with_suffix(".ids")
+        self.block = max(1, block)
+        self._lock = FileLock(self.path)
+        self._scan = scan
+        # เลขที่สูงที่สุดในข้อมูล (None = ยังไม่ได้ไล่หา) และช่วง [_next, _limit) ที่จองไว้
+        self._highest: Optional[int] = None
+        self._next = 0
+        self._limit = 0
+
+    def observe(self, number: Optional[int]) -> None:
+        """Note an ID number that is now in the data (e.g. a record merged from another process)."""
+        if number is not None and self._highest is not None and number > self._highest:
+            self._highest = number
+
+    def invalidate(self) -> None:
+        """Forget the highest number in the data (it was reloaded); it is scanned again on next use."""
+        self._highest = None
+
+    def allocate(self, count: int = 1) -> int:
+        """Allocate ``count`` consecutive numbers and return the first."""
+        if self._highest is None:
+            self._highest = self._scan()
+        first = self._next
+        # เลขที่เกินช่วงของเราเป็นของ process อื่น (จองไปแล้ว ไม่ชนกัน) แต่ถ้าอยู่ในช่วงของเรา
+        # แปลว่ามีผู้เขียนที่ไม่ใช้ตัวนับ จึงข้ามไปหลังเลขนั้น
+        if first <= self._highest < self._limit:
+            first = self._highest + 1
+        if first + count > self._limit:
+            first = self._reserve(max(count, self.block))
+        self._next = first + count
+        return first
+
+    def _reserve(self, count: int) -> int:
+        """Take the next ``count`` numbers from the counter file; return the first."""
+        with self._lock.hold():
+            first = max(self._read(), self._highest + 1)
+            atomic_write_json(self.path, {"next": first + count})
+        self._limit = first + count
+        return first
+
+    def _read(self) -> int:
+        """The counter file's next free number (0 if missing or unreadable)."""
+        try:
+            with self.path.open("r", encoding="utf-8") as handle:
+                return int(json.load(handle)["next"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return 0
@@ -0,0 +1,210 @@
+"""Secondary indexes for combined rumour queries (status, verified, source, dates, credibility)."""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+# ค่าเริ่มต้นของ verified ที่แปลว่า "ไม่กรอง" (เพราะ None แปลว่ายังไม่ยืนยัน)
+ANY: Any = object()
+
+HASH_FIELDS = ("status", "verified", "source")
+RANGE_FIELDS = ("createdDate", "credibilityScore")
+INDEXED_FIELDS = HASH_FIELDS + RANGE_FIELDS
+# มากกว่า rumourId ทุกค่า ใช้เป็นขอบบนของการค้นแบบช่วง
+_TOP = "\U0010ffff"
+
+FieldValues = Tuple[Any, ...]
+
+
+def _choices(value: Any) -> Optional[Tuple[Any, ...]]:
+    """One value or a collection of accepted values as a tuple (None = no condition)."""
+    if value is None:
+        return None
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(value)
+    return (value,)
+
+
+def _day(value: Union[str, date, None]) -> Optional[str]:
+    """A date bound as an ISO string."""
+    return value.isoformat() if isinstance(value, date) else value
+
+
+def field_values(rumour: Mapping) -> FieldValues:
+    """The indexed fields of a rumour, in ``INDEXED_FIELDS`` order (taken before a change)."""
+    return tuple(rumour.get(field) for field in INDEXED_FIELDS)
+
+
+class RumourQuery:
+    """A combination of conditions on rumour fields; all given conditions must hold.
+
+    ``status`` and ``source`` accept one value or a collection of values;
+    ``verified`` accepts True, False or None (not verified yet), or a
+    collection of these. Date and credibility bounds are inclusive;
+    ``created_to`` also matches timestamps on that day. Rumours without a
+    date or score never match a range on it.
+    """
+
+    def __init__(
+        self,
+        status: Any = None,
+        verified: Any = ANY,
+        source: Any = None,
+        created_from: Union[str, date, None] = None,
+        created_to: Union[str, date, None] = None,
+        min_credibility: Optional[float] = None,
+        max_credibility: Optional[float] = None,
+    ) -> None:
+        """Collect the conditions (None / ``ANY`` leaves a field unconstrained)."""
+        self.statuses = _choices(status)
+        self.verified = None if verified is ANY else (None,) if verified is None else _choices(verified)
+        self.sources = _choices(source)
+        self.created: Optional[Tuple[Optional[str], Optional[str]]] = None
+        if created_from is not None or created_to is not None:
+            created_to = _day(created_to)
+            # ขอบบนรวมทั้งวัน (เช่น "2025-06-07T10:00" อยู่ในช่วงถึง "2025-06-07")
+            self.created = (_day(created_from), created_to + _TOP if created_to is not None else None)
+        self.credibility: Optional[Tuple[Optional[float], Optional[float]]] = None
+        if min_credibility is not None or max_credibility is not None:
+            self.credibility = (min_credibility, max_credibility)
+
+    def __bool__(self) -> bool:
+        """Whether any condition is set."""
+        return any(
+            condition is not None
+            for condition in (self.statuses, self.verified, self.sources, self.created, self.credibility)
+        )
+
+    def categorical(self) -> Iterator[Tuple[str, Tuple[Any, ...]]]:
+        """(field, accepted values) of the categorical conditions that are set."""
+        for field, values in zip(HASH_FIELDS, (self.statuses, self.verified, self.sources)):
+            if values is not None:
+                yield field, values
+
+    def ranges(self) -> Iterator[Tuple[str, Tuple[Any, Any]]]:
+        """(field, (low, high)) of the range conditions that are set (either bound may be None)."""
+        for field, bounds in zip(RANGE_FIELDS, (self.created, self.credibility)):
+            if bounds is not None:
+                yield field, bounds
+
+    def matches(self, rumour: Mapping) -> bool:
+        """Check every condition against one rumour."""
+        for field, values in self.categorical():
+            if rumour.get(field) not in values:
+                return False
+        for field, (low, high) in self.ranges():
+            value = rumour.get(field)
+            if value is None or (low is not None and value < low) or (high is not None and value > high):
+                return False
+        return True
+
+
+class QueryIndex:
+    """Hash indexes on categorical fields and sorted indexes on range fields.
+
+    Each categorical value maps to an insertion-ordered set of rumour IDs;
+    each range field is a sorted list of (value, rumourId). A query starts
+    from whichever condition selects the fewest rumours and checks the
+    other conditions on those candidates only. The model keeps the index in
+    sync: ``add`` / ``discard`` for new and removed rumours and ``update``
+    (with the values from ``field_values`` taken before the change) for
+    edits.
+    """
+
+    def __init__(self, lookup: Callable[[str], Optional[Mapping]]) -> None:
+        """Create an empty index that resolves rumour IDs with ``lookup``."""
+        self._lookup = lookup
+        self._hash: Dict[str, Dict[Any, Dict[str, None]]] = {field: {} for field in HASH_FIELDS}
+        self._sorted: Dict[str, List[Tuple[Any, str]]] = {field: [] for field in RANGE_FIELDS}
+
+    @classmethod
+    def build(cls, rumours: Iterable[Mapping], lookup: Callable[[str], Optional[Mapping]]) -> "QueryIndex":
+        """Index all rumours once (the sorted lists are sorted in one go)."""
+        index = cls(lookup)
+        for rumour in rumours:
+            rumour_id = rumour.get("rumourId")
+            for field in HASH_FIELDS:
+                index._hash[field].setdefault(rumour.get(field), {})[rumour_id] = None
+            for field in RANGE_FIELDS:
+                value = rumour.get(field)
+                if value is not None:
+                    index._sorted[field].append((value, rumour_id))
+        for entries in index._sorted.values():
+            entries.sort()
+        return index
+
+    def add(self, rumour: Mapping) -> None:
+        """Index a new rumour."""
+        rumour_id = rumour.get("rumourId")
+        for field, value in zip(INDEXED_FIELDS, field_values(rumour)):
+            self._insert(field, value, rumour_id)
+
+    def discard(self, rumour: Mapping) -> None:
+        """Remove a rumour (with its current field values) from the index."""
+        rumour_id = rumour.get("rumourId")
+        for field, value in zip(INDEXED_FIELDS, field_values(rumour)):
+            self._remove(field, value, rumour_id)
+
+    def update(self, rumour: Mapping, before: FieldValues) -> None:
+        """Move a changed rumour to its new values; ``before`` comes from ``field_values``."""
+        rumour_id = rumour.get("rumourId")
+        for field, old, new in zip(INDEXED_FIELDS, before, field_values(rumour)):
+            if old != new:
+                self._remove(field, old, rumour_id)
+                self._insert(field, new, rumour_id)
+
+    def _insert(self, field: str, value: Any, rumour_id: str) -> None:
+        """Add one (field, value) entry."""
+        if field in self._hash:
+            self._hash[field].setdefault(value, {})[rumour_id] = None
+        elif value is not None:
+            insort(self._sorted[field], (value, rumour_id))
+
+    def _remove(self, field: str, value: Any, rumour_id: str) -> None:
+        """Remove one (field, value) entry if present."""
+        if field in self._hash:
+            ids = self._hash[field].get(value)
+            if ids is not None:
+                ids.pop(rumour_id, None)
+                if not ids:
+                    del self._hash[field][value]
+        elif value is not None:
+            entries = self._sorted[field]
+            position = bisect_left(entries, (value, rumour_id))
+            if position < len(entries) and entries[position] == (value, rumour_id):
+                del entries[position]
+
+    def values(self, field: str) -> List[Any]:
+        """Distinct values of a categorical field, most common first."""
+        groups = self._hash[field]
+        return sorted(groups, key=lambda value: -len(groups[value]))
+
+    def select(self, query: RumourQuery) -> Iterator[Mapping]:
+        """Yield the rumours matching ``query``, read one at a time.
+
+        The order is that of the most selective index: load order for a
+        categorical condition, ascending value for a range. The candidate
+        IDs are copied first, so the model may change while results are read.
+        """
+        # ประมาณจำนวนผลของแต่ละเงื่อนไข แล้วเริ่มจากเงื่อนไขที่ได้น้อยที่สุด
+        plans: List[Tuple[int, Callable[[], List[str]]]] = []
+        for field, values in query.categorical():
+            groups = [self._hash[field].get(value, {}) for value in values]
+            plans.append(
+                (sum(map(len, groups)), lambda groups=groups: [rumour_id for ids in groups for rumour_id in ids])
+            )
+        for field, (low, high) in query.ranges():
+            entries = self._sorted[field]
+            start = 0 if low is None else bisect_left(entries, (low,))
+            stop = len(entries) if high is None else bisect_right(entries, (high, _TOP))
+            plans.append(
+                (stop - start, lambda entries=entries, start=start, stop=stop: [e[1] for e in entries[start:stop]])
+            )
+        if not plans:
+            return
+        _, candidates = min(plans, key=lambda plan: plan[0])
+        for rumour_id in candidates():
+            rumour = self._lookup(rumour_id)
+            if rumour is not None and query.matches(rumour):
+                yield rumour
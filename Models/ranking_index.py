@@ -0,0 +1,161 @@
+"""Incrementally maintained ranking of rumours for the list view."""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Sequence
+from itertools import accumulate
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+# (-reportCount, -credibilityScore, position, rumourId): เรียงจากน้อยไปมาก = อันดับสูงสุดก่อน
+RankKey = Tuple[int, int, int, str]
+
+
+class RankingIndex(Sequence):
+    """Rumours ordered by (report count, credibility score), highest first.
+
+    Equal keys keep the order in which the rumours were added, matching a
+    stable ``sorted(..., reverse=True)`` over the model list. Keys live in a
+    bucketed sorted list: moving one rumour after a new report is a bisect
+    into one bucket (O(log n) comparisons plus a bounded in-bucket shift),
+    and reading a page only touches the rows on that page.
+
+    Items are looked up through ``lookup`` when read, so rows always reflect
+    the model's current record (e.g. a status change).
+    """
+
+    LOAD = 512  # ขนาดเป้าหมายของแต่ละ bucket
+
+    def __init__(self, lookup: Callable[[str], Optional[Mapping]]) -> None:
+        """Create an empty ranking that resolves rumour IDs with ``lookup``."""
+        self._lookup = lookup
+        self._buckets: List[List[RankKey]] = []
+        self._maxes: List[RankKey] = []
+        self._keys: Dict[str, RankKey] = {}
+        self._offsets: Optional[List[int]] = None
+        self._next_position = 0
+
+    @classmethod
+    def build(
+        cls,
+        rumours: Iterable[Mapping],
+        report_counts: Mapping[str, int],
+        lookup: Callable[[str], Optional[Mapping]],
+    ) -> "RankingIndex":
+        """Build the ranking once from all rumours and their report counts."""
+        index = cls(lookup)
+        keys: List[RankKey] = []
+        for position, rumour in enumerate(rumours):
+            rumour_id = rumour.get("rumourId")
+            key = (-report_counts.get(rumour_id, 0), -(rumour.get("credibilityScore") or 0), position, rumour_id)
+            keys.append(key)
+            index._keys[rumour_id] = key
+        keys.sort()
+        index._buckets = [keys[i : i + cls.LOAD] for i in range(0, len(keys), cls.LOAD)]
+        index._maxes = [bucket[-1] for bucket in index._buckets]
+        index._next_position = len(keys)
+        return index
+
+    def add(self, rumour_id: str, report_count: int, credibility_score: int) -> None:
+        """Insert a new rumour (ranked after existing rumours with the same key)."""
+        key = (-report_count, -(credibility_score or 0), self._next_position, rumour_id)
+        self._next_position += 1
+        self._keys[rumour_id] = key
+        self._insert(key)
+
+    def update_count(self, rumour_id: str, report_count: int) -> None:
+        """Move one rumour to the position for its new report count."""
+        old_key = self._keys.get(rumour_id)
+        if old_key is None or old_key[0] == -report_count:
+            return
+        new_key = (-report_count, old_key[1], old_key[2], rumour_id)
+        self._remove(old_key)
+        self._insert(new_key)
+        self._keys[rumour_id] = new_key
+
+    def rank_of(self, rumour_id: str) -> Optional[int]:
+        """Get the 0-based position of a rumour, or None if it is not ranked."""
+        key = self._keys.get(rumour_id)
+        if key is None:
+            return None
+        bucket_index = bisect_left(self._maxes, key)
+        return self._bucket_offsets()[bucket_index] + bisect_left(self._buckets[bucket_index], key)
+
+    def top(self, k: int) -> List[Mapping]:
+        """Get the k highest ranked rumours."""
+        return self[0:k]
+
+    def page(self, offset: int, limit: int) -> List[Mapping]:
+        """Get ``limit`` rumours starting at rank ``offset``."""
+        return self[offset : offset + limit]
+
+    def ids(self, start: int = 0, stop: Optional[int] = None) -> List[str]:
+        """Get the rumour IDs between two ranks, without looking up records."""
+        return [key[3] for key in self._key_slice(start, len(self) if stop is None else stop)]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __getitem__(self, index: Union[int, slice]):  # type: ignore[override]
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return [self._lookup(key[3]) for key in self._key_slice(start, stop)]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ranking index out of range")
+        offsets = self._bucket_offsets()
+        bucket_index = bisect_right(offsets, index) - 1
+        return self._lookup(self._buckets[bucket_index][index - offsets[bucket_index]][3])
+
+    def _key_slice(self, start: int, stop: int) -> List[RankKey]:
+        """Collect the keys between two ranks, touching only the buckets involved."""
+        keys: List[RankKey] = []
+        if start >= stop:
+            return keys
+        offsets = self._bucket_offsets()
+        bucket_index = bisect_right(offsets, start) - 1
+        position = start - offsets[bucket_index]
+        while bucket_index < len(self._buckets) and len(keys) < stop - start:
+            bucket = self._buckets[bucket_index]
+            keys.extend(bucket[position : position + (stop - start - len(keys))])
+            bucket_index += 1
+            position = 0
+        return keys
+
+    def _bucket_offsets(self) -> List[int]:
+        """Starting rank of each bucket (rebuilt lazily after changes)."""
+        if self._offsets is None:
+            self._offsets = [0, *accumulate(len(bucket) for bucket in self._buckets)][:-1] or [0]
+        return self._offsets
+
+    def _insert(self, key: RankKey) -> None:
+        """Insert a key into the bucketed sorted list."""
+        self._offsets = None
+        if not self._buckets:
+            self._buckets.append([key])
+            self._maxes.append(key)
+            return
+        bucket_index = min(bisect_left(self._maxes, key), len(self._buckets) - 1)
+        bucket = self._buckets[bucket_index]
+        insort(bucket, key)
+        self._maxes[bucket_index] = bucket[-1]
+        # แบ่ง bucket ที่ใหญ่เกินไปออกเป็นสองส่วน
+        if len(bucket) > 2 * self.LOAD:
+            self._buckets.insert(bucket_index + 1, bucket[self.LOAD :])
+            del bucket[self.LOAD :]
+            self._maxes[bucket_index] = bucket[-1]
+            self._maxes.insert(bucket_index + 1, self._buckets[bucket_index + 1][-1])
+
+    def _remove(self, key: RankKey) -> None:
+        """Remove a key from the bucketed sorted list."""
+        self._offsets = None
+        bucket_index = bisect_left(self._maxes, key)
+        bucket = self._buckets[bucket_index]
+        del bucket[bisect_left(bucket, key)]
+        if bucket:
+            self._maxes[bucket_index] = bucket[-1]
+        else:
+            del self._buckets[bucket_index]
+            del self._maxes[bucket_index]
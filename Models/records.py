@@ -0,0 +1,236 @@
+"""Compact record classes used by the JSON models instead of plain dicts.
+
+Each record stores its fields in ``__slots__`` (no per-record key dict) and
+interns repeated strings such as status, source, report type and dates. The
+classes behave like read/write mappings (``get``, ``[]``, ``keys``, ``items``,
+``dict(record)``) so the controller and views keep working unchanged.
+"""
+from __future__ import annotations
+
+import sys
+from collections.abc import Mapping, Sequence
+from operator import attrgetter
+from typing import Any, Callable, Dict, FrozenSet, Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
+
+_MISSING = object()
+
+R = TypeVar("R")
+
+
+class Record(Mapping):
+    """Base class for slotted, dict-compatible records."""
+
+    __slots__ = ("_extra",)
+    FIELDS: Tuple[str, ...] = ()
+    INTERNED: FrozenSet[str] = frozenset()
+    _FIELD_SET: FrozenSet[str] = frozenset()
+    _ROW: Callable[["Record"], Tuple[Any, ...]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Precompute the field lookup set (and row getter) for each record type."""
+        super().__init_subclass__(**kwargs)
+        cls._FIELD_SET = frozenset(cls.FIELDS)
+        if cls.FIELDS:
+            cls._ROW = attrgetter(*cls.FIELDS)
+
+    def __init__(self, data: Optional[Mapping] = None, **fields: Any) -> None:
+        """Create a record from a mapping and/or keyword fields."""
+        self._extra: Optional[Dict[str, Any]] = None
+        if data:
+            for key, value in data.items():
+                self[key] = value
+        for key, value in fields.items():
+            self[key] = value
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Record":
+        """Build a record from a parsed JSON object (usable as ``object_hook``)."""
+        return cls(data)
+
+    def to_row(self) -> Tuple[Any, ...]:
+        """Field values in ``FIELDS`` order; fields that are not set are ``...`` (extra keys are left out)."""
+        try:
+            return self._ROW(self)
+        except AttributeError:
+            return tuple(getattr(self, key, ...) for key in self.FIELDS)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[Any, ...]]) -> List["Record"]:
+        """Rebuild records from ``to_row()`` tuples (``...`` values are kept as is)."""
+        records = []
+        for row in rows:
+            record = object.__new__(cls)
+            record._extra = None
+            for key, value in zip(cls.FIELDS, row):
+                object.__setattr__(record, key, value)
+            records.append(record)
+        return records
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the record back to a plain dict (for JSON output)."""
+        return dict(self.items())
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a field value, or ``default`` if it is not set."""
+        if key in self._FIELD_SET:
+            return getattr(self, key, default)
+        extra = self._extra
+        return extra.get(key, default) if extra else default
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in self._FIELD_SET:
+            if key in self.INTERNED and type(value) is str:
+                value = sys.intern(value)
+            object.__setattr__(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self.FIELDS:
+            if hasattr(self, key):
+                yield key
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key, _MISSING) is not _MISSING  # type: ignore[arg-type]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+class RumourRecord(Record):
+    """A single rumour."""
+
+    FIELDS = (
+        "rumourId",
+        "title",
+        "source",
+        "createdDate",
+        "credibilityScore",
+        "status",
+        "verified",
+        "verifiedBy",
+        "verifiedDate",
+    )
+    INTERNED = frozenset({"rumourId", "source", "createdDate", "status", "verifiedBy", "verifiedDate"})
+    __slots__ = FIELDS
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[Any, ...]]) -> List["RumourRecord"]:
+        """Rebuild records from ``to_row()`` tuples with one unpacking per row (same order as ``FIELDS``)."""
+        records = []
+        append = records.append
+        new = object.__new__
+        for row in rows:
+            record = new(cls)
+            record._extra = None
+            (
+                record.rumourId,
+                record.title,
+                record.source,
+                record.createdDate,
+                record.credibilityScore,
+                record.status,
+                record.verified,
+                record.verifiedBy,
+                record.verifiedDate,
+            ) = row
+            append(record)
+        return records
+
+
+class ReportRecord(Record):
+    """A single report."""
+
+    FIELDS = ("reportId", "reporterId", "rumourId", "reportDate", "reportType", "description")
+    INTERNED = frozenset({"reporterId", "rumourId", "reportDate", "reportType"})
+    __slots__ = FIELDS
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ReportRecord":
+        """Build a report from a parsed JSON object, normalizing ``reportDate`` (see ``normalize_report_date``)."""
+        if "reportDate" in data:
+            data["reportDate"] = normalize_report_date(data["reportDate"])
+        return cls(data)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[Any, ...]]) -> List["ReportRecord"]:
+        """Rebuild records from ``to_row()`` tuples with one unpacking per row (same order as ``FIELDS``)."""
+        records = []
+        append = records.append
+        new = object.__new__
+        for row in rows:
+            record = new(cls)
+            record._extra = None
+            (
+                record.reportId,
+                record.reporterId,
+                record.rumourId,
+                record.reportDate,
+                record.reportType,
+                record.description,
+            ) = row
+            append(record)
+        return records
+
+
+def normalize_report_date(value: Any) -> Any:
+    """A ``reportDate`` in ``YYYY-MM-DDTHH:MM:SS`` form; other values are returned unchanged.
+
+    Reports saved before the time was kept have only the date, which is
+    read as midnight, so every loaded report has the same format.
+    """
+    if type(value) is str and len(value) == 10:
+        return value + "T00:00:00"
+    return value
+
+
+def record_to_json(value: Any) -> Dict[str, Any]:
+    """``default`` hook for ``json.dump`` that serializes records."""
+    if isinstance(value, Record):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class RecordsView(Sequence, Generic[R]):
+    """Read-only, copy-free view of a model's record list.
+
+    Supports ``len``, indexing, slicing and iteration over the live list:
+    records added later show up in the view, and nothing is copied until
+    a slice is read. The records themselves are shared with the model, so
+    they must not be changed through the view (use the model's methods).
+    When a model reloads its file it starts a new list; views taken
+    before keep showing the old records.
+    """
+
+    __slots__ = ("_records",)
+
+    def __init__(self, records: List[R]) -> None:
+        """Wrap ``records`` without copying it."""
+        self._records = records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __getitem__(self, index: Union[int, slice]):  # type: ignore[override]
+        return self._records[index]
+
+    def __iter__(self) -> Iterator[R]:
+        return iter(self._records)
+
+    def __reversed__(self) -> Iterator[R]:
+        return reversed(self._records)
@@ -1,75 +1,558 @@
 from __future__ import annotations
 
 import json
-from datetime import date
+import os
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Set, TextIO, Tuple
+
+import metrics
+from business_rules import PANIC_WINDOW_SECONDS
+
+from .events import RELOADED, REPORT_ADDED, ChangeFeed
+from .id_allocator import DEFAULT_BLOCK, IdAllocator, id_number
+from .records import RecordsView, ReportRecord, normalize_report_date, record_to_json
+from .report_windows import ReportWindows
+from .snapshot_cache import load_records, store_records
+from .storage import FileLock, FileStamp, atomic_write_json, file_stamp, gc_paused, iter_json_array
+
+
+def _decode_journal(data: bytes, object_hook: Optional[Callable[[Dict], object]] = None) -> List:
+    """Reports in complete journal lines, skipping damaged ones."""
+    reports = []
+    for line in data.decode("utf-8").splitlines():
+        if not line.strip():
+            continue
+        try:
+            reports.append(json.loads(line, object_hook=object_hook))
+        except json.JSONDecodeError:
+            # บรรทัดเสียจากโปรแกรมที่หยุดกลางคัน
+            continue
+    return reports
+
+
+def _normalized(report: Dict) -> Dict:
+    """A plain report dict with ``reportDate`` normalized (``object_hook`` for streaming)."""
+    if "reportDate" in report:
+        report["reportDate"] = normalize_report_date(report["reportDate"])
+    return report
 
 
 class ReportModel:
     """Model for managing report data."""
 
-    def __init__(self, data_path: Path) -> None:
-        """Initialize the report model with data file path."""
+    def __init__(
+        self,
+        data_path: Path,
+        journal: bool = False,
+        fsync: bool = False,
+        compact_bytes: int = 0,
+        write_behind: bool = False,
+        windows: Sequence[float] = PANIC_WINDOW_SECONDS,
+        snapshot_cache: bool = False,
+        id_block: int = DEFAULT_BLOCK,
+    ) -> None:
+        """Initialize the report model with data file path.
+
+        When ``journal`` is enabled each new report is appended as one JSON line
+        to ``<name>.journal.jsonl`` instead of rewriting the whole snapshot.
+        ``fsync`` forces every appended line to disk, and ``compact_bytes``
+        (if > 0) folds the journal back into the snapshot once it grows that big.
+
+        Several processes may share the same files: every write (or whole
+        ``batch()``) holds an advisory file lock, merges the reports written by
+        the others, then allocates IDs and appends, so no update is lost.
+
+        With ``write_behind`` new reports stay in memory until ``flush()`` or a
+        background write (``begin_flush()`` / ``end_flush()``).
+
+        Recent reports are also counted per rumour over the sliding time
+        ``windows`` (seconds) used for panic detection, see
+        ``get_recent_report_counts()``.
+
+        With ``snapshot_cache`` an unchanged snapshot is read from its binary
+        cache instead of being parsed (see ``Models.snapshot_cache``); the
+        journal is replayed on top as usual.
+
+        New report IDs come from blocks of ``id_block`` numbers reserved in
+        ``<name>.ids`` (see ``IdAllocator``), so they never collide between
+        processes.
+
+        Every new report, local or from another process, is announced on
+        ``changes`` (see ``Models.events``); a full reload is announced once.
+        """
         self._data_path = data_path
-        self._reports: List[Dict] = []
-        self._load()
+        self._snapshot_cache = snapshot_cache
+        # stamp ของ snapshot ที่ cache ปัจจุบันสร้างจาก และการโหลดล่าสุดมาจาก cache หรือไม่
+        self._cached_stamp: Optional[FileStamp] = None
+        self.loaded_from_cache = False
+        self._journal_path = data_path.with_suffix(".journal.jsonl")
+        self._journal_enabled = journal
+        self._journal_fsync = fsync
+        self._journal_compact_bytes = compact_bytes
+        self._write_behind = write_behind
+        # True ระหว่างที่ thread เบื้องหลังกำลังเขียนไฟล์ (ถือ file lock ไว้)
+        self._writing = False
+        self._flushing: List[ReportRecord] = []
+        self._lock = FileLock(data_path)
+        # stamp ของ snapshot ที่โหลดไว้ และตำแหน่งใน journal ที่อ่านถึงแล้ว
+        self._snapshot_stamp: Optional[FileStamp] = None
+        self._journal_offset = 0
+        self._batch_depth = 0
+        # รายงานใหม่ที่ยังไม่ได้เขียนลงไฟล์ (รอจบ batch)
+        self._unsaved: List[ReportRecord] = []
+        # rumourId ที่จำนวนรายงานเปลี่ยนเพราะ process อื่น (รอส่งให้ refresh())
+        self._external_changes: Dict[str, None] = {}
+        self._reports: List[ReportRecord] = []
+        # ดัชนีคู่ (reporterId, rumourId) สำหรับตรวจรายงานซ้ำแบบ O(1)
+        self._reported: Set[Tuple[str, str]] = set()
+        # ตัวนับจำนวนรายงานต่อข่าวลือ ปรับทีละ 1 เมื่อมีรายงานใหม่
+        self._counts: Dict[str, int] = {}
+        # จำนวนรายงานล่าสุดของแต่ละข่าวลือในหน้าต่างเวลา (ring buffer ต่อข่าวลือ)
+        self._windows = ReportWindows(windows)
+        self._ids = IdAllocator(data_path, self._highest_id, id_block)
+        # ผู้รับแจ้งการเปลี่ยนแปลง (เช่น view ที่แก้เฉพาะแถวที่เปลี่ยน)
+        self.changes = ChangeFeed()
+        with self._lock.hold(shared=True):
+            self._load(store_cache=snapshot_cache)
+
+    @metrics.timed("model_load", model="reports")
+    def _load(self, store_cache: bool = False) -> None:
+        """Load reports from the JSON snapshot (or its cache), then replay the journal on top."""
+        with gc_paused():
+            self._snapshot_stamp = file_stamp(self._data_path)
+            self.loaded_from_cache = False
+            cached = None
+            if self._snapshot_cache:
+                cached = load_records(self._data_path, self._snapshot_stamp, ReportRecord)
+            if cached is not None:
+                self._reports = cached
+                self._cached_stamp = self._snapshot_stamp
+                self.loaded_from_cache = True
+            elif self._snapshot_stamp is None:
+                self._reports = []
+            else:
+                with self._data_path.open("r", encoding="utf-8") as handle:
+                    # แปลงแต่ละ object เป็น ReportRecord ระหว่าง parse เพื่อประหยัดหน่วยความจำ
+                    self._reports = json.load(handle, object_hook=ReportRecord.from_dict)
+                # cache เก็บเฉพาะ snapshot (ก่อนเล่น journal) จึงตรงกับไฟล์เสมอ
+                if store_cache and store_records(self._data_path, self._snapshot_stamp, self._reports):
+                    self._cached_stamp = self._snapshot_stamp
+            self._rebuild_index()
+        self._journal_offset = 0
+        # รายงานที่อยู่ใน snapshot แล้ว (กรณี compact ค้างกลางทาง) จะไม่ถูกเพิ่มซ้ำ
+        for report in self._read_journal():
+            if (report.get("reporterId"), report.get("rumourId")) not in self._reported:
+                self._append(report)
 
-    def _load(self) -> None:
-        """Load reports from JSON file."""
-        if not self._data_path.exists():
-            self._reports = []
+    def _read_journal(self) -> List[ReportRecord]:
+        """Read the complete journal lines after the current offset and advance it."""
+        try:
+            with self._journal_path.open("rb") as handle:
+                handle.seek(self._journal_offset)
+                data = handle.read()
+        except FileNotFoundError:
+            return []
+        # ใช้เฉพาะบรรทัดที่เขียนครบแล้ว บรรทัดท้ายที่ยังเขียนไม่เสร็จจะอ่านในรอบถัดไป
+        end = data.rfind(b"\n") + 1
+        self._journal_offset += end
+        return _decode_journal(data[:end], ReportRecord.from_dict)
+
+    def _rebuild_index(self) -> None:
+        """Rebuild the (reporterId, rumourId) index, report counters and time windows from the loaded reports."""
+        # ปรับ dict เดิมแทนการสร้างใหม่ เพื่อให้ view ที่ได้จาก get_report_counts() ยังใช้ได้
+        self._reported.clear()
+        self._counts.clear()
+        self._windows.clear()
+        self._ids.invalidate()
+        reports = self._reports
+        try:
+            # ทางลัดเมื่อทุกรายงานมีครบทุก field: อ่าน attribute ตรง ๆ แทน get() ทีละรายการ
+            self._reported.update(map(attrgetter("reporterId", "rumourId"), reports))
+            self._counts.update(Counter(map(attrgetter("rumourId"), reports)))
+            self._windows.add_reports(map(attrgetter("rumourId", "reportDate"), reports))
+            return
+        except AttributeError:
+            self._reported.clear()
+            self._counts.clear()
+            self._windows.clear()
+        add_recent = self._windows.add_report
+        for report in reports:
+            rumour_id = report.get("rumourId")
+            self._reported.add((report.get("reporterId"), rumour_id))
+            self._counts[rumour_id] = self._counts.get(rumour_id, 0) + 1
+            add_recent(rumour_id, report.get("reportDate"))
+
+    def _sync_locked(self) -> None:
+        """Merge reports written by other processes (the caller holds the file lock).
+
+        Unchanged files cost two ``stat`` calls. New journal lines are read
+        from the last offset; only a replaced snapshot (another process
+        saved or compacted) forces a full reload.
+        """
+        if self._writing:
+            # ไฟล์กำลังถูกเขียนโดยเราเอง และไม่มี process อื่นเขียนได้ระหว่างนี้
             return
-        with self._data_path.open("r", encoding="utf-8") as handle:
-            self._reports = json.load(handle)
+        journal = file_stamp(self._journal_path)
+        journal_size = journal[2] if journal else 0
+        if file_stamp(self._data_path) != self._snapshot_stamp or journal_size < self._journal_offset:
+            self._reload_all()
+        elif journal_size > self._journal_offset:
+            self._merge_external(self._read_journal())
+
+    def _merge_external(self, reports: List[ReportRecord]) -> None:
+        """Add reports written by other processes and move unsaved reports out of their way."""
+        unsaved_pairs = {(report["reporterId"], report["rumourId"]): report for report in self._unsaved}
+        external_ids: Set[str] = set()
+        for report in reports:
+            pair = (report.get("reporterId"), report.get("rumourId"))
+            if pair in self._reported:
+                # รายงานเดียวกันที่ยังไม่ได้บันทึก (write-behind) ถูกบันทึกโดย process อื่นแล้ว: ใช้ของเขา
+                mine = unsaved_pairs.pop(pair, None)
+                if mine is not None:
+                    self._unsaved.remove(mine)
+                    mine["reportId"] = report.get("reportId")
+                continue
+            self._append(report)
+            external_ids.add(report.get("reportId"))
+            self._external_changes[report.get("rumourId")] = None
+            self.changes.publish(REPORT_ADDED, report.get("rumourId"))
+        # รายงานที่ยังไม่บันทึกซึ่ง ID ชนกับของ process อื่นจะได้ ID ใหม่
+        for mine in self._unsaved:
+            if mine["reportId"] in external_ids:
+                mine["reportId"] = self._next_id()
+
+    def _reload_all(self) -> None:
+        """Reload snapshot and journal from disk, re-apply unsaved reports and note which counts changed."""
+        old_counts = dict(self._counts)
+        unsaved, self._unsaved = self._unsaved, []
+        self._load()
+        known_ids = {report.get("reportId") for report in self._reports}
+        for report in unsaved:
+            if (report["reporterId"], report["rumourId"]) in self._reported:
+                continue
+            if report["reportId"] in known_ids:
+                report["reportId"] = self._next_id()
+            self._append(report)
+            self._unsaved.append(report)
+        for rumour_id in old_counts.keys() | self._counts.keys():
+            if old_counts.get(rumour_id) != self._counts.get(rumour_id):
+                self._external_changes[rumour_id] = None
+        self.changes.publish(RELOADED)
 
+    def refresh(self) -> List[str]:
+        """Pick up reports written by other processes.
+
+        Returns the IDs of rumours whose report count changed since the last
+        call (including changes merged during a save). Never waits for
+        another process's lock; a busy file is checked again next call.
+        """
+        # ไม่รอ lock: ถ้า process อื่นกำลังเขียนอยู่ จะตรวจใหม่ในรอบถัดไป
+        if self._lock.acquire(shared=True, blocking=False):
+            try:
+                self._sync_locked()
+            finally:
+                self._lock.release()
+        changed, self._external_changes = list(self._external_changes), {}
+        return changed
+
+    @metrics.timed("model_save", model="reports")
     def save(self) -> None:
-        """Save reports to JSON file."""
-        with self._data_path.open("w", encoding="utf-8") as handle:
-            json.dump(self._reports, handle, ensure_ascii=False, indent=2)
+        """Save all reports to the JSON snapshot and clear the journal."""
+        with self._lock.hold():
+            self._sync_locked()
+            atomic_write_json(self._data_path, self._reports, default=record_to_json)
+            # snapshot มีรายงานครบแล้ว จึงล้าง journal ได้
+            if self._journal_offset or self._journal_path.exists():
+                self._journal_path.open("w", encoding="utf-8").close()
+            self._journal_offset = 0
+            self._snapshot_stamp = file_stamp(self._data_path)
+            self._unsaved = []
+
+    def write_cache(self) -> bool:
+        """Refresh the snapshot cache from memory (e.g. at shutdown); return whether it was written.
+
+        Only done when every report is saved, the journal is empty and the
+        snapshot is still the one last read or written here, so the cache
+        matches the snapshot exactly.
+        """
+        if (
+            not self._snapshot_cache
+            or self._unsaved
+            or self._writing
+            or self._journal_offset
+            or self._snapshot_stamp == self._cached_stamp
+        ):
+            return False
+        with self._lock.hold(shared=True):
+            journal = file_stamp(self._journal_path)
+            if file_stamp(self._data_path) != self._snapshot_stamp or (journal and journal[2]):
+                return False
+            if not store_records(self._data_path, self._snapshot_stamp, self._reports):
+                return False
+        self._cached_stamp = self._snapshot_stamp
+        return True
+
+    def compact(self) -> None:
+        """Fold the journal back into the JSON snapshot."""
+        self.save()
+
+    def flush(self) -> None:
+        """Write reports still held in memory (write-behind mode)."""
+        if self._unsaved and not self._writing:
+            with self._lock.hold():
+                self._sync_locked()
+                self._persist()
 
-    def get_all(self) -> List[Dict]:
-        """Get all reports."""
+    @property
+    def is_dirty(self) -> bool:
+        """Whether there are reports not yet written to disk."""
+        return bool(self._unsaved)
+
+    def begin_flush(self) -> Optional[Callable[[], Tuple[Optional[FileStamp], int]]]:
+        """Start writing unsaved reports off the calling thread.
+
+        Takes the file lock without waiting, merges other processes' reports
+        and encodes the new journal lines (or captures the list when the
+        snapshot has to be rewritten). Returns None if there is nothing to
+        write, a write is already running or another process holds the lock.
+        The returned callable does the disk I/O on any thread; pass its
+        result (None if it raised) to ``end_flush()`` on this thread.
+        """
+        if not self._unsaved or self._writing or not self._lock.acquire(blocking=False):
+            return None
+        try:
+            self._sync_locked()
+        except BaseException:
+            self._lock.release()
+            raise
+        if not self._unsaved:
+            self._lock.release()
+            return None
+        self._flushing, self._unsaved = self._unsaved, []
+        self._writing = True
+        data_path, journal_path, fsync = self._data_path, self._journal_path, self._journal_fsync
+        compact = not self._journal_enabled or (
+            self._journal_compact_bytes and self._journal_offset >= self._journal_compact_bytes
+        )
+        if compact:
+            reports = list(self._reports)
+
+            def write() -> Tuple[Optional[FileStamp], int]:
+                atomic_write_json(data_path, reports, default=record_to_json)
+                journal_path.open("w", encoding="utf-8").close()
+                return file_stamp(data_path), 0
+
+            return write
+
+        data = self._journal_lines(self._flushing)
+        stamp, offset = self._snapshot_stamp, self._journal_offset
+
+        def write() -> Tuple[Optional[FileStamp], int]:
+            self._write_journal(journal_path, data, fsync)
+            return stamp, offset + len(data)
+
+        return write
+
+    def end_flush(self, result: Optional[Tuple[Optional[FileStamp], int]]) -> None:
+        """Finish a write started by ``begin_flush()``; ``None`` means it failed and stays pending."""
+        self._writing = False
+        if result is None:
+            self._unsaved[:0] = self._flushing
+        else:
+            self._snapshot_stamp, self._journal_offset = result
+        self._flushing = []
+        self._lock.release()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group several new reports into a single write at the end of the block.
+
+        Unless in write-behind mode, the file lock is held for the whole block,
+        so reports from other processes are merged first and new report IDs
+        cannot collide.
+        """
+        # write-behind เพิ่มในหน่วยความจำเท่านั้น lock จะถูกถือเมื่อ flush
+        with nullcontext() if self._write_behind else self._lock.hold():
+            if self._batch_depth == 0 and not self._write_behind:
+                # รวมรายงานจาก process อื่นก่อน เพื่อไม่ให้เขียนทับกัน
+                self._sync_locked()
+            self._batch_depth += 1
+            try:
+                yield
+            finally:
+                self._batch_depth -= 1
+                if self._batch_depth == 0 and self._unsaved and not self._write_behind:
+                    self._persist()
+
+    def _persist(self) -> None:
+        """Write unsaved reports to the journal or the full snapshot (the caller holds the lock)."""
+        if self._journal_enabled:
+            self._append_journal()
+        else:
+            self.save()
+
+    @metrics.timed("model_save", model="reports.journal")
+    def _append_journal(self) -> None:
+        """Append unsaved reports to the journal file, one JSON line each."""
+        data = self._journal_lines(self._unsaved)
+        self._write_journal(self._journal_path, data, self._journal_fsync)
+        self._journal_offset += len(data)
+        self._unsaved = []
+        if self._journal_compact_bytes and self._journal_offset >= self._journal_compact_bytes:
+            self.compact()
+
+    @staticmethod
+    def _journal_lines(reports: List[ReportRecord]) -> bytes:
+        """Encode reports as journal lines."""
+        return "".join(
+            json.dumps(report, ensure_ascii=False, default=record_to_json) + "\n" for report in reports
+        ).encode("utf-8")
+
+    @staticmethod
+    def _write_journal(path: Path, data: bytes, fsync: bool) -> None:
+        """Append encoded lines to the journal in a single write."""
+        with metrics.timer("file_write", file=path.name):
+            with path.open("ab") as handle:
+                handle.write(data)
+                if fsync:
+                    handle.flush()
+                    os.fsync(handle.fileno())
+        metrics.inc("bytes_written", len(data), file=path.name)
+
+    def get_all(self) -> List[ReportRecord]:
+        """Get all reports (a new list; see ``view_all()`` to read without copying)."""
         return list(self._reports)
 
-    def get_report_counts(self) -> Dict[str, int]:
-        """Get report counts for each rumour."""
-        # นับจำนวนรายงานสำหรับแต่ละข่าวลือ
-        counts: Dict[str, int] = {}
-        for report in self._reports:
-            rumour_id = report.get("rumourId")
-            counts[rumour_id] = counts.get(rumour_id, 0) + 1
-        return counts
+    def view_all(self) -> Sequence[ReportRecord]:
+        """All reports in load order as a read-only view (no copy is made)."""
+        return RecordsView(self._reports)
+
+    def iter_where(self, predicate: Callable[[ReportRecord], bool]) -> Iterator[ReportRecord]:
+        """Reports for which ``predicate`` is true, yielded one at a time in load order."""
+        return filter(predicate, self._reports)
+
+    @staticmethod
+    def stream(data_path: Path) -> Iterator[Dict]:
+        """Every report saved in ``data_path`` and its journal, as plain dicts read one at a time.
+
+        Unlike loading a ``ReportModel`` this keeps only the journal (which
+        compaction keeps small) in memory, so it suits exports of any size.
+        Reports are yielded in the order a loaded model would hold them,
+        with ``reportDate`` normalized as on load; ones saved by another
+        process after the stream starts may be missed.
+        """
+        journal_path = data_path.with_suffix(".journal.jsonl")
+        # อ่าน journal แล้วเปิด snapshot ภายใต้ lock: ถ้ามีการ compact ระหว่างนั้น รายงานใน journal
+        # จะอยู่ใน snapshot ใหม่ด้วย และถูกตัดซ้ำด้านล่าง (ไฟล์ที่เปิดแล้วยังอ่านได้แม้ถูกแทนที่)
+        with FileLock(data_path).hold(shared=True):
+            try:
+                data = journal_path.read_bytes()
+            except FileNotFoundError:
+                data = b""
+            try:
+                handle: Optional[TextIO] = data_path.open("r", encoding="utf-8")
+            except FileNotFoundError:
+                handle = None
+        pending: Dict[Tuple[str, str], Dict] = {}
+        for report in _decode_journal(data[: data.rfind(b"\n") + 1], _normalized):
+            pending.setdefault((report.get("reporterId"), report.get("rumourId")), report)
+        if handle is not None:
+            with handle:
+                for report in iter_json_array(handle, _normalized):
+                    pending.pop((report.get("reporterId"), report.get("rumourId")), None)
+                    yield report
+        yield from pending.values()
+
+    def get_report_counts(self) -> Mapping[str, int]:
+        """Get report counts for each rumour (read-only, always up to date)."""
+        # คืนค่า view แบบอ่านอย่างเดียวของตัวนับ ไม่ต้องนับใหม่ทุกครั้ง
+        return MappingProxyType(self._counts)
+
+    def get_report_count(self, rumour_id: str) -> int:
+        """Get the number of reports for a single rumour."""
+        return self._counts.get(rumour_id, 0)
+
+    def get_recent_report_counts(self, rumour_id: str) -> Tuple[int, ...]:
+        """Get the rumour's reports in each sliding time window (in the order of ``windows``)."""
+        return self._windows.counts(rumour_id)
+
+    def prune_recent(self) -> int:
+        """Free the time windows of rumours with no recent reports; return how many were freed."""
+        return self._windows.prune()
 
     def has_report(self, reporter_id: str, rumour_id: str) -> bool:
         """Check if a user has already reported a specific rumour."""
         # ตรวจสอบว่า user คนนี้เคยรายงานข่าวลือนี้หรือไม่
-        for report in self._reports:
-            if report.get("reporterId") == reporter_id and report.get("rumourId") == rumour_id:
-                return True
-        return False
+        return (reporter_id, rumour_id) in self._reported
 
-    def add_report(self, reporter_id: str, rumour_id: str, report_type: str, description: str) -> Dict:
+    def add_report(self, reporter_id: str, rumour_id: str, report_type: str, description: str) -> ReportRecord:
         """Add a new report."""
-        # สร้างรายงานใหม่พร้อมรายละเอียด
-        new_report = {
-            "reportId": self._next_id(),          # สร้าง ID อัตโนมัติ
-            "reporterId": reporter_id,            # ID ของผู้รายงาน
-            "rumourId": rumour_id,                # ID ของข่าวลือ
-            "reportDate": date.today().isoformat(),
-            "reportType": report_type,            # ประเภทรายงาน
-            "description": description,           # รายละเอียดเพิ่มเติม
-        }
-        self._reports.append(new_report)
-        self.save()
+        with self.batch():
+            # สร้างรายงานใหม่พร้อมรายละเอียด
+            new_report = ReportRecord(
+                reportId=self._next_id(),          # สร้าง ID อัตโนมัติ
+                reporterId=reporter_id,            # ID ของผู้รายงาน
+                rumourId=rumour_id,                # ID ของข่าวลือ
+                reportDate=datetime.now().isoformat(timespec="seconds"),
+                reportType=report_type,            # ประเภทรายงาน
+                description=description,           # รายละเอียดเพิ่มเติม
+            )
+            self._append(new_report)
+            self._unsaved.append(new_report)
+            self.changes.publish(REPORT_ADDED, rumour_id)
         return new_report
 
+    def add_reports(self, records: List[Dict]) -> List[ReportRecord]:
+        """Add many reports at once, assigning them a contiguous block of IDs.
+
+        Each record needs ``reporterId``, ``rumourId`` and ``reportType`` and may
+        set ``reportDate`` and ``description``; the model is persisted once.
+        """
+        with self.batch():
+            # จอง ID ต่อเนื่องกันทั้งชุดครั้งเดียว
+            first_id = self._ids.allocate(len(records))
+            added: List[ReportRecord] = []
+            for offset, record in enumerate(records):
+                new_report = ReportRecord(
+                    reportId=f"R{first_id + offset:04d}",
+                    reporterId=record["reporterId"],
+                    rumourId=record["rumourId"],
+                    reportDate=normalize_report_date(record.get("reportDate"))
+                    or datetime.now().isoformat(timespec="seconds"),
+                    reportType=record["reportType"],
+                    description=record.get("description", ""),
+                )
+                self._append(new_report)
+                added.append(new_report)
+            self._unsaved.extend(added)
+            for report in added:
+                self.changes.publish(REPORT_ADDED, report["rumourId"])
+        return added
+
+    def _append(self, report: ReportRecord) -> None:
+        """Append a report to the list, the duplicate index, the counters and the time windows."""
+        rumour_id = report["rumourId"]
+        self._reports.append(report)
+        self._reported.add((report["reporterId"], rumour_id))
+        self._counts[rumour_id] = self._counts.get(rumour_id, 0) + 1
+        self._windows.add_report(rumour_id, report.get("reportDate"))
+        self._ids.observe(id_number(report.get("reportId"), "R"))
+
     def _next_id(self) -> str:
-        """Generate the next report ID."""
-        # หา ID ที่ใหญ่ที่สุด แล้วสร้าง ID ถัดไป เช่น R0001, R0002, ...
-        max_id = 0
+        """Generate the next report ID, e.g. R0001, R0002, ... (more digits past R9999)."""
+        return f"R{self._ids.allocate():04d}"
+
+    def _highest_id(self) -> int:
+        """Highest report ID number in memory (0 if none)."""
+        # ไล่หาครั้งเดียวเมื่อสร้าง ID ครั้งแรก หลังจากนั้น IdAllocator จำค่าไว้
+        highest = 0
         for report in self._reports:
-            report_id = report.get("reportId", "")
-            if report_id.startswith("R") and report_id[1:].isdigit():
-                max_id = max(max_id, int(report_id[1:]))
-        return f"R{max_id + 1:04d}"
+            number = id_number(report.get("reportId"), "R")
+            if number is not None and number > highest:
+                highest = number
+        return highest
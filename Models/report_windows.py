@@ -0,0 +1,141 @@
+"""Per-rumour report counts over sliding time windows (ring buffers of time buckets)."""
+from __future__ import annotations
+
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+BUCKETS_PER_WINDOW = 12  # หน้าต่าง 1 ชั่วโมง = ช่องละ 5 นาที
+
+
+def report_time(value: Optional[str]) -> Optional[float]:
+    """Epoch seconds of a ``reportDate`` (``YYYY-MM-DD`` means local midnight); None if unparsable."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return None
+
+
+class SlidingCount:
+    """Number of events in the last ``window`` seconds, kept in a ring of time buckets.
+
+    Each bucket covers ``window / buckets`` seconds; moving to a newer
+    bucket clears the buckets it passes, so adding an event or reading the
+    count costs at most ``buckets`` steps no matter how many events were
+    seen. The window is approximated to bucket boundaries.
+    """
+
+    __slots__ = ("width", "counts", "head", "total")
+
+    def __init__(self, window: float, buckets: int = BUCKETS_PER_WINDOW) -> None:
+        """Create an empty counter."""
+        self.width = window / buckets
+        self.counts = [0] * buckets
+        self.head = 0  # เลขช่องเวลาล่าสุดที่ ring ครอบคลุม
+        self.total = 0
+
+    def _advance(self, slot: int) -> None:
+        """Move the ring forward to ``slot``, clearing the buckets that fell out of the window."""
+        if slot <= self.head:
+            return
+        size = len(self.counts)
+        if slot - self.head >= size:
+            self.counts = [0] * size
+            self.total = 0
+        else:
+            for passed in range(self.head + 1, slot + 1):
+                self.total -= self.counts[passed % size]
+                self.counts[passed % size] = 0
+        self.head = slot
+
+    def add(self, timestamp: float, amount: int = 1) -> None:
+        """Count an event at ``timestamp`` (events older than the window are ignored)."""
+        slot = int(timestamp // self.width)
+        self._advance(slot)
+        if slot > self.head - len(self.counts):
+            self.counts[slot % len(self.counts)] += amount
+            self.total += amount
+
+    def count(self, now: float) -> int:
+        """Number of events in the window ending at ``now``."""
+        self._advance(int(now // self.width))
+        return self.total
+
+
+class ReportWindows:
+    """Report counts of every rumour over several sliding windows at once.
+
+    Only rumours reported within the longest window hold a ring buffer;
+    ``prune()`` drops the ones that went quiet.
+    """
+
+    def __init__(self, windows: Sequence[float], clock: Callable[[], float] = time.time) -> None:
+        """Track the given window lengths (seconds); ``clock`` returns the current time."""
+        self.windows = tuple(windows)
+        self._clock = clock
+        self._horizon = max(self.windows, default=0)
+        self._rumours: Dict[str, List[SlidingCount]] = {}
+        # ค่า reportDate ที่เก่ากว่านี้ไม่อยู่ในหน้าต่างใดแล้ว (เทียบข้อความได้โดยไม่ต้องแปลงเวลา)
+        self._cutoff_text = ""
+        self._cutoff_at = float("-inf")
+
+    def clear(self) -> None:
+        """Forget all counts."""
+        self._rumours.clear()
+
+    def add(self, rumour_id: str, timestamp: Optional[float]) -> None:
+        """Count one report of ``rumour_id`` made at ``timestamp``."""
+        if timestamp is None or timestamp < self._clock() - self._horizon:
+            return
+        counters = self._rumours.get(rumour_id)
+        if counters is None:
+            counters = self._rumours[rumour_id] = [SlidingCount(window) for window in self.windows]
+        for counter in counters:
+            counter.add(timestamp)
+
+    def add_report(self, rumour_id: str, report_date: Optional[str]) -> None:
+        """Count one report from its ``reportDate`` text, skipping old ones without parsing them."""
+        if not report_date or report_date < self._cutoff():
+            return
+        self.add(rumour_id, report_time(report_date))
+
+    def add_reports(self, reports: Iterable[Tuple[str, Optional[str]]]) -> None:
+        """Count many (rumourId, reportDate) pairs, e.g. every report when loading."""
+        cutoff = self._cutoff()
+        for rumour_id, report_date in reports:
+            if report_date and report_date >= cutoff:
+                self.add(rumour_id, report_time(report_date))
+
+    def _cutoff(self) -> str:
+        """ISO text of the oldest time still inside the longest window (refreshed once a minute)."""
+        now = self._clock()
+        if now - self._cutoff_at > 60:
+            self._cutoff_at = now
+            # วันที่ของขอบหน้าต่าง (ค่าแบบวันที่อย่างเดียวของวันนั้นยังต้องแปลงเพื่อเทียบเวลา)
+            self._cutoff_text = datetime.fromtimestamp(now - self._horizon - 60).date().isoformat()
+        return self._cutoff_text
+
+    def counts(self, rumour_id: str, now: Optional[float] = None) -> Tuple[int, ...]:
+        """Reports of ``rumour_id`` in each window, in the order given to the constructor."""
+        counters = self._rumours.get(rumour_id)
+        if counters is None:
+            return (0,) * len(self.windows)
+        now = self._clock() if now is None else now
+        return tuple(counter.count(now) for counter in counters)
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Drop rumours with no report left in any window; return how many were dropped."""
+        now = self._clock() if now is None else now
+        quiet = [
+            rumour_id
+            for rumour_id, counters in self._rumours.items()
+            if not any(counter.count(now) for counter in counters)
+        ]
+        for rumour_id in quiet:
+            del self._rumours[rumour_id]
+        return len(quiet)
+
+    def __len__(self) -> int:
+        return len(self._rumours)
@@ -1,71 +1,634 @@
 ﻿from __future__ import annotations
 
 import json
+from contextlib import contextmanager, nullcontext
 from datetime import date
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
 
-from business_rules import STATUS_NORMAL, STATUS_PANIC
+import metrics
+from business_rules import STATUS_NORMAL, STATUS_PANIC, SUMMARY_BUCKETS, get_summary_buckets
+
+from .events import RUMOUR_ADDED, RUMOUR_CHANGED, RUMOUR_VERIFIED, STATUS_CHANGED, ChangeFeed
+from .id_allocator import DEFAULT_BLOCK, IdAllocator, id_number
+from .query_index import ANY, FieldValues, QueryIndex, RumourQuery, field_values
+from .records import RecordsView, RumourRecord, record_to_json
+from .search_index import SearchIndex, SearchResults
+from .snapshot_cache import load_records, store_records
+from .storage import FileLock, FileStamp, atomic_write_json, file_stamp, gc_paused
+
+
+def _as_stamp(value: Any) -> Optional[FileStamp]:
+    """A file stamp read back from the update log (JSON turns the tuple into a list)."""
+    return tuple(value) if value else None
 
 
 class RumourModel:
     """Model for managing rumour data."""
 
-    def __init__(self, data_path: Path) -> None:
-        """Initialize the rumour model with data file path."""
+    MAX_CHANGE_LOG = 10000  # จำนวนการเปลี่ยนแปลงหมวดสรุปที่เก็บไว้ให้ view ดึงแบบ delta
+    MAX_UPDATE_LOG_BYTES = 4 * 1024 * 1024  # ขนาด update log ที่จะเริ่มไฟล์ใหม่ (process ที่ตามไม่ทันจะอ่านทั้งไฟล์)
+
+    def __init__(
+        self,
+        data_path: Path,
+        write_behind: bool = False,
+        snapshot_cache: bool = False,
+        id_block: int = DEFAULT_BLOCK,
+    ) -> None:
+        """Initialize the rumour model with data file path.
+
+        With ``write_behind`` enabled, mutations only mark the model dirty and
+        the caller is responsible for calling ``flush()`` (periodically and at
+        shutdown) to write all pending changes in one save, or hand the disk
+        work to a background thread with ``begin_flush()`` / ``end_flush()``.
+
+        Several processes may share the same file: saves hold an advisory file
+        lock, and if the file changed since it was read the other process's
+        changes are merged first (fields changed here since the last save win).
+        Every save also appends the rumours it changed to ``<name>.updates.jsonl``,
+        so the others merge just those instead of parsing the whole file; a
+        file saved without a matching log entry is parsed in full.
+
+        With ``snapshot_cache`` an unchanged file is read from its binary
+        cache instead of being parsed (see ``Models.snapshot_cache``); the
+        cache is written after parsing and refreshed by ``write_cache()``.
+
+        New rumour IDs come from blocks of ``id_block`` numbers reserved in
+        ``<name>.ids`` (see ``IdAllocator``), so they never collide between
+        processes.
+
+        Every change, local or merged from another process, is announced on
+        ``changes`` (see ``Models.events``).
+        """
         self._data_path = data_path
-        self._rumours: List[Dict] = []
-        self._load()
+        self._write_behind = write_behind
+        self._snapshot_cache = snapshot_cache
+        # stamp ของไฟล์ที่ cache ปัจจุบันสร้างจาก และการโหลดล่าสุดมาจาก cache หรือไม่
+        self._cached_stamp: Optional[FileStamp] = None
+        self.loaded_from_cache = False
+        self._dirty = False
+        self._batch_depth = 0
+        # True ระหว่างที่ thread เบื้องหลังกำลังเขียนไฟล์ (ถือ file lock ไว้)
+        self._writing = False
+        # การแก้ไขที่กำลังถูกเขียน (คืนกลับถ้าการเขียนล้มเหลว)
+        self._flushing_local: Tuple[Dict[str, Set[str]], Dict[str, None]] = ({}, {})
+        self._lock = FileLock(data_path)
+        self._stamp: Optional[FileStamp] = None
+        # update log: ข่าวลือที่แต่ละการบันทึกเปลี่ยน และตำแหน่งที่อ่านถึงแล้ว (ตรงกับ _stamp)
+        self._updates_path = data_path.with_suffix(".updates.jsonl")
+        self._updates_offset = 0
+        # การแก้ไขที่ยังไม่ได้บันทึก: rumourId -> ชื่อ field ที่แก้ และข่าวลือที่สร้างใหม่
+        self._local_fields: Dict[str, Set[str]] = {}
+        self._local_new: Dict[str, None] = {}
+        # rumourId ที่เปลี่ยนเพราะ process อื่น (รอส่งให้ refresh())
+        self._external_changes: Dict[str, None] = {}
+        self._rumours: List[RumourRecord] = []
+        # ดัชนี rumourId -> ข่าวลือ สำหรับค้นหาแบบ O(1)
+        self._index: Dict[str, RumourRecord] = {}
+        # หมวดหมู่หน้าสรุป (panic / verified_true / verified_false) -> rumourId ตามลำดับ
+        self._buckets: Dict[str, Dict[str, None]] = {}
+        # บันทึกการย้ายหมวด (bucket, "add"/"remove", rumourId) นับ version ต่อเนื่อง
+        self._change_log: List[Tuple[str, str, str]] = []
+        self._log_base_version = 0
+        # ดัชนีค้นหาข้อความ (สร้างเมื่อใช้ครั้งแรก หรือทีละส่วนด้วย build_search_index)
+        # และจำนวนข่าวลือตั้งแต่ต้นรายการที่อยู่ในดัชนีแล้ว
+        self._search: Optional[SearchIndex] = None
+        self._search_position = 0
+        # ดัชนีรอง (status / verified / source / ช่วงวันที่ / ช่วงความน่าเชื่อถือ) สร้างเมื่อ query ครั้งแรก
+        self._queries: Optional[QueryIndex] = None
+        self._ids = IdAllocator(data_path, self._highest_id, id_block)
+        # ผู้รับแจ้งการเปลี่ยนแปลง (เช่น view ที่แก้เฉพาะแถวที่เปลี่ยน)
+        self.changes = ChangeFeed()
+        with self._lock.hold(shared=True), gc_paused():
+            self._stamp = file_stamp(self._data_path)
+            self._updates_offset = self._updates_size()
+            self._rumours = self._read_file(self._stamp)
+            if self._snapshot_cache and not self.loaded_from_cache:
+                if store_records(self._data_path, self._stamp, self._rumours):
+                    self._cached_stamp = self._stamp
+            self._rebuild_index()
 
-    def _load(self) -> None:
-        """Load rumours from JSON file."""
-        if not self._data_path.exists():
-            self._rumours = []
-            return
+    @metrics.timed("model_load", model="rumours")
+    def _read_file(self, stamp: Optional[FileStamp]) -> List[RumourRecord]:
+        """Parse the rumours file (empty if it does not exist), or take it from the cache built at ``stamp``."""
+        self.loaded_from_cache = False
+        if stamp is None:
+            return []
+        if self._snapshot_cache:
+            cached = load_records(self._data_path, stamp, RumourRecord)
+            if cached is not None:
+                self.loaded_from_cache = True
+                self._cached_stamp = stamp
+                return cached
         with self._data_path.open("r", encoding="utf-8") as handle:
-            self._rumours = json.load(handle)
+            # แปลงแต่ละ object เป็น RumourRecord ระหว่าง parse เพื่อประหยัดหน่วยความจำ
+            return json.load(handle, object_hook=RumourRecord.from_dict)
+
+    def write_cache(self) -> bool:
+        """Refresh the snapshot cache from memory (e.g. at shutdown); return whether it was written.
+
+        Only done when every change is saved and the file is still the one
+        last read or written here, so the cache matches the file exactly.
+        """
+        if not self._snapshot_cache or self._dirty or self._writing or self._stamp == self._cached_stamp:
+            return False
+        with self._lock.hold(shared=True):
+            if file_stamp(self._data_path) != self._stamp:
+                return False
+            if not store_records(self._data_path, self._stamp, self._rumours):
+                return False
+        self._cached_stamp = self._stamp
+        return True
+
+    def _rebuild_index(self) -> None:
+        """Rebuild the rumourId index and summary buckets from the loaded rumours."""
+        self._index = {rumour.get("rumourId"): rumour for rumour in self._rumours}
+        self._buckets = {name: {} for name in SUMMARY_BUCKETS}
+        for rumour in self._rumours:
+            for name in get_summary_buckets(rumour):
+                self._buckets[name][rumour.get("rumourId")] = None
+        # ข้อมูลทั้งหมดถูกสร้างใหม่ ผู้ที่ถือ version เก่าต้องดึงข้อมูลใหม่ทั้งหมด
+        self._log_base_version = self.change_version + 1
+        self._change_log = []
+        self._search = None
+        self._search_position = 0
+        self._queries = None
+        self._ids.invalidate()
 
+    @metrics.timed("model_save", model="rumours")
     def save(self) -> None:
-        """Save rumours to JSON file."""
-        with self._data_path.open("w", encoding="utf-8") as handle:
-            json.dump(self._rumours, handle, ensure_ascii=False, indent=2)
+        """Save rumours to JSON file (atomically), merging other processes' changes first."""
+        with self._lock.hold():
+            self._sync_locked()
+            base, updated = self._stamp, self._updated_rumours(self._local_fields, self._local_new)
+            atomic_write_json(self._data_path, self._rumours, default=record_to_json)
+            self._stamp = file_stamp(self._data_path)
+            self._updates_offset = self._append_update(
+                self._updates_path, base, self._stamp, updated, self.MAX_UPDATE_LOG_BYTES
+            )
+        self._local_fields = {}
+        self._local_new = {}
+        self._dirty = False
+
+    def refresh(self) -> List[str]:
+        """Pick up changes saved by other processes.
+
+        Costs one ``stat`` when the file is unchanged. Otherwise the rumours
+        the other saves changed are read from the update log (or, if the log
+        does not cover them, the whole file is parsed) and the differences
+        are patched into the loaded records in place (indexes and summary
+        buckets are updated per rumour, not rebuilt). Returns the IDs of rumours changed by other processes since
+        the last call (including changes merged during a save). Never waits
+        for another process's lock; a busy file is checked again next call.
+        """
+        # ไม่รอ lock: ถ้า process อื่นกำลังเขียนอยู่ จะตรวจใหม่ในรอบถัดไป
+        if self._lock.acquire(shared=True, blocking=False):
+            try:
+                self._sync_locked()
+            finally:
+                self._lock.release()
+        changed, self._external_changes = list(self._external_changes), {}
+        return changed
+
+    def _sync_locked(self) -> None:
+        """Merge the file into memory if another process saved it (the caller holds the lock)."""
+        if self._writing:
+            # ไฟล์กำลังถูกเขียนโดยเราเอง และไม่มี process อื่นเขียนได้ระหว่างนี้
+            return
+        stamp = file_stamp(self._data_path)
+        if stamp == self._stamp:
+            return
+        if not self._merge_updates(stamp):
+            # log ไม่ครอบคลุมการบันทึกทั้งหมด (เริ่มไฟล์ใหม่ หรือไฟล์ถูกเขียนโดยโปรแกรมอื่น): อ่านทั้งไฟล์
+            self._updates_offset = self._updates_size()
+            self._merge(self._read_file(stamp))
+        self._stamp = stamp
+
+    @metrics.timed("model_load", model="rumours.updates")
+    def _merge_updates(self, stamp: Optional[FileStamp]) -> bool:
+        """Merge the saves logged after ours up to the file at ``stamp``; return False if the log has a gap.
+
+        Nothing is merged unless the entries chain from the loaded file to
+        ``stamp`` without a gap, so the caller can fall back to a full parse.
+        """
+        try:
+            with self._updates_path.open("rb") as handle:
+                handle.seek(self._updates_offset)
+                data = handle.read()
+        except FileNotFoundError:
+            return False
+        current, offset = self._stamp, self._updates_offset
+        entries: List[Dict] = []
+        for line in data.splitlines(keepends=True):
+            if current == stamp:
+                break
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                return False
+            if _as_stamp(entry.get("from")) != current:
+                return False
+            entries.append(entry)
+            current = _as_stamp(entry.get("to"))
+            offset += len(line)
+        if current != stamp:
+            return False
+        for entry in entries:
+            self._merge([RumourRecord.from_dict(record) for record in entry["rumours"]])
+        self._updates_offset = offset
+        return True
+
+    def _updates_size(self) -> int:
+        """Current size of the update log (0 if there is none)."""
+        stamp = file_stamp(self._updates_path)
+        return stamp[2] if stamp else 0
+
+    def _updated_rumours(self, fields: Dict[str, Set[str]], new: Dict[str, None]) -> List[RumourRecord]:
+        """The rumours with unsaved changes (``fields``) or created since the last save (``new``)."""
+        return [self._index[rumour_id] for rumour_id in {**fields, **new} if rumour_id in self._index]
+
+    @staticmethod
+    def _append_update(
+        path: Path,
+        base: Optional[FileStamp],
+        stamp: Optional[FileStamp],
+        rumours: List[RumourRecord],
+        max_bytes: int,
+    ) -> int:
+        """Log one save (file ``base`` -> ``stamp`` changing ``rumours``); return the log size after it."""
+        line = (
+            json.dumps({"from": base, "to": stamp, "rumours": rumours}, ensure_ascii=False, default=record_to_json)
+            + "\n"
+        ).encode("utf-8")
+        current = file_stamp(path)
+        size = current[2] if current else 0
+        # log ยาวเกินไป: เริ่มไฟล์ใหม่ process ที่ยังอ่านไม่ถึงจะพบช่องว่างแล้วอ่านทั้งไฟล์แทน
+        restart = size + len(line) > max_bytes
+        with metrics.timer("file_write", file=path.name):
+            with path.open("wb" if restart else "ab") as handle:
+                handle.write(line)
+        metrics.inc("bytes_written", len(line), file=path.name)
+        return len(line) if restart else size + len(line)
+
+    def _merge(self, disk_rumours: List[RumourRecord]) -> None:
+        """Patch rumours read from disk into memory, keeping unsaved local changes."""
+        collided: List[Tuple[RumourRecord, bool]] = []
+        for disk in disk_rumours:
+            rumour_id = disk.get("rumourId")
+            mine = self._index.get(rumour_id)
+            if mine is not None and rumour_id in self._local_new:
+                # process อื่นสร้างข่าวลือด้วย ID เดียวกัน: ของเขาได้ ID นี้ ของเราจะได้ ID ใหม่
+                self._move_buckets(mine, get_summary_buckets(mine), ())
+                indexed = self._search is not None and self._search.discard(rumour_id)
+                if self._queries is not None:
+                    self._queries.discard(mine)
+                del self._local_new[rumour_id]
+                collided.append((mine, indexed))
+                mine = None
+            if mine is None:
+                self._append(disk)
+                self._external_changes[rumour_id] = None
+                continue
+            local_fields = self._local_fields.get(rumour_id, ())
+            before = get_summary_buckets(mine)
+            fields = field_values(mine)
+            changed = False
+            for key, value in disk.items():
+                if key not in local_fields and mine.get(key) != value:
+                    mine[key] = value
+                    changed = True
+            if changed:
+                self._move_buckets(mine, before)
+                self._update_queries(mine, fields)
+                self._external_changes[rumour_id] = None
+                if self._search is not None:
+                    self._search.update(mine)
+                self.changes.publish(RUMOUR_CHANGED, rumour_id)
+        for mine, indexed in collided:
+            mine["rumourId"] = self._next_id()
+            if indexed:
+                self._search.add(mine)
+            if self._queries is not None:
+                self._queries.add(mine)
+            self._index[mine["rumourId"]] = mine
+            self._local_new[mine["rumourId"]] = None
+            self._move_buckets(mine, ())
+            self._external_changes[mine["rumourId"]] = None
+            self.changes.publish(RUMOUR_ADDED, mine["rumourId"])
+
+    def flush(self) -> None:
+        """Write pending changes to disk if there are any."""
+        if self._dirty and not self._writing:
+            self.save()
+
+    def begin_flush(self) -> Optional[Callable[[], Tuple[Optional[FileStamp], int]]]:
+        """Start writing pending changes off the calling thread.
+
+        Takes the file lock without waiting, merges other processes' saves
+        and captures the rumour list. Returns None if there is nothing to
+        write, a write is already running or another process holds the lock.
+        Otherwise returns a callable that encodes and writes the file (and
+        its update log entry) on any thread; pass its result (None if it raised) to ``end_flush()`` on
+        this thread, which releases the lock.
+        """
+        if not self._dirty or self._writing or not self._lock.acquire(blocking=False):
+            return None
+        try:
+            self._sync_locked()
+        except BaseException:
+            self._lock.release()
+            raise
+        rumours = list(self._rumours)
+        path, updates_path, max_bytes = self._data_path, self._updates_path, self.MAX_UPDATE_LOG_BYTES
+        base, updated = self._stamp, self._updated_rumours(self._local_fields, self._local_new)
+        self._writing = True
+        self._dirty = False
+        self._flushing_local = (self._local_fields, self._local_new)
+        self._local_fields = {}
+        self._local_new = {}
 
-    def get_all(self) -> List[Dict]:
-        """Get all rumours."""
+        def write() -> Tuple[Optional[FileStamp], int]:
+            atomic_write_json(path, rumours, default=record_to_json)
+            stamp = file_stamp(path)
+            return stamp, RumourModel._append_update(updates_path, base, stamp, updated, max_bytes)
+
+        return write
+
+    def end_flush(self, result: Optional[Tuple[Optional[FileStamp], int]]) -> None:
+        """Finish a write started by ``begin_flush()``; ``None`` means it failed and stays pending."""
+        self._writing = False
+        fields, new = self._flushing_local
+        self._flushing_local = ({}, {})
+        if result is None:
+            self._dirty = True
+            for rumour_id, names in fields.items():
+                self._local_fields.setdefault(rumour_id, set()).update(names)
+            self._local_new.update(new)
+        else:
+            self._stamp, self._updates_offset = result
+        self._lock.release()
+
+    @property
+    def is_dirty(self) -> bool:
+        """Whether there are changes not yet written to disk."""
+        return self._dirty
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group several mutations into a single save at the end of the block.
+
+        Unless in write-behind mode, the file lock is held for the whole block
+        and other processes' saves are merged first, so new rumour IDs are
+        allocated from current data.
+        """
+        # write-behind แก้ไขในหน่วยความจำเท่านั้น lock จะถูกถือเมื่อ flush
+        with nullcontext() if self._write_behind else self._lock.hold():
+            if self._batch_depth == 0 and not self._write_behind:
+                self._sync_locked()
+            self._batch_depth += 1
+            try:
+                yield
+            finally:
+                self._batch_depth -= 1
+                if self._batch_depth == 0 and self._dirty and not self._write_behind:
+                    self.save()
+
+    def _changed(self) -> None:
+        """Persist a mutation now, or defer it (write-behind mode or inside a batch)."""
+        if self._write_behind or self._batch_depth:
+            self._dirty = True
+        else:
+            self.save()
+
+    def get_all(self) -> List[RumourRecord]:
+        """Get all rumours (a new list; see ``view_all()`` to read without copying)."""
         return list(self._rumours)
 
-    def get_by_id(self, rumour_id: str) -> Optional[Dict]:
+    def view_all(self) -> Sequence[RumourRecord]:
+        """All rumours in load order as a read-only view (no copy is made)."""
+        return RecordsView(self._rumours)
+
+    def iter_where(self, predicate: Callable[[RumourRecord], bool]) -> Iterator[RumourRecord]:
+        """Rumours for which ``predicate`` is true, yielded one at a time in load order."""
+        return filter(predicate, self._rumours)
+
+    def get_by_id(self, rumour_id: str) -> Optional[RumourRecord]:
         """Get a rumour by ID."""
-        for rumour in self._rumours:
-            if rumour.get("rumourId") == rumour_id:
-                return rumour
-        return None
+        return self._index.get(rumour_id)
+
+    def get_bucket(self, name: str) -> List[RumourRecord]:
+        """Get the rumours in a summary bucket (see business_rules.SUMMARY_BUCKETS)."""
+        return [self._index[rumour_id] for rumour_id in self._buckets[name]]
+
+    def iter_bucket(self, name: str) -> Iterator[RumourRecord]:
+        """Rumours in a summary bucket, yielded one at a time straight from the bucket (no copy).
+
+        Read it to the end before changing the model: a bucket change during
+        the iteration raises RuntimeError instead of yielding a mix of states.
+        """
+        version = self.change_version
+        index = self._index
+        for rumour_id in self._buckets[name]:
+            # ย้ายออกแล้วย้ายกลับมีขนาด dict เท่าเดิม dict จึงไม่เตือนเอง: ตรวจ version แทน
+            if self.change_version != version:
+                raise RuntimeError(f"summary bucket {name!r} changed during iteration")
+            yield index[rumour_id]
+
+    @property
+    def change_version(self) -> int:
+        """Version number of the latest summary bucket change."""
+        return self._log_base_version + len(self._change_log)
+
+    def get_bucket_changes(self, since_version: int) -> Optional[List[Tuple[str, str, str]]]:
+        """Get (bucket, "add"/"remove", rumourId) changes made after ``since_version``.
+
+        Returns None when the changes are no longer available (the log was
+        trimmed or the data reloaded); the caller should then re-read the buckets.
+        """
+        if since_version < self._log_base_version or since_version > self.change_version:
+            return None
+        return self._change_log[since_version - self._log_base_version :]
 
-    def add_rumour(self, title: str, source: str, credibility_score: int) -> Dict:
+    def _move_buckets(
+        self, rumour: RumourRecord, before: Tuple[str, ...], after: Optional[Tuple[str, ...]] = None
+    ) -> None:
+        """Move a rumour between summary buckets after it changed, and log the moves."""
+        if after is None:
+            after = get_summary_buckets(rumour)
+        if after == before:
+            return
+        rumour_id = rumour.get("rumourId")
+        for name in before:
+            if name not in after:
+                del self._buckets[name][rumour_id]
+                self._change_log.append((name, "remove", rumour_id))
+        for name in after:
+            if name not in before:
+                self._buckets[name][rumour_id] = None
+                self._change_log.append((name, "add", rumour_id))
+        # ตัดบันทึกเก่าทิ้งครึ่งหนึ่งเมื่อยาวเกินไป
+        if len(self._change_log) > self.MAX_CHANGE_LOG:
+            drop = len(self._change_log) // 2
+            del self._change_log[:drop]
+            self._log_base_version += drop
+
+    def add_rumour(self, title: str, source: str, credibility_score: int) -> RumourRecord:
         """Add a new rumour."""
-        # สร้างข่าวลือใหม่พร้อมค่าเริ่มต้น
-        new_rumour = {
-            "rumourId": self._next_id(),      # สร้าง ID อัตโนมัติ
-            "title": title,
-            "source": source,
-            "createdDate": date.today().isoformat(),
-            "credibilityScore": credibility_score,
-            "status": STATUS_NORMAL,          # สถานะเริ่มต้นเป็น "ปกติ"
-            "verified": None,                 # ยังไม่ได้ยืนยัน
-            "verifiedBy": None,
-            "verifiedDate": None,
-        }
-        self._rumours.append(new_rumour)
-        self.save()
+        with self.batch():
+            # สร้างข่าวลือใหม่พร้อมค่าเริ่มต้น
+            new_rumour = RumourRecord(
+                rumourId=self._next_id(),      # สร้าง ID อัตโนมัติ
+                title=title,
+                source=source,
+                createdDate=date.today().isoformat(),
+                credibilityScore=credibility_score,
+                status=STATUS_NORMAL,          # สถานะเริ่มต้นเป็น "ปกติ"
+                verified=None,                 # ยังไม่ได้ยืนยัน
+                verifiedBy=None,
+                verifiedDate=None,
+            )
+            self._append(new_rumour)
+            self._local_new[new_rumour["rumourId"]] = None
+            self._changed()
         return new_rumour
 
-    def update_status(self, rumour_id: str, status: str) -> bool:
-        """Update the status of a rumour."""
+    def add_rumours(self, records: List[Dict]) -> List[RumourRecord]:
+        """Add many rumours at once, assigning them a contiguous block of IDs.
+
+        Each record needs ``title`` and may set ``source``, ``credibilityScore``,
+        ``createdDate`` and ``status``; the model is persisted once.
+        """
+        with self.batch():
+            # จอง ID ต่อเนื่องกันทั้งชุดครั้งเดียว
+            first_id = self._ids.allocate(len(records))
+            added: List[RumourRecord] = []
+            for offset, record in enumerate(records):
+                new_rumour = RumourRecord(
+                    rumourId=str(first_id + offset),
+                    title=record["title"],
+                    source=record.get("source", ""),
+                    createdDate=record.get("createdDate") or date.today().isoformat(),
+                    credibilityScore=record.get("credibilityScore", 0),
+                    status=record.get("status", STATUS_NORMAL),
+                    verified=None,
+                    verifiedBy=None,
+                    verifiedDate=None,
+                )
+                self._append(new_rumour)
+                self._local_new[new_rumour["rumourId"]] = None
+                added.append(new_rumour)
+            if added:
+                self._changed()
+        return added
+
+    def _append(self, rumour: RumourRecord) -> None:
+        """Append a rumour to the list and its indexes."""
+        # ดัชนีค้นหาที่สร้างครบแล้วจะเพิ่มทันที ถ้ายังสร้างไม่ครบ ข่าวลือนี้อยู่ในส่วนที่รอสร้างอยู่แล้ว
+        if self._search is not None and self._search_position == len(self._rumours):
+            self._search.add(rumour)
+            self._search_position += 1
+        self._rumours.append(rumour)
+        self._index[rumour["rumourId"]] = rumour
+        self._ids.observe(id_number(rumour.get("rumourId")))
+        self._move_buckets(rumour, ())
+        if self._queries is not None:
+            self._queries.add(rumour)
+        self.changes.publish(RUMOUR_ADDED, rumour["rumourId"])
+
+    def _update_queries(self, rumour: RumourRecord, before: FieldValues) -> None:
+        """Move a changed rumour within the secondary indexes (if they are built)."""
+        if self._queries is not None:
+            self._queries.update(rumour, before)
+
+    def _query_index(self) -> QueryIndex:
+        """Get the secondary indexes, building them on first use."""
+        if self._queries is None:
+            with metrics.timer("query_index_build"):
+                self._queries = QueryIndex.build(self._rumours, self.get_by_id)
+        return self._queries
+
+    def query(
+        self,
+        status: Any = None,
+        verified: Any = ANY,
+        source: Any = None,
+        created_from: Optional[str] = None,
+        created_to: Optional[str] = None,
+        min_credibility: Optional[float] = None,
+        max_credibility: Optional[float] = None,
+    ) -> Iterator[RumourRecord]:
+        """Rumours matching every given condition, yielded one at a time.
+
+        For example ``query(status=STATUS_PANIC, source="LINE Chat",
+        created_from="2025-06-01", created_to="2025-06-07")``. See
+        ``RumourQuery`` for the accepted values. The secondary indexes are
+        built on first use and then kept in sync with every change; the
+        most selective condition picks the candidates. Without conditions
+        all rumours are yielded in load order.
+        """
+        criteria = RumourQuery(
+            status, verified, source, created_from, created_to, min_credibility, max_credibility
+        )
+        if not criteria:
+            return iter(self._rumours)
+        return self._query_index().select(criteria)
+
+    def get_sources(self) -> List[str]:
+        """Distinct rumour sources, most common first."""
+        return [source for source in self._query_index().values("source") if source]
+
+    def build_search_index(self, limit: Optional[int] = None) -> bool:
+        """Add up to ``limit`` more rumours to the search index (all if None).
+
+        Lets a UI build the index in small steps between events. Returns
+        True once every rumour is indexed.
+        """
+        if self._search is None:
+            self._search = SearchIndex(self.get_by_id)
+            self._search_position = 0
+        stop = len(self._rumours) if limit is None else min(len(self._rumours), self._search_position + limit)
+        with metrics.timer("search_index_build"):
+            for rumour in self._rumours[self._search_position : stop]:
+                self._search.add(rumour)
+        self._search_position = stop
+        return stop == len(self._rumours)
+
+    @metrics.timed("search")
+    def search(self, query: str) -> SearchResults:
+        """Rumours whose title or source contains ``query``, title prefix matches first.
+
+        Matching ignores case and whitespace, so Thai text can be searched
+        without word boundaries; queries shorter than ``MIN_QUERY_CHARS``
+        match nothing. Hits are ranked as they are read. Builds the index on
+        first use; rumours not indexed yet (see ``build_search_index``) are
+        scanned directly.
+        """
+        if self._search is None:
+            self.build_search_index()
+        return self._search.search(query, self._rumours[self._search_position :])
+
+    def update_status(self, rumour_id: str, status: str, panic_since: Optional[str] = None) -> bool:
+        """Update the status of a rumour.
+
+        ``panic_since`` records when the panic-window rule switched the rumour
+        to panic (kept in ``panicSince``); any other status change clears it.
+        """
         rumour = self.get_by_id(rumour_id)
         if not rumour:
             return False
+        before = get_summary_buckets(rumour)
+        fields = field_values(rumour)
         rumour["status"] = status
-        self.save()
+        self._local_fields.setdefault(rumour_id, set()).add("status")
+        # ข่าวลือส่วนใหญ่ไม่มี field นี้ (เก็บใน _extra ของ record) จึงไม่เพิ่มให้ถ้าไม่จำเป็น
+        if panic_since is not None or rumour.get("panicSince") is not None:
+            rumour["panicSince"] = panic_since
+            self._local_fields[rumour_id].add("panicSince")
+        self._move_buckets(rumour, before)
+        self._update_queries(rumour, fields)
+        self.changes.publish(STATUS_CHANGED, rumour_id)
+        self._changed()
         return True
 
     def update_verified(self, rumour_id: str, verified: bool, verified_by: str) -> bool:
@@ -73,10 +636,16 @@ class RumourModel:
         rumour = self.get_by_id(rumour_id)
         if not rumour:
             return False
+        before = get_summary_buckets(rumour)
+        fields = field_values(rumour)
         rumour["verified"] = verified
         rumour["verifiedBy"] = verified_by
         rumour["verifiedDate"] = date.today().isoformat()
-        self.save()
+        self._local_fields.setdefault(rumour_id, set()).update(("verified", "verifiedBy", "verifiedDate"))
+        self._move_buckets(rumour, before)
+        self._update_queries(rumour, fields)
+        self.changes.publish(RUMOUR_VERIFIED, rumour_id)
+        self._changed()
         return True
 
     def is_verified(self, rumour: Dict) -> bool:
@@ -95,11 +664,15 @@ class RumourModel:
 
     def _next_id(self) -> str:
         """Generate next rumour ID."""
-        # สร้าง ID ใหม่ โดยเพิ่มจาก ID ที่ใหญ่ที่สุด
-        max_id = 10000000
+        return str(self._ids.allocate())
+
+    def _highest_id(self) -> int:
+        """Highest numeric rumour ID in memory (at least 10000000, so IDs have eight digits)."""
+        # ไล่หาครั้งเดียวเมื่อสร้าง ID ครั้งแรก หลังจากนั้น IdAllocator จำค่าไว้
+        highest = 10000000
         for rumour in self._rumours:
-            rumour_id = rumour.get("rumourId", "")
-            if rumour_id.isdigit():
-                max_id = max(max_id, int(rumour_id))
-        return str(max_id + 1)
+            number = id_number(rumour.get("rumourId"))
+            if number is not None and number > highest:
+                highest = number
+        return highest
 
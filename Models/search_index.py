@@ -0,0 +1,287 @@
+"""Character n-gram search index over rumour titles and sources."""
+from __future__ import annotations
+
+import re
+import unicodedata
+from array import array
+from collections.abc import Sequence
+from heapq import merge
+from itertools import compress, islice, repeat
+from operator import contains
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple, Union
+
+NGRAM = 2  # ภาษาไทยไม่เว้นวรรคระหว่างคำ จึงแบ่งเป็นกลุ่มตัวอักษรแทนการตัดคำ
+# คำค้นที่สั้นกว่านี้ไม่ถูกค้นหา (เกือบทุกข่าวลือตรง ผลจึงไม่มีประโยชน์และต้องตรวจทุกเอกสาร)
+MIN_QUERY_CHARS = NGRAM
+# จำนวนเอกสารที่ตรวจต่อรอบด้วย map / compress (วนใน C แทน Python): เริ่มเล็กให้หน้าแรกเร็ว แล้วขยาย
+SCAN_FIRST_CHUNK = 256
+SCAN_MAX_CHUNK = 16384
+_SPACES = re.compile(r"\s+")
+_EMPTY = array("I")
+
+
+def normalize(text: str) -> str:
+    """Fold case, compose Thai marks consistently (NFC) and drop whitespace."""
+    return _SPACES.sub("", unicodedata.normalize("NFC", text).casefold())
+
+
+def is_searchable(query: str) -> bool:
+    """Whether ``query`` is long enough to be searched (``MIN_QUERY_CHARS`` after normalizing)."""
+    return len(normalize(query)) >= MIN_QUERY_CHARS
+
+
+def _grams(text: str) -> Set[str]:
+    """Distinct n-grams of normalized text."""
+    return {text[i : i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+
+def _chunks(docs: array) -> Iterator[array]:
+    """``docs`` (as long as it is now) in growing chunks."""
+    start, size, stop = 0, SCAN_FIRST_CHUNK, len(docs)
+    while start < stop:
+        yield docs[start : min(stop, start + size)]
+        start += size
+        size = min(size * 2, SCAN_MAX_CHUNK)
+
+
+def _scan(docs: array, texts: List[str], text: str, test: Callable[[str, str], bool]) -> Iterator[int]:
+    """Documents of ``docs`` for which ``test(texts[doc], text)`` holds, in order."""
+    get = texts.__getitem__
+    for chunk in _chunks(docs):
+        yield from compress(chunk, map(test, map(get, chunk), repeat(text)))
+
+
+def _count(docs: array, texts: List[str], text: str) -> int:
+    """Number of documents of ``docs`` whose text contains ``text``."""
+    get = texts.__getitem__
+    return sum(sum(map(contains, map(get, chunk), repeat(text))) for chunk in _chunks(docs))
+
+
+class SearchResults(Sequence):
+    """Ranked search hits, ranked and resolved to rumour records only as far as they are read.
+
+    Title prefix matches come first, then other title matches, then
+    source-only matches; within a group rumours keep their load order.
+    Reading the first page only ranks the hits on that page. ``len()``
+    calls ``count`` when given (an exact count that skips the ranking) and
+    otherwise reads every hit.
+    """
+
+    def __init__(
+        self,
+        ids: Iterable[str],
+        lookup: Callable[[str], Optional[Mapping]],
+        count: Optional[Callable[[], int]] = None,
+    ) -> None:
+        """Wrap matching rumour IDs (already in rank order, possibly produced lazily)."""
+        self._ids: List[str] = []
+        self._pending: Optional[Iterator[str]] = iter(ids)
+        self._lookup = lookup
+        self._count = count
+        self._length: Optional[int] = None
+
+    def _fill(self, stop: Optional[int] = None) -> None:
+        """Rank hits until ``stop`` of them are known (all of them for None)."""
+        if self._pending is None or (stop is not None and stop <= len(self._ids)):
+            return
+        wanted = None if stop is None else stop - len(self._ids)
+        before = len(self._ids)
+        self._ids.extend(islice(self._pending, wanted))
+        if wanted is None or len(self._ids) - before < wanted:
+            self._pending = None
+            self._length = len(self._ids)
+
+    def ids(self) -> List[str]:
+        """Matching rumour IDs in rank order."""
+        self._fill()
+        return list(self._ids)
+
+    def __len__(self) -> int:
+        if self._length is None:
+            if self._count is not None:
+                self._length = self._count()
+            else:
+                self._fill()
+        return self._length
+
+    def __getitem__(self, index: Union[int, slice]):  # type: ignore[override]
+        if isinstance(index, slice):
+            start, stop, step = index.start or 0, index.stop, index.step or 1
+            self._fill(None if stop is None or stop < 0 or start < 0 or step < 0 else stop)
+            return [self._lookup(rumour_id) for rumour_id in self._ids[index]]
+        self._fill(None if index < 0 else index + 1)
+        return self._lookup(self._ids[index])
+
+    def __iter__(self) -> Iterator[Optional[Mapping]]:
+        index = 0
+        while True:
+            if index == len(self._ids):
+                self._fill(index + 64)
+                if index == len(self._ids):
+                    return
+            yield self._lookup(self._ids[index])
+            index += 1
+
+
+class SearchIndex:
+    """Inverted index from character n-grams to rumours.
+
+    Each rumour's title is normalized and split into overlapping n-grams;
+    every n-gram maps to a compact array of document numbers, and the
+    first n-gram of the title gets a second array for prefix matches.
+    Sources take few distinct values, so they are indexed once per value
+    (n-gram -> source, source -> documents). A query reads the rarest
+    n-gram's documents in chunks, confirming each with a substring check
+    in C loops (``map`` / ``compress``), and ranks hits only as they are
+    read; the count behind ``len()`` runs the same check without ranking.
+    Queries shorter than ``MIN_QUERY_CHARS`` match nothing. A changed
+    rumour gets a new document number; the old one is left as a tombstone
+    whose text no longer matches anything.
+
+    The index can be filled in chunks: rumours not indexed yet are passed
+    to ``search()`` as ``unindexed`` and scanned directly.
+    """
+
+    def __init__(self, lookup: Callable[[str], Optional[Mapping]]) -> None:
+        """Create an empty index that resolves rumour IDs with ``lookup``."""
+        self._lookup = lookup
+        # เลขเอกสาร -> rumourId (None = ถูกแทนที่แล้ว), ชื่อเรื่อง และแหล่งที่มาแบบ normalize
+        self._ids: List[Optional[str]] = []
+        self._titles: List[str] = []
+        self._sources: List[str] = []
+        self._docs: Dict[str, int] = {}
+        # n-gram ของชื่อเรื่อง -> เลขเอกสาร และ n-gram แรกของชื่อเรื่อง -> เลขเอกสาร
+        self._postings: Dict[str, array] = {}
+        self._prefixes: Dict[str, array] = {}
+        # จำนวนเอกสารที่ถูกแทนที่ในรายการของแต่ละ n-gram (นับผลของคำค้นยาว NGRAM ได้ทันที)
+        self._dead_grams: Dict[str, int] = {}
+        # แหล่งที่มา -> เลขเอกสาร, n-gram -> แหล่งที่มา และจำนวนเอกสารที่ถูกแทนที่ของแต่ละแหล่ง
+        self._by_source: Dict[str, array] = {}
+        self._source_grams: Dict[str, Set[str]] = {}
+        self._source_dead: Dict[str, int] = {}
+
+    @classmethod
+    def build(cls, rumours: Iterable[Mapping], lookup: Callable[[str], Optional[Mapping]]) -> "SearchIndex":
+        """Index all rumours once."""
+        index = cls(lookup)
+        for rumour in rumours:
+            index.add(rumour)
+        return index
+
+    def add(self, rumour: Mapping) -> None:
+        """Index a rumour (replacing any earlier entry with the same ID)."""
+        rumour_id = rumour.get("rumourId")
+        old = self._docs.get(rumour_id)
+        if old is not None:
+            self._bury(old)
+        doc = len(self._ids)
+        title = normalize(rumour.get("title") or "")
+        source = normalize(rumour.get("source") or "")
+        self._ids.append(rumour_id)
+        self._titles.append(title)
+        self._sources.append(source)
+        self._docs[rumour_id] = doc
+        postings = self._postings
+        for gram in _grams(title):
+            posting = postings.get(gram)
+            if posting is None:
+                posting = postings[gram] = array("I")
+            posting.append(doc)
+        if len(title) >= NGRAM:
+            posting = self._prefixes.get(title[:NGRAM])
+            if posting is None:
+                posting = self._prefixes[title[:NGRAM]] = array("I")
+            posting.append(doc)
+        if source:
+            posting = self._by_source.get(source)
+            if posting is None:
+                posting = self._by_source[source] = array("I")
+                for gram in _grams(source):
+                    self._source_grams.setdefault(gram, set()).add(source)
+            posting.append(doc)
+
+    def _bury(self, doc: int) -> None:
+        """Turn a document into a tombstone that matches no query."""
+        self._ids[doc] = None
+        for gram in _grams(self._titles[doc]):
+            self._dead_grams[gram] = self._dead_grams.get(gram, 0) + 1
+        self._titles[doc] = ""
+        source = self._sources[doc]
+        if source:
+            self._source_dead[source] = self._source_dead.get(source, 0) + 1
+            self._sources[doc] = ""
+
+    def update(self, rumour: Mapping) -> None:
+        """Re-index an indexed rumour if its title or source changed."""
+        doc = self._docs.get(rumour.get("rumourId"))
+        if doc is not None and (
+            self._titles[doc] != normalize(rumour.get("title") or "")
+            or self._sources[doc] != normalize(rumour.get("source") or "")
+        ):
+            self.add(rumour)
+
+    def discard(self, rumour_id: str) -> bool:
+        """Remove a rumour from the results (e.g. before its ID changes); return whether it was indexed."""
+        doc = self._docs.pop(rumour_id, None)
+        if doc is None:
+            return False
+        self._bury(doc)
+        return True
+
+    def search(self, query: str, unindexed: Iterable[Mapping] = ()) -> SearchResults:
+        """Rumours whose title or source contains ``query`` (ignoring case and spaces), ranked lazily.
+
+        ``unindexed`` are rumours not added to the index yet; they are
+        checked one by one up front and ranked with the indexed hits. Hits
+        are read from the live index, so later pages of a kept result may
+        reflect changes made after the search.
+        """
+        text = normalize(query)
+        if len(text) < MIN_QUERY_CHARS:
+            return SearchResults([], self._lookup)
+        ids, titles, sources = self._ids, self._titles, self._sources
+        grams = _grams(text)
+        title_docs = min((self._postings.get(gram, _EMPTY) for gram in grams), key=len)
+        prefix_docs = self._prefixes.get(text[:NGRAM], _EMPTY)
+        candidates = min((self._source_grams.get(gram, ()) for gram in grams), key=len)
+        matched_sources = [source for source in candidates if text in source]
+
+        # ข่าวลือที่ยังไม่อยู่ในดัชนีมีจำนวนจำกัด (ระหว่างสร้างดัชนีทีละส่วน) จึงตรวจทันที
+        extra: Tuple[List[str], List[str], List[str]] = ([], [], [])
+        for rumour in unindexed:
+            title = normalize(rumour.get("title") or "")
+            if text in title:
+                extra[0 if title.startswith(text) else 1].append(rumour.get("rumourId"))
+            elif text in normalize(rumour.get("source") or ""):
+                extra[2].append(rumour.get("rumourId"))
+
+        def ranked() -> Iterator[str]:
+            for doc in _scan(prefix_docs, titles, text, str.startswith):
+                yield ids[doc]
+            yield from extra[0]
+            for doc in _scan(title_docs, titles, text, contains):
+                if not titles[doc].startswith(text):
+                    yield ids[doc]
+            yield from extra[1]
+            postings = [self._by_source[source] for source in matched_sources]
+            for doc in postings[0] if len(postings) == 1 else merge(*postings):
+                # ข้ามเอกสารที่ถูกแทนที่ และเอกสารที่ชื่อเรื่องตรงแล้ว (อยู่ในกลุ่มก่อนหน้า)
+                if sources[doc] and text not in titles[doc]:
+                    yield ids[doc]
+            yield from extra[2]
+
+        def count() -> int:
+            if len(text) == NGRAM:
+                # n-gram เดียว: ทุกเอกสารในรายการตรงอยู่แล้ว ยกเว้นเอกสารที่ถูกแทนที่
+                total = len(title_docs) - self._dead_grams.get(text, 0)
+            else:
+                total = _count(title_docs, titles, text)
+            total += sum(map(len, extra))
+            if matched_sources:
+                live = sum(len(self._by_source[source]) - self._source_dead.get(source, 0) for source in matched_sources)
+                # เอกสารที่ชื่อเรื่องและแหล่งที่มาตรงทั้งคู่ถูกนับไปแล้ว
+                title_hits = _scan(title_docs, titles, text, contains)
+                total += live - sum(map(contains, map(sources.__getitem__, title_hits), repeat(text)))
+            return total
+
+        return SearchResults(ranked(), self._lookup, count)
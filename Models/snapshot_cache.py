@@ -0,0 +1,110 @@
+"""Binary cache of parsed data files, so an unchanged JSON file is not parsed again at startup.
+
+The cache of ``Data/reports.json`` is ``Data/.cache/reports.json.cache``.
+It holds the records as ``marshal``-encoded tuples (several times faster
+to read than the JSON) plus a header with the cache format version, the
+Python/marshal version, the record type and its fields, and the stamp
+(inode, mtime, size) of the JSON file it was built from. A cache whose
+header does not match the current file is ignored, as is a damaged one,
+and the model parses the JSON as before; the cache is never a source of
+data on its own.
+"""
+from __future__ import annotations
+
+import marshal
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple, Type, TypeVar
+
+from .records import Record
+from .storage import FileStamp
+
+CACHE_VERSION = 2  # 2: reportDate ถูกเติมเวลาเมื่อโหลด (cache เก่ายังมีแค่วันที่)
+CACHE_DIR_NAME = ".cache"
+_SIZE_BYTES = 4  # ความยาวของ header ที่ขึ้นต้นไฟล์
+
+R = TypeVar("R", bound=Record)
+
+
+def cache_path(data_path: Path) -> Path:
+    """Cache file of a data file."""
+    return data_path.parent / CACHE_DIR_NAME / f"{data_path.name}.cache"
+
+
+def _header(record_type: Type[Record], stamp: FileStamp) -> Tuple[Any, ...]:
+    """Everything that must match for a cache to be used."""
+    return (
+        CACHE_VERSION,
+        sys.implementation.cache_tag,
+        marshal.version,
+        record_type.__name__,
+        record_type.FIELDS,
+        tuple(stamp),
+    )
+
+
+def load_records(data_path: Path, stamp: Optional[FileStamp], record_type: Type[R]) -> Optional[List[R]]:
+    """Records cached for ``data_path`` at ``stamp``, or None if there is no usable cache."""
+    if stamp is None:
+        return None
+    try:
+        with cache_path(data_path).open("rb") as handle:
+            # อ่าน header ก่อน ถ้าไม่ตรงก็ไม่ต้องอ่านข้อมูลทั้งก้อน
+            size = int.from_bytes(handle.read(_SIZE_BYTES), "little")
+            if marshal.loads(handle.read(size)) != _header(record_type, stamp):
+                return None
+            # marshal.loads จาก bytes เร็วกว่า marshal.load จากไฟล์หลายเท่า
+            rows, sparse = marshal.loads(handle.read())
+        records = record_type.from_rows(rows)
+        # record ที่ขาดบาง field หรือมี key อื่นนอกเหนือจาก FIELDS
+        for position, missing, extra in sparse:
+            record = records[position]
+            for key in missing:
+                object.__delattr__(record, key)
+            record._extra = extra
+    except (OSError, EOFError, ValueError, TypeError, IndexError, AttributeError):
+        # cache เสีย (เช่นเขียนไม่ครบ) ถือว่าไม่มี cache
+        return None
+    return records
+
+
+def store_records(data_path: Path, stamp: Optional[FileStamp], records: Sequence[Record]) -> bool:
+    """Write the cache of ``data_path`` (records as loaded from the file at ``stamp``); return whether it was written.
+
+    The file is replaced atomically, so a reader sees the old cache or the
+    new one. Failures (read-only folder, full disk) are ignored: the data
+    file stays the source of truth.
+    """
+    if stamp is None or not records:
+        return False
+    record_type = type(records[0])
+    rows = []
+    sparse = []
+    for position, record in enumerate(records):
+        row = record.to_row()
+        rows.append(row)
+        if ... in row or record._extra:
+            missing = tuple(key for key, value in zip(record_type.FIELDS, row) if value is ...)
+            sparse.append((position, missing, dict(record._extra) if record._extra else None))
+    path = cache_path(data_path)
+    try:
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                header = marshal.dumps(_header(record_type, stamp))
+                handle.write(len(header).to_bytes(_SIZE_BYTES, "little"))
+                handle.write(header)
+                marshal.dump((rows, sparse), handle)
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+    except (OSError, ValueError):
+        return False
+    return True
@@ -0,0 +1,645 @@
+"""SQLite storage backend with the same public interface as the JSON models."""
+from __future__ import annotations
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from business_rules import (
+    PANIC_WINDOW_SECONDS,
+    STATUS_NORMAL,
+    STATUS_PANIC,
+    SUMMARY_PANIC,
+    SUMMARY_VERIFIED_FALSE,
+    SUMMARY_VERIFIED_TRUE,
+)
+
+from .events import REPORT_ADDED, RUMOUR_ADDED, RUMOUR_VERIFIED, STATUS_CHANGED, ChangeFeed
+from .query_index import ANY, RumourQuery
+from .records import normalize_report_date
+from .search_index import MIN_QUERY_CHARS, SearchResults, normalize
+
+# เงื่อนไข SQL ของแต่ละหมวดหน้าสรุป (ใช้ index บน status / verified)
+BUCKET_CONDITIONS = {
+    SUMMARY_PANIC: ("status = ?", (STATUS_PANIC,)),
+    SUMMARY_VERIFIED_TRUE: ("verified = 1", ()),
+    SUMMARY_VERIFIED_FALSE: ("verified = 0", ()),
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rumours (
+    rumourId         TEXT PRIMARY KEY,
+    title            TEXT NOT NULL DEFAULT '',
+    source           TEXT NOT NULL DEFAULT '',
+    createdDate      TEXT,
+    credibilityScore INTEGER NOT NULL DEFAULT 0,
+    status           TEXT NOT NULL,
+    verified         INTEGER,
+    verifiedBy       TEXT,
+    verifiedDate     TEXT,
+    panicSince       TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_rumours_status ON rumours(status);
+CREATE INDEX IF NOT EXISTS idx_rumours_verified ON rumours(verified);
+CREATE INDEX IF NOT EXISTS idx_rumours_source ON rumours(source);
+CREATE INDEX IF NOT EXISTS idx_rumours_created ON rumours(createdDate);
+CREATE INDEX IF NOT EXISTS idx_rumours_credibility ON rumours(credibilityScore);
+
+CREATE TABLE IF NOT EXISTS reports (
+    reportId    TEXT PRIMARY KEY,
+    reporterId  TEXT NOT NULL,
+    rumourId    TEXT NOT NULL,
+    reportDate  TEXT,
+    reportType  TEXT,
+    description TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_reports_rumour ON reports(rumourId);
+CREATE INDEX IF NOT EXISTS idx_reports_rumour_date ON reports(rumourId, reportDate);
+CREATE INDEX IF NOT EXISTS idx_reports_reporter_rumour ON reports(reporterId, rumourId);
+
+CREATE TABLE IF NOT EXISTS report_counts (
+    rumourId TEXT PRIMARY KEY,
+    count    INTEGER NOT NULL
+);
+
+-- เลข ID ถัดไปของแต่ละตาราง (จองใน transaction เดียวกับการ INSERT)
+CREATE TABLE IF NOT EXISTS id_counters (
+    name TEXT PRIMARY KEY,
+    next INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS users (
+    userId     TEXT PRIMARY KEY,
+    name       TEXT,
+    role       TEXT,
+    email      TEXT,
+    password   TEXT,
+    joinedDate TEXT
+);
+"""
+
+RUMOUR_COLUMNS = (
+    "rumourId",
+    "title",
+    "source",
+    "createdDate",
+    "credibilityScore",
+    "status",
+    "verified",
+    "verifiedBy",
+    "verifiedDate",
+    "panicSince",
+)
+REPORT_COLUMNS = ("reportId", "reporterId", "rumourId", "reportDate", "reportType", "description")
+USER_COLUMNS = ("userId", "name", "role", "email", "password", "joinedDate")
+
+
+def _insert_sql(table: str, columns: tuple) -> str:
+    """Build an INSERT statement for the given table and columns."""
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+
+
+def _allocate_ids(conn: sqlite3.Connection, name: str, count: int, highest_sql: str, floor: int = 0) -> int:
+    """Reserve ``count`` consecutive ID numbers from ``id_counters`` (in the caller's transaction); return the first.
+
+    The UPDATE takes the database write lock, so concurrent processes get
+    distinct numbers. Without a counter row yet, numbering continues after
+    the highest existing ID (``highest_sql``, at least ``floor``).
+    """
+    cursor = conn.execute("UPDATE id_counters SET next = next + ? WHERE name = ?", (count, name))
+    if cursor.rowcount:
+        return conn.execute("SELECT next FROM id_counters WHERE name = ?", (name,)).fetchone()[0] - count
+    first = max(floor, conn.execute(highest_sql).fetchone()[0] or 0) + 1
+    conn.execute("INSERT INTO id_counters (name, next) VALUES (?, ?)", (name, first + count))
+    return first
+
+
+def _rumour_values(rumour: Dict) -> List:
+    """Convert a rumour dict to a row tuple (verified is stored as 0/1/NULL)."""
+    values = [rumour.get(column) for column in RUMOUR_COLUMNS]
+    verified = rumour.get("verified")
+    values[RUMOUR_COLUMNS.index("verified")] = None if verified is None else int(verified)
+    return values
+
+
+class SQLiteDatabase:
+    """Shared SQLite database used by the SQLite models.
+
+    Each thread gets its own connection so readers never wait on the writer
+    (the database runs in WAL mode); writes are serialized with a lock.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        """Open (and create if needed) the database at ``db_path``."""
+        self.db_path = db_path
+        self._local = threading.local()
+        self.write_lock = threading.RLock()
+        self._depth = 0
+        conn = self.connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(SCHEMA)
+        if "panicSince" not in {row["name"] for row in conn.execute("PRAGMA table_info(rumours)")}:
+            # ฐานข้อมูลที่สร้างก่อนมีคอลัมน์นี้
+            conn.execute("ALTER TABLE rumours ADD COLUMN panicSince TEXT")
+        if conn.execute("PRAGMA user_version").fetchone()[0] < 1:
+            # รายงานเก่าเก็บเฉพาะวันที่: เติมเวลาเที่ยงคืนครั้งเดียว ให้ reportDate มีรูปแบบเดียวกันทั้งตาราง
+            conn.execute("UPDATE reports SET reportDate = reportDate || 'T00:00:00' WHERE length(reportDate) = 10")
+            conn.execute("PRAGMA user_version = 1")
+        conn.commit()
+
+    def connection(self) -> sqlite3.Connection:
+        """Get the connection for the calling thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path))
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run writes in one transaction; nested blocks join the outermost one."""
+        with self.write_lock:
+            conn = self.connection()
+            self._depth += 1
+            try:
+                yield conn
+            except BaseException:
+                self._depth -= 1
+                if self._depth == 0:
+                    conn.rollback()
+                raise
+            self._depth -= 1
+            if self._depth == 0:
+                conn.commit()
+
+
+def _query_where(query: RumourQuery) -> Tuple[str, List[Any]]:
+    """Build the WHERE clause (with parameters) for a ``RumourQuery``."""
+    clauses: List[str] = []
+    params: List[Any] = []
+    for field, values in query.categorical():
+        if field == "verified":
+            # verified เก็บเป็น 0/1/NULL
+            known = [int(value) for value in values if value is not None]
+            parts = [f"verified IN ({', '.join('?' * len(known))})"] if known else []
+            if None in values:
+                parts.append("verified IS NULL")
+            clauses.append(f"({' OR '.join(parts)})" if parts else "0")
+            params.extend(known)
+        else:
+            clauses.append(f"{field} IN ({', '.join('?' * len(values))})" if values else "0")
+            params.extend(values)
+    for field, (low, high) in query.ranges():
+        if low is not None:
+            clauses.append(f"{field} >= ?")
+            params.append(low)
+        if high is not None:
+            clauses.append(f"{field} <= ?")
+            params.append(high)
+    return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+
+def _rumour_from_row(row: sqlite3.Row) -> Dict:
+    """Convert a rumours row to the dict shape used by the JSON model."""
+    rumour = dict(row)
+    if rumour["verified"] is not None:
+        rumour["verified"] = bool(rumour["verified"])
+    return rumour
+
+
+class SQLiteRumourModel:
+    """Rumour model stored in SQLite."""
+
+    def __init__(self, database: SQLiteDatabase) -> None:
+        """Initialize the rumour model on a shared database.
+
+        Changes made through this model are announced on ``changes`` (see
+        ``Models.events``); other connections' changes come from ``refresh()``.
+        """
+        self._db = database
+        self.changes = ChangeFeed()
+
+    def save(self) -> None:
+        """Commit pending changes (each mutation already commits)."""
+        with self._db.write_lock:
+            self._db.connection().commit()
+
+    def flush(self) -> None:
+        """Write pending changes to disk (SQLite commits every mutation)."""
+        self.save()
+
+    def write_cache(self) -> bool:
+        """Nothing to cache: the database is read on demand."""
+        return False
+
+    @property
+    def is_dirty(self) -> bool:
+        """Whether there are changes not yet written to disk."""
+        return False
+
+    def begin_flush(self) -> None:
+        """Nothing to write in the background: every mutation commits."""
+        return None
+
+    def end_flush(self, result: object) -> None:
+        """Counterpart of ``begin_flush()`` (never called, as it returns None)."""
+
+    def batch(self) -> Iterator[sqlite3.Connection]:
+        """Group several mutations into a single transaction."""
+        return self._db.transaction()
+
+    def refresh(self) -> List[str]:
+        """Nothing to reload: every read queries the database, which SQLite keeps consistent across processes."""
+        return []
+
+    def get_all(self) -> List[Dict]:
+        """Get all rumours."""
+        rows = self._db.connection().execute("SELECT * FROM rumours ORDER BY rowid")
+        return [_rumour_from_row(row) for row in rows]
+
+    def view_all(self) -> Sequence[Dict]:
+        """All rumours (read from the database into a list: rows are not kept in memory)."""
+        return self.get_all()
+
+    def iter_where(self, predicate: Callable[[Dict], bool]) -> Iterator[Dict]:
+        """Rumours for which ``predicate`` is true, streamed from the cursor."""
+        rows = self._db.connection().execute("SELECT * FROM rumours ORDER BY rowid")
+        return filter(predicate, map(_rumour_from_row, rows))
+
+    def get_by_id(self, rumour_id: str) -> Optional[Dict]:
+        """Get a rumour by ID."""
+        row = self._db.connection().execute("SELECT * FROM rumours WHERE rumourId = ?", (rumour_id,)).fetchone()
+        return _rumour_from_row(row) if row else None
+
+    def get_bucket(self, name: str) -> List[Dict]:
+        """Get the rumours in a summary bucket (see business_rules.SUMMARY_BUCKETS)."""
+        condition, params = BUCKET_CONDITIONS[name]
+        rows = self._db.connection().execute(f"SELECT * FROM rumours WHERE {condition} ORDER BY rowid", params)
+        return [_rumour_from_row(row) for row in rows]
+
+    def iter_bucket(self, name: str) -> Iterator[Dict]:
+        """Rumours in a summary bucket, streamed from the cursor."""
+        condition, params = BUCKET_CONDITIONS[name]
+        rows = self._db.connection().execute(f"SELECT * FROM rumours WHERE {condition} ORDER BY rowid", params)
+        return map(_rumour_from_row, rows)
+
+    @property
+    def change_version(self) -> int:
+        """Version number of the latest summary bucket change (not tracked for SQLite)."""
+        return 0
+
+    def get_bucket_changes(self, since_version: int) -> Optional[List[Tuple[str, str, str]]]:
+        """Bucket changes are not tracked: other connections may write, so always re-read."""
+        return None
+
+    def add_rumour(self, title: str, source: str, credibility_score: int) -> Dict:
+        """Add a new rumour."""
+        with self._db.transaction() as conn:
+            new_rumour = {
+                "rumourId": self._next_id(),
+                "title": title,
+                "source": source,
+                "createdDate": date.today().isoformat(),
+                "credibilityScore": credibility_score,
+                "status": STATUS_NORMAL,
+                "verified": None,
+                "verifiedBy": None,
+                "verifiedDate": None,
+            }
+            conn.execute(_insert_sql("rumours", RUMOUR_COLUMNS), _rumour_values(new_rumour))
+        self.changes.publish(RUMOUR_ADDED, new_rumour["rumourId"])
+        return new_rumour
+
+    def add_rumours(self, records: List[Dict]) -> List[Dict]:
+        """Add many rumours at once, assigning them a contiguous block of IDs."""
+        with self._db.transaction() as conn:
+            first_id = int(self._next_id(len(records)))
+            added = [
+                {
+                    "rumourId": str(first_id + offset),
+                    "title": record["title"],
+                    "source": record.get("source", ""),
+                    "createdDate": record.get("createdDate") or date.today().isoformat(),
+                    "credibilityScore": record.get("credibilityScore", 0),
+                    "status": record.get("status", STATUS_NORMAL),
+                    "verified": None,
+                    "verifiedBy": None,
+                    "verifiedDate": None,
+                }
+                for offset, record in enumerate(records)
+            ]
+            conn.executemany(_insert_sql("rumours", RUMOUR_COLUMNS), (_rumour_values(rumour) for rumour in added))
+        for rumour in added:
+            self.changes.publish(RUMOUR_ADDED, rumour["rumourId"])
+        return added
+
+    def update_status(self, rumour_id: str, status: str, panic_since: Optional[str] = None) -> bool:
+        """Update the status of a rumour (``panic_since``: see ``RumourModel.update_status``)."""
+        with self._db.transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE rumours SET status = ?, panicSince = ? WHERE rumourId = ?", (status, panic_since, rumour_id)
+            )
+        if cursor.rowcount <= 0:
+            return False
+        self.changes.publish(STATUS_CHANGED, rumour_id)
+        return True
+
+    def update_verified(self, rumour_id: str, verified: bool, verified_by: str) -> bool:
+        """Update verification information for a rumour."""
+        with self._db.transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE rumours SET verified = ?, verifiedBy = ?, verifiedDate = ? WHERE rumourId = ?",
+                (int(verified), verified_by, date.today().isoformat(), rumour_id),
+            )
+        if cursor.rowcount <= 0:
+            return False
+        self.changes.publish(RUMOUR_VERIFIED, rumour_id)
+        return True
+
+    def is_verified(self, rumour: Dict) -> bool:
+        """Check if a rumour has been verified."""
+        return rumour.get("verified") is not None
+
+    def is_panic(self, rumour: Dict) -> bool:
+        """Check if a rumour is in panic status."""
+        return rumour.get("status") == STATUS_PANIC
+
+    def is_normal(self, rumour: Dict) -> bool:
+        """Check if a rumour is in normal status."""
+        return rumour.get("status") == STATUS_NORMAL
+
+    def query(
+        self,
+        status: Any = None,
+        verified: Any = ANY,
+        source: Any = None,
+        created_from: Optional[str] = None,
+        created_to: Optional[str] = None,
+        min_credibility: Optional[float] = None,
+        max_credibility: Optional[float] = None,
+    ) -> Iterator[Dict]:
+        """Rumours matching every given condition, streamed from the cursor (uses the column indexes)."""
+        where, params = _query_where(
+            RumourQuery(status, verified, source, created_from, created_to, min_credibility, max_credibility)
+        )
+        rows = self._db.connection().execute(f"SELECT * FROM rumours{where} ORDER BY rowid", params)
+        return (_rumour_from_row(row) for row in rows)
+
+    def get_sources(self) -> List[str]:
+        """Distinct rumour sources, most common first."""
+        rows = self._db.connection().execute(
+            "SELECT source FROM rumours WHERE source != '' GROUP BY source ORDER BY COUNT(*) DESC"
+        )
+        return [row[0] for row in rows]
+
+    def build_search_index(self, limit: Optional[int] = None) -> bool:
+        """Nothing to build: ``search()`` queries the table directly."""
+        return True
+
+    def search(self, query: str) -> SearchResults:
+        """Rumours whose title or source contains ``query`` (a table scan), title prefix matches first."""
+        text = normalize(query)
+        if len(text) < MIN_QUERY_CHARS:
+            return SearchResults([], self.get_by_id)
+        rows = self._db.connection().execute(
+            "SELECT rumourId, instr(lower(replace(title, ' ', '')), ?) AS pos FROM rumours"
+            " WHERE pos > 0 OR instr(lower(replace(source, ' ', '')), ?) > 0"
+            " ORDER BY CASE WHEN pos = 1 THEN 0 WHEN pos > 1 THEN 1 ELSE 2 END, rowid",
+            (text, text),
+        )
+        return SearchResults([row[0] for row in rows], self.get_by_id)
+
+    def _next_id(self, count: int = 1) -> str:
+        """Reserve ``count`` consecutive rumour IDs (inside a transaction) and return the first."""
+        return str(
+            _allocate_ids(
+                self._db.connection(),
+                "rumours",
+                count,
+                "SELECT MAX(CAST(rumourId AS INTEGER)) FROM rumours WHERE rumourId NOT GLOB '*[^0-9]*'",
+                floor=10000000,
+            )
+        )
+
+
+class SQLiteReportModel:
+    """Report model stored in SQLite."""
+
+    def __init__(self, database: SQLiteDatabase, windows: Sequence[float] = PANIC_WINDOW_SECONDS) -> None:
+        """Initialize the report model on a shared database (``windows``: see ``get_recent_report_counts``).
+
+        Reports added through this model are announced on ``changes`` (see ``Models.events``).
+        """
+        self._db = database
+        self._windows = tuple(windows)
+        self.changes = ChangeFeed()
+        # rowid ล่าสุดที่ refresh() เห็นแล้ว (ใช้หารายงานใหม่แบบ incremental)
+        row = database.connection().execute("SELECT MAX(rowid) FROM reports").fetchone()
+        self._seen_rowid = row[0] or 0
+
+    def save(self) -> None:
+        """Commit pending changes (each mutation already commits)."""
+        with self._db.write_lock:
+            self._db.connection().commit()
+
+    def batch(self) -> Iterator[sqlite3.Connection]:
+        """Group several new reports into a single transaction."""
+        return self._db.transaction()
+
+    def flush(self) -> None:
+        """Write pending changes to disk (SQLite commits every mutation)."""
+        self.save()
+
+    def write_cache(self) -> bool:
+        """Nothing to cache: the database is read on demand."""
+        return False
+
+    @property
+    def is_dirty(self) -> bool:
+        """Whether there are changes not yet written to disk."""
+        return False
+
+    def begin_flush(self) -> None:
+        """Nothing to write in the background: every mutation commits."""
+        return None
+
+    def end_flush(self, result: object) -> None:
+        """Counterpart of ``begin_flush()`` (never called, as it returns None)."""
+
+    def refresh(self) -> List[str]:
+        """Get the IDs of rumours that received reports since the last call (from any process)."""
+        rows = self._db.connection().execute(
+            "SELECT rowid, rumourId FROM reports WHERE rowid > ? ORDER BY rowid", (self._seen_rowid,)
+        ).fetchall()
+        if rows:
+            self._seen_rowid = rows[-1][0]
+        return list(dict.fromkeys(row[1] for row in rows))
+
+    def compact(self) -> None:
+        """Checkpoint the WAL file back into the main database."""
+        with self._db.write_lock:
+            self._db.connection().execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def get_all(self) -> List[Dict]:
+        """Get all reports."""
+        rows = self._db.connection().execute("SELECT * FROM reports ORDER BY rowid")
+        return [dict(row) for row in rows]
+
+    def view_all(self) -> Sequence[Dict]:
+        """All reports (read from the database into a list: rows are not kept in memory)."""
+        return self.get_all()
+
+    def iter_where(self, predicate: Callable[[Dict], bool]) -> Iterator[Dict]:
+        """Reports for which ``predicate`` is true, streamed from the cursor."""
+        rows = self._db.connection().execute("SELECT * FROM reports ORDER BY rowid")
+        return filter(predicate, map(dict, rows))
+
+    def get_report_counts(self) -> Mapping[str, int]:
+        """Get report counts for each rumour."""
+        rows = self._db.connection().execute("SELECT rumourId, count FROM report_counts")
+        return {row[0]: row[1] for row in rows}
+
+    def get_report_count(self, rumour_id: str) -> int:
+        """Get the number of reports for a single rumour."""
+        row = self._db.connection().execute(
+            "SELECT count FROM report_counts WHERE rumourId = ?", (rumour_id,)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def get_recent_report_counts(self, rumour_id: str) -> Tuple[int, ...]:
+        """Get the rumour's reports in each sliding time window (index on rumourId, reportDate)."""
+        now = time.time()
+        conn = self._db.connection()
+        return tuple(
+            conn.execute(
+                "SELECT COUNT(*) FROM reports WHERE rumourId = ? AND reportDate >= ?",
+                (rumour_id, datetime.fromtimestamp(now - window).isoformat(timespec="seconds")),
+            ).fetchone()[0]
+            for window in self._windows
+        )
+
+    def prune_recent(self) -> int:
+        """Nothing to free: recent counts are queried from the table."""
+        return 0
+
+    def has_report(self, reporter_id: str, rumour_id: str) -> bool:
+        """Check if a user has already reported a specific rumour."""
+        row = self._db.connection().execute(
+            "SELECT 1 FROM reports WHERE reporterId = ? AND rumourId = ? LIMIT 1", (reporter_id, rumour_id)
+        ).fetchone()
+        return row is not None
+
+    def add_report(self, reporter_id: str, rumour_id: str, report_type: str, description: str) -> Dict:
+        """Add a new report."""
+        with self._db.transaction() as conn:
+            new_report = {
+                "reportId": self._next_id(),
+                "reporterId": reporter_id,
+                "rumourId": rumour_id,
+                "reportDate": datetime.now().isoformat(timespec="seconds"),
+                "reportType": report_type,
+                "description": description,
+            }
+            # บันทึกรายงานและปรับตัวนับใน transaction เดียวกัน
+            conn.execute(_insert_sql("reports", REPORT_COLUMNS), [new_report[column] for column in REPORT_COLUMNS])
+            conn.execute(
+                "INSERT INTO report_counts (rumourId, count) VALUES (?, 1) "
+                "ON CONFLICT(rumourId) DO UPDATE SET count = count + 1",
+                (rumour_id,),
+            )
+        self.changes.publish(REPORT_ADDED, rumour_id)
+        return new_report
+
+    def add_reports(self, records: List[Dict]) -> List[Dict]:
+        """Add many reports at once, assigning them a contiguous block of IDs."""
+        with self._db.transaction() as conn:
+            first_id = int(self._next_id(len(records))[1:])
+            added = [
+                {
+                    "reportId": f"R{first_id + offset:04d}",
+                    "reporterId": record["reporterId"],
+                    "rumourId": record["rumourId"],
+                    "reportDate": normalize_report_date(record.get("reportDate"))
+                    or datetime.now().isoformat(timespec="seconds"),
+                    "reportType": record["reportType"],
+                    "description": record.get("description", ""),
+                }
+                for offset, record in enumerate(records)
+            ]
+            conn.executemany(
+                _insert_sql("reports", REPORT_COLUMNS),
+                ([report[column] for column in REPORT_COLUMNS] for report in added),
+            )
+            conn.executemany(
+                "INSERT INTO report_counts (rumourId, count) VALUES (?, 1) "
+                "ON CONFLICT(rumourId) DO UPDATE SET count = count + 1",
+                ((report["rumourId"],) for report in added),
+            )
+        for report in added:
+            self.changes.publish(REPORT_ADDED, report["rumourId"])
+        return added
+
+    def _next_id(self, count: int = 1) -> str:
+        """Reserve ``count`` consecutive report IDs (inside a transaction) and return the first."""
+        first = _allocate_ids(
+            self._db.connection(),
+            "reports",
+            count,
+            "SELECT MAX(CAST(substr(reportId, 2) AS INTEGER)) FROM reports "
+            "WHERE reportId GLOB 'R[0-9]*' AND substr(reportId, 2) NOT GLOB '*[^0-9]*'",
+        )
+        return f"R{first:04d}"
+
+
+class SQLiteUserModel:
+    """User model stored in SQLite."""
+
+    def __init__(self, database: SQLiteDatabase) -> None:
+        """Initialize the user model on a shared database."""
+        self._db = database
+
+    def get_all(self) -> List[Dict]:
+        """Get all users."""
+        return [dict(row) for row in self._db.connection().execute("SELECT * FROM users ORDER BY rowid")]
+
+    def get_by_id(self, user_id: str) -> Optional[Dict]:
+        """Get a user by ID."""
+        row = self._db.connection().execute("SELECT * FROM users WHERE userId = ?", (user_id,)).fetchone()
+        return dict(row) if row else None
+
+    def is_inspector(self, user_id: str) -> bool:
+        """Check if a user is an inspector."""
+        user = self.get_by_id(user_id)
+        if not user:
+            return False
+        return user.get("role") in {"ผู้ตรวจสอบ", "inspector"}
+
+
+def import_json_data(
+    database: SQLiteDatabase,
+    rumours: Iterable[Mapping],
+    reports: Iterable[Mapping],
+    users: Iterable[Mapping],
+) -> None:
+    """Bulk-load rumours, reports and users into an empty database."""
+    with database.transaction() as conn:
+        conn.executemany(_insert_sql("rumours", RUMOUR_COLUMNS), (_rumour_values(rumour) for rumour in rumours))
+        conn.executemany(
+            _insert_sql("reports", REPORT_COLUMNS),
+            ([report.get(column) for column in REPORT_COLUMNS] for report in reports),
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO report_counts (rumourId, count) "
+            "SELECT rumourId, COUNT(*) FROM reports GROUP BY rumourId"
+        )
+        conn.executemany(
+            _insert_sql("users", USER_COLUMNS), ([user.get(column) for column in USER_COLUMNS] for user in users)
+        )
+        # ID ที่นำเข้าไม่ได้ผ่านตัวนับ: ให้เริ่มนับใหม่ต่อจาก ID ที่สูงที่สุด
+        conn.execute("DELETE FROM id_counters")
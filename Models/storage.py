@@ -0,0 +1,219 @@
+"""Low-level file helpers shared by the JSON-backed models."""
+from __future__ import annotations
+
+import gc
+import json
+import os
+import re
+import stat
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, TextIO, Tuple
+
+import metrics
+
+try:  # POSIX
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+try:  # Windows
+    import msvcrt
+except ImportError:
+    msvcrt = None  # type: ignore[assignment]
+
+# (inode, mtime_ns, size): เปลี่ยนเมื่อไฟล์ถูกเขียนหรือถูกแทนที่ด้วย os.replace
+FileStamp = Tuple[int, int, int]
+
+NEW_FILE_MODE = 0o644  # สิทธิ์ของไฟล์ที่สร้างใหม่: process ของผู้ใช้อื่นที่ใช้ Data/ ร่วมกันอ่านได้
+READ_CHUNK_CHARS = 1 << 20  # ขนาดที่อ่านต่อครั้งเมื่ออ่าน JSON array ทีละรายการ
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def file_stamp(path: Path) -> Optional[FileStamp]:
+    """Version stamp of a file, or None if it does not exist."""
+    try:
+        info = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return info.st_ino, info.st_mtime_ns, info.st_size
+
+
+@contextmanager
+def gc_paused() -> Iterator[None]:
+    """Suspend the cyclic garbage collector while a file is loaded.
+
+    Building millions of records triggers a collection every few thousand
+    allocations, each scanning all records made so far; none of them can be
+    garbage, so the scans are skipped (records do not form cycles).
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+class FileLock:
+    """Advisory lock shared by every process using the same data file.
+
+    The lock is taken on a ``<name>.lock`` file next to the data file (the
+    data file itself is replaced on save, so it cannot carry the lock). It is
+    reentrant within one owner, so a locked save may call other locked
+    methods; it is not meant to be shared between threads. On platforms
+    without ``fcntl`` shared locks are exclusive.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Create a lock for ``path`` (the lock file is created on first use)."""
+        self.path = path.with_name(path.name + ".lock")
+        self._handle = None
+        self._depth = 0
+
+    def acquire(self, shared: bool = False, blocking: bool = True) -> bool:
+        """Take the lock; with ``blocking=False`` return False instead of waiting."""
+        if self._depth:
+            # ถือ lock อยู่แล้ว (เรียกซ้อนจากเมธอดที่ล็อกไว้)
+            self._depth += 1
+            return True
+        handle = open(self.path, "a+b")
+        try:
+            if fcntl is not None:
+                flags = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+                fcntl.flock(handle.fileno(), flags if blocking else flags | fcntl.LOCK_NB)
+            elif msvcrt is not None:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+        except OSError:
+            handle.close()
+            if blocking:
+                raise
+            return False
+        self._handle = handle
+        self._depth = 1
+        return True
+
+    def release(self) -> None:
+        """Release one level of the lock."""
+        self._depth -= 1
+        if not self._depth:
+            # ปิดไฟล์ = ปลด lock
+            self._handle.close()
+            self._handle = None
+
+    @contextmanager
+    def hold(self, shared: bool = False) -> Iterator[None]:
+        """Hold the lock: ``shared`` for reading, exclusive for writing."""
+        self.acquire(shared)
+        try:
+            yield
+        finally:
+            self.release()
+
+
+def _file_mode(path: Path) -> int:
+    """Permission bits of ``path``, or ``NEW_FILE_MODE`` if it does not exist."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return NEW_FILE_MODE
+
+
+def atomic_write_json(
+    path: Path, data: Any, indent: int = 2, default: Optional[Callable[[Any], Any]] = None
+) -> int:
+    """Write ``data`` as JSON to ``path`` without ever leaving a truncated file.
+
+    The data is written to a temporary file in the same directory, flushed and
+    fsynced, then moved over the target with ``os.replace``. The target keeps
+    its permissions (a new file gets ``NEW_FILE_MODE``). ``default`` is
+    passed to ``json.dump`` for objects it cannot serialize itself. Returns
+    the number of bytes written.
+    """
+    # เขียนลงไฟล์ชั่วคราวก่อน แล้วค่อยแทนที่ไฟล์จริงในครั้งเดียว
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    try:
+        with metrics.timer("file_write", file=path.name):
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(data, handle, ensure_ascii=False, indent=indent, default=default)
+                handle.flush()
+                os.fsync(handle.fileno())
+                size = os.fstat(handle.fileno()).st_size
+            # mkstemp สร้างไฟล์เป็น 0600 และ os.replace จะใช้สิทธิ์นั้นแทนของไฟล์เดิม
+            os.chmod(tmp_name, _file_mode(path))
+            os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    metrics.inc("bytes_written", size, file=path.name)
+    return size
+
+
+def iter_json_array(
+    handle: TextIO,
+    object_hook: Optional[Callable[[dict], Any]] = None,
+    chunk_chars: int = READ_CHUNK_CHARS,
+) -> Iterator[Any]:
+    """Yield the items of the JSON array in ``handle`` one at a time.
+
+    The file is read ``chunk_chars`` characters at a time and each item is
+    decoded with ``JSONDecoder.raw_decode``, so memory stays at about one
+    chunk plus one item however long the array is. An empty file counts as
+    an empty array; malformed JSON raises ``json.JSONDecodeError``.
+    """
+    decoder = json.JSONDecoder(object_hook=object_hook)
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def skip() -> bool:
+        """Move ``pos`` past whitespace, reading more as needed; return False at end of file."""
+        nonlocal buffer, pos, eof
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos < len(buffer):
+                return True
+            if eof:
+                return False
+            buffer = handle.read(chunk_chars)
+            pos = 0
+            eof = not buffer
+
+    if not skip():
+        return
+    if buffer[pos] != "[":
+        raise json.JSONDecodeError("Expecting '['", buffer, pos)
+    pos += 1
+    if skip() and buffer[pos] == "]":
+        return
+    while True:
+        if not skip():
+            raise json.JSONDecodeError("Unterminated array", buffer, pos)
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+            # ค่าที่จบพอดีท้าย buffer อาจถูกตัด (เช่นตัวเลข) ต้องอ่านต่อก่อนจึงจะแน่ใจ
+            complete = end < len(buffer) or eof
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            complete = False
+        if not complete:
+            more = handle.read(chunk_chars)
+            eof = not more
+            buffer = buffer[pos:] + more
+            pos = 0
+            continue
+        yield item
+        pos = end
+        if not skip():
+            raise json.JSONDecodeError("Unterminated array", buffer, pos)
+        if buffer[pos] == "]":
+            return
+        if buffer[pos] != ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+        pos += 1
@@ -4,6 +4,8 @@ import json
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import metrics
+
 
 class UserModel:
     """Model for managing user data."""
@@ -12,23 +14,28 @@ class UserModel:
         """Initialize the user model with data file path."""
         self._data_path = data_path
         self._users: List[Dict] = []
+        # ดัชนี userId -> user สำหรับค้นหาแบบ O(1)
+        self._index: Dict[str, Dict] = {}
         self._load()
 
+    @metrics.timed("model_load", model="users")
     def _load(self) -> None:
         """Load users from JSON file."""
         if not self._data_path.exists():
             self._users = []
-            return
-        with self._data_path.open("r", encoding="utf-8") as handle:
-            self._users = json.load(handle)
+        else:
+            with self._data_path.open("r", encoding="utf-8") as handle:
+                self._users = json.load(handle)
+        self._index = {user.get("userId"): user for user in self._users}
+
+    def get_all(self) -> List[Dict]:
+        """Get all users."""
+        return list(self._users)
 
     def get_by_id(self, user_id: str) -> Optional[Dict]:
         """Get a user by ID."""
         # ค้นหา user จาก ID
-        for user in self._users:
-            if user.get("userId") == user_id:
-                return user
-        return None
+        return self._index.get(user_id)
 
     def is_inspector(self, user_id: str) -> bool:
         """Check if a user is an inspector."""
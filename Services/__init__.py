@@ -0,0 +1,8 @@
+# Services Package
+# ตรรกะการทำงานที่ไม่ผูกกับ UI (ใช้ร่วมกันระหว่าง Tkinter controller และ HTTP API)
+
+from .rumour_service import RumourService, ServiceError
+from .http_api import RumourAPIServer
+from .io_worker import IOWorker
+
+__all__ = ['RumourService', 'ServiceError', 'RumourAPIServer', 'IOWorker']
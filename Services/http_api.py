@@ -0,0 +1,500 @@
+"""Minimal HTTP/JSON API over RumourService (standard library asyncio only).
+
+Reads (rumour list, detail, summary) run concurrently in the default thread
+pool while holding the read side of a read/write lock. Writes (reports,
+verifications) run one at a time on a dedicated single-thread executor while
+holding the write side, so the JSON models never see a write racing a read.
+Clients log in with ``POST /login`` and pass ``Authorization: Bearer <token>``.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import itertools
+import json
+import re
+import secrets
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date
+from http import HTTPStatus
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import metrics
+from config import (
+    METRICS_DUMP_INTERVAL_MS,
+    METRICS_PATH,
+    PANIC_COOLDOWN_CHECK_MS,
+    RUMOUR_SAVE_INTERVAL_MS,
+    RUMOUR_WRITE_BEHIND,
+    SYNC_INTERVAL_MS,
+)
+from Models.records import record_to_json
+from Models.search_index import MIN_QUERY_CHARS, is_searchable
+
+from .rumour_service import RumourService, ServiceError
+
+MAX_BODY_BYTES = 1024 * 1024
+MAX_HEADER_LINES = 100
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+# ค่าของพารามิเตอร์ ?verified=
+VERIFIED_PARAMS = {"true": True, "false": False, "none": None}
+# field ของผู้ใช้ที่ส่งกลับตอน login (ไม่รวม password)
+PUBLIC_USER_FIELDS = ("userId", "name", "role")
+
+# ประเภทข้อผิดพลาดของ service -> HTTP status
+ERROR_STATUS = {
+    "auth": HTTPStatus.UNAUTHORIZED,
+    "not_found": HTTPStatus.NOT_FOUND,
+    "forbidden": HTTPStatus.FORBIDDEN,
+    "invalid": HTTPStatus.BAD_REQUEST,
+    "conflict": HTTPStatus.CONFLICT,
+}
+
+Response = Tuple[int, Any]
+
+
+class HTTPError(Exception):
+    """An error that maps directly to an HTTP response."""
+
+    def __init__(self, status: int, message: str) -> None:
+        """Create an error with an HTTP status code."""
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class ReadWriteLock:
+    """Many concurrent readers or one writer; waiting writers block new readers."""
+
+    def __init__(self) -> None:
+        """Create an unlocked lock."""
+        self._cond = threading.Condition()
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    @contextmanager
+    def read_locked(self) -> Iterator[None]:
+        """Hold the lock for reading."""
+        with self._cond:
+            while self._writer or self._waiting_writers:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write_locked(self) -> Iterator[None]:
+        """Hold the lock exclusively for writing."""
+        with self._cond:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+
+class Request:
+    """A parsed HTTP request."""
+
+    __slots__ = ("method", "path", "query", "headers", "body")
+
+    def __init__(self, method: str, target: str, headers: Dict[str, str], body: bytes) -> None:
+        """Split the request target into path and query parameters."""
+        parts = urlsplit(target)
+        self.method = method
+        self.path = parts.path.rstrip("/") or "/"
+        self.query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        self.headers = headers
+        self.body = body
+
+    def json(self) -> Dict:
+        """Decode the body as a JSON object (an empty body is ``{}``)."""
+        if not self.body:
+            return {}
+        try:
+            data = json.loads(self.body)
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Body must be valid JSON")
+        if not isinstance(data, dict):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Body must be a JSON object")
+        return data
+
+    @property
+    def keep_alive(self) -> bool:
+        """Whether the client wants to reuse the connection."""
+        return self.headers.get("connection", "").lower() != "close"
+
+
+class RumourAPIServer:
+    """HTTP/1.1 JSON server exposing the rumour workflow to many clients."""
+
+    def __init__(self, service: RumourService, host: str = "127.0.0.1", port: int = 8000) -> None:
+        """Create a server for ``service``; call ``start()`` inside an event loop."""
+        self.service = service
+        self.host = host
+        self.port = port
+        self._sessions: Dict[str, str] = {}  # token -> userId
+        self._lock = ReadWriteLock()
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="api-write")
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._sync_task: Optional[asyncio.Task] = None
+        self._metrics_task: Optional[asyncio.Task] = None
+        self._cool_down_task: Optional[asyncio.Task] = None
+        # (method, pattern, handler, mode) โดย mode คือ "read", "write" หรือ "session"
+        self._routes: List[Tuple[str, re.Pattern, Callable[..., Response], str]] = [
+            ("POST", re.compile(r"/login"), self._login, "session"),
+            ("POST", re.compile(r"/logout"), self._logout, "session"),
+            ("GET", re.compile(r"/rumours"), self._list_rumours, "read"),
+            ("GET", re.compile(r"/rumours/(?P<rumour_id>[^/]+)"), self._get_rumour, "read"),
+            ("POST", re.compile(r"/rumours/(?P<rumour_id>[^/]+)/reports"), self._submit_report, "write"),
+            ("POST", re.compile(r"/reports/bulk"), self._submit_reports, "write"),
+            ("POST", re.compile(r"/rumours/(?P<rumour_id>[^/]+)/verify"), self._verify_rumour, "write"),
+            ("POST", re.compile(r"/verifications/bulk"), self._verify_rumours, "write"),
+            ("GET", re.compile(r"/summary"), self._get_summary, "read"),
+        ]
+        # สร้างลำดับข่าวลือ ดัชนีค้นหา และดัชนีรอง (get_sources สร้างให้) ก่อนเปิดรับคำขอ
+        # เพื่อไม่ให้ผู้อ่านพร้อมกันสร้างซ้ำ
+        service.get_ranking()
+        service.rumour_model.build_search_index()
+        service.get_sources()
+
+    async def start(self) -> None:
+        """Start listening; ``self.port`` is updated when port 0 was requested."""
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        if RUMOUR_WRITE_BEHIND:
+            self._flush_task = asyncio.ensure_future(self._flush_periodically())
+        if SYNC_INTERVAL_MS:
+            self._sync_task = asyncio.ensure_future(self._sync_periodically())
+        if PANIC_COOLDOWN_CHECK_MS:
+            self._cool_down_task = asyncio.ensure_future(self._cool_down_periodically())
+        if metrics.is_enabled():
+            self._metrics_task = asyncio.ensure_future(self._dump_metrics_periodically())
+
+    async def serve_forever(self) -> None:
+        """Start the server and run until cancelled."""
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop accepting connections and write any pending changes."""
+        for task in (self._flush_task, self._sync_task, self._metrics_task, self._cool_down_task):
+            if task:
+                task.cancel()
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+        await self._run("write", self.service.rumour_model.flush)
+        # ให้การเริ่มครั้งถัดไปอ่านจาก cache แทนการ parse JSON
+        for model in (self.service.rumour_model, self.service.report_model):
+            await self._run("write", model.write_cache)
+        self._writer.shutdown(wait=True)
+        if metrics.is_enabled():
+            metrics.dump(METRICS_PATH)
+
+    async def _flush_periodically(self) -> None:
+        """Write pending rumour changes every save interval (write-behind mode)."""
+        while True:
+            await asyncio.sleep(RUMOUR_SAVE_INTERVAL_MS / 1000)
+            await self._run("write", self.service.rumour_model.flush)
+
+    async def _sync_periodically(self) -> None:
+        """Merge changes saved by other processes sharing the data files."""
+        while True:
+            await asyncio.sleep(SYNC_INTERVAL_MS / 1000)
+            await self._run("write", self.service.sync)
+
+    async def _cool_down_periodically(self) -> None:
+        """Return panic rumours that are no longer reported fast to normal."""
+        while True:
+            await asyncio.sleep(PANIC_COOLDOWN_CHECK_MS / 1000)
+            await self._run("write", self.service.cool_down)
+
+    async def _dump_metrics_periodically(self) -> None:
+        """Write the metrics file every dump interval."""
+        while True:
+            await asyncio.sleep(METRICS_DUMP_INTERVAL_MS / 1000)
+            try:
+                metrics.dump(METRICS_PATH)
+            except OSError as exc:
+                print(f"Writing metrics failed: {exc!r}", file=sys.stderr)
+
+    async def _run(self, mode: str, func: Callable[..., Response], *args: Any) -> Any:
+        """Run a handler off the event loop under the matching side of the lock."""
+        loop = asyncio.get_running_loop()
+        if mode == "write":
+            return await loop.run_in_executor(self._writer, self._locked, self._lock.write_locked, func, args)
+        if mode == "read":
+            return await loop.run_in_executor(None, self._locked, self._lock.read_locked, func, args)
+        return func(*args)
+
+    @staticmethod
+    def _locked(lock: Callable, func: Callable[..., Response], args: Tuple) -> Any:
+        """Call ``func`` while holding ``lock``."""
+        with lock():
+            return func(*args)
+
+    # ----- HTTP plumbing -----
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve requests on one keep-alive connection."""
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except HTTPError as exc:
+                    await self._write_response(writer, exc.status, {"error": exc.message}, keep_alive=False)
+                    break
+                if request is None:
+                    break
+                status, payload = await self._dispatch(request)
+                await self._write_response(writer, status, payload, request.keep_alive)
+                if not request.keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Request]:
+        """Read one request, or None when the client closed the connection."""
+        request_line = await reader.readline()
+        if not request_line:
+            return None
+        try:
+            method, target, _ = request_line.decode("latin-1").split(" ", 2)
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed request line")
+
+        headers: Dict[str, str] = {}
+        for _ in range(MAX_HEADER_LINES):
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        else:
+            raise HTTPError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Too many headers")
+
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+        if length > MAX_BODY_BYTES:
+            raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large")
+        body = await reader.readexactly(length) if length > 0 else b""
+        return Request(method.upper(), target, headers, body)
+
+    async def _dispatch(self, request: Request) -> Response:
+        """Route a request and turn service errors into HTTP errors."""
+        allowed = False
+        for method, pattern, handler, mode in self._routes:
+            match = pattern.fullmatch(request.path)
+            if not match:
+                continue
+            allowed = True
+            if method != request.method:
+                continue
+            try:
+                user_id = self._session_user(request) if mode != "session" else None
+                # เวลารวมการรอ lock ด้วย (เวลาที่ client รอจริง)
+                with metrics.timer("http_request", route=handler.__name__.lstrip("_")):
+                    return await self._run(mode, functools.partial(handler, **match.groupdict()), request, user_id)
+            except HTTPError as exc:
+                return exc.status, {"error": exc.message}
+            except ServiceError as exc:
+                return ERROR_STATUS.get(exc.kind, HTTPStatus.BAD_REQUEST), {"error": exc.message}
+        if allowed:
+            return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "Method not allowed"}
+        return HTTPStatus.NOT_FOUND, {"error": "Not found"}
+
+    async def _write_response(self, writer: asyncio.StreamWriter, status: int, payload: Any, keep_alive: bool) -> None:
+        """Send a JSON response."""
+        body = json.dumps(payload, ensure_ascii=False, default=record_to_json).encode("utf-8")
+        status = HTTPStatus(status)
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+    def _session_user(self, request: Request) -> Optional[str]:
+        """Get the user of the request's bearer token (None if not logged in)."""
+        scheme, _, token = request.headers.get("authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            return None
+        return self._sessions.get(token.strip())
+
+    # ----- Handlers (run in executor threads, except session handlers) -----
+
+    def _login(self, request: Request, _user_id: None) -> Response:
+        """Start a session for an existing user."""
+        user_id = request.json().get("userId")
+        user = self.service.validate_user(user_id) if isinstance(user_id, str) else None
+        if not user:
+            raise ServiceError("auth", "User ID not found")
+        token = secrets.token_urlsafe(24)
+        self._sessions[token] = user_id
+        public_user = {name: user[name] for name in PUBLIC_USER_FIELDS if name in user}
+        return HTTPStatus.OK, {"token": token, "user": public_user, "inspector": self.service.is_inspector(user_id)}
+
+    def _logout(self, request: Request, _user_id: None) -> Response:
+        """End the caller's session."""
+        _, _, token = request.headers.get("authorization", "").partition(" ")
+        self._sessions.pop(token.strip(), None)
+        return HTTPStatus.OK, {"ok": True}
+
+    def _list_rumours(self, request: Request, _user_id: Optional[str]) -> Response:
+        """One page of the ranked rumour list, or of the search results for ``?q=``.
+
+        Filters (``status``, ``verified``, ``source``, ``created_from``,
+        ``created_to``, ``min_credibility``, ``max_credibility``) narrow the
+        list down using the model's secondary indexes.
+        """
+        offset = self._int_param(request, "offset", 0)
+        limit = min(self._int_param(request, "limit", DEFAULT_PAGE_SIZE), MAX_PAGE_SIZE)
+        query = request.query.get("q", "").strip()
+        criteria = self._query_params(request)
+        if query:
+            if not is_searchable(query):
+                raise HTTPError(HTTPStatus.BAD_REQUEST, f"q must be at least {MIN_QUERY_CHARS} characters")
+            # ผลค้นหาจัดอันดับเฉพาะส่วนที่อ่าน: อ่านหน้าที่ขอก่อน แล้วนับทั้งหมดโดยไม่จัดอันดับ
+            rumours = self.service.search(query, **criteria)
+            page = rumours[offset : offset + limit]
+            total = len(rumours)
+        elif criteria:
+            # ผลของ query เป็น stream: เลื่อนไปหน้าที่ขอด้วย islice แล้วนับส่วนที่เหลือ ไม่สร้าง list ทั้งชุด
+            matches = self.service.query(**criteria)
+            skipped = sum(1 for _ in itertools.islice(matches, offset))
+            page = list(itertools.islice(matches, limit))
+            total = skipped + len(page) + sum(1 for _ in matches)
+        else:
+            rumours = self.service.get_ranking()
+            total = len(rumours)
+            page = rumours[offset : offset + limit]
+        counts = self.service.get_report_counts()
+        items = [self._with_count(rumour, counts) for rumour in page]
+        return HTTPStatus.OK, {"total": total, "offset": offset, "items": items}
+
+    def _get_rumour(self, _request: Request, _user_id: Optional[str], rumour_id: str) -> Response:
+        """One rumour with its report count."""
+        rumour = self.service.get_rumour(rumour_id)
+        if not rumour:
+            raise ServiceError("not_found", "Rumour not found")
+        return HTTPStatus.OK, self._with_count(rumour, self.service.get_report_counts())
+
+    def _get_summary(self, request: Request, _user_id: Optional[str]) -> Response:
+        """Rumours of each summary bucket, optionally narrowed by the ``source`` and range filters."""
+        counts = self.service.get_report_counts()
+        criteria = self._query_params(request)
+        for name in ("status", "verified"):
+            # หมวดหน้าสรุปกำหนด status / verified เอง
+            if name in criteria:
+                raise HTTPError(HTTPStatus.BAD_REQUEST, f"{name} cannot be used with /summary")
+        summary = self.service.get_summary(**criteria)
+        return HTTPStatus.OK, {
+            name: [self._with_count(rumour, counts) for rumour in rumours] for name, rumours in summary.items()
+        }
+
+    def _submit_report(self, request: Request, user_id: Optional[str], rumour_id: str) -> Response:
+        """Report one rumour."""
+        data = request.json()
+        report = self.service.submit_report(
+            user_id, rumour_id, str(data.get("reportType") or ""), str(data.get("description") or "")
+        )
+        return HTTPStatus.CREATED, report
+
+    def _submit_reports(self, request: Request, user_id: Optional[str]) -> Response:
+        """Report many rumours; one result per item."""
+        if not user_id:
+            raise ServiceError("auth", "Please login first")
+        items = [(str(item.get("rumourId")), str(item.get("reportType") or "")) for item in self._items(request)]
+        return HTTPStatus.OK, {"results": self.service.submit_reports(user_id, items)}
+
+    def _verify_rumour(self, request: Request, user_id: Optional[str], rumour_id: str) -> Response:
+        """Verify one rumour (inspectors only)."""
+        decision = str(request.json().get("decision") or "")
+        return HTTPStatus.OK, self.service.verify_rumour(user_id, rumour_id, decision)
+
+    def _verify_rumours(self, request: Request, user_id: Optional[str]) -> Response:
+        """Verify many rumours; one result per item."""
+        if not user_id:
+            raise ServiceError("auth", "Please login first")
+        items = [(str(item.get("rumourId")), str(item.get("decision") or "")) for item in self._items(request)]
+        return HTTPStatus.OK, {"results": self.service.verify_rumours(user_id, items)}
+
+    # ----- Helpers -----
+
+    @staticmethod
+    def _int_param(request: Request, name: str, default: int) -> int:
+        """Read a non-negative integer query parameter."""
+        try:
+            value = int(request.query.get(name, default))
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"{name} must be an integer")
+        if value < 0:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"{name} must not be negative")
+        return value
+
+    @staticmethod
+    def _query_params(request: Request) -> Dict[str, Any]:
+        """Read the rumour filter parameters into keyword arguments for ``RumourService.query``."""
+        params = request.query
+        criteria: Dict[str, Any] = {}
+        for name in ("status", "source"):
+            if params.get(name):
+                criteria[name] = params[name]
+        if "verified" in params:
+            if params["verified"] not in VERIFIED_PARAMS:
+                raise HTTPError(HTTPStatus.BAD_REQUEST, "verified must be true, false or none")
+            criteria["verified"] = VERIFIED_PARAMS[params["verified"]]
+        for name in ("created_from", "created_to"):
+            if params.get(name):
+                try:
+                    criteria[name] = date.fromisoformat(params[name]).isoformat()
+                except ValueError:
+                    raise HTTPError(HTTPStatus.BAD_REQUEST, f"{name} must be a date (YYYY-MM-DD)")
+        for name in ("min_credibility", "max_credibility"):
+            if params.get(name):
+                try:
+                    criteria[name] = float(params[name])
+                except ValueError:
+                    raise HTTPError(HTTPStatus.BAD_REQUEST, f"{name} must be a number")
+        return criteria
+
+    @staticmethod
+    def _items(request: Request) -> List[Dict]:
+        """The ``items`` array of a bulk request body."""
+        items = request.json().get("items")
+        if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "items must be a list of objects")
+        return items
+
+    @staticmethod
+    def _with_count(rumour, counts) -> Dict:
+        """A rumour as a plain dict plus its report count."""
+        data = dict(rumour)
+        data["reportCount"] = counts.get(data.get("rumourId"), 0)
+        return data
@@ -0,0 +1,84 @@
+"""Background thread for disk writes, polled from the UI thread."""
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Any, Callable, List, Optional, Tuple
+
+Callback = Callable[[Any, Optional[BaseException]], None]
+
+
+class IOWorker:
+    """Runs jobs on one background thread and hands results back on ``poll()``.
+
+    ``submit()`` never blocks: it refuses new jobs once ``max_pending`` are
+    queued or running, so callers keep their changes in memory and write
+    them together later (back-pressure by coalescing). Callbacks run inside
+    ``poll()``, i.e. on whichever thread polls (the Tk thread via
+    ``root.after``), never on the worker thread.
+    """
+
+    def __init__(self, max_pending: int = 2) -> None:
+        """Start the worker thread."""
+        self.max_pending = max_pending
+        self._jobs: "queue.Queue[Optional[Tuple[Callable[[], Any], Callback]]]" = queue.Queue()
+        self._done: "queue.Queue[Tuple[Callback, Any, Optional[BaseException]]]" = queue.Queue()
+        self._pending = 0
+        self._thread = threading.Thread(target=self._run, name="io-worker", daemon=True)
+        self._thread.start()
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs queued or running whose callbacks have not run yet."""
+        return self._pending
+
+    @property
+    def has_capacity(self) -> bool:
+        """Whether ``submit()`` would accept another job."""
+        return self._pending < self.max_pending
+
+    def submit(self, job: Callable[[], Any], callback: Callback) -> bool:
+        """Queue ``job``; ``callback(result, error)`` runs on a later ``poll()``. False if full."""
+        if not self.has_capacity:
+            return False
+        self._pending += 1
+        self._jobs.put((job, callback))
+        return True
+
+    def poll(self, timeout: Optional[float] = None) -> int:
+        """Run callbacks of finished jobs; wait up to ``timeout`` for the first one. Returns how many ran."""
+        finished: List[Tuple[Callback, Any, Optional[BaseException]]] = []
+        try:
+            if timeout is not None and self._pending:
+                finished.append(self._done.get(timeout=timeout))
+            while True:
+                finished.append(self._done.get_nowait())
+        except queue.Empty:
+            pass
+        for callback, result, error in finished:
+            self._pending -= 1
+            callback(result, error)
+        return len(finished)
+
+    def drain(self) -> None:
+        """Wait for every queued job and run its callback (used at shutdown)."""
+        while self._pending:
+            self.poll(timeout=0.1)
+
+    def close(self) -> None:
+        """Finish outstanding jobs and stop the thread."""
+        self.drain()
+        self._jobs.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        """Worker loop: run jobs in order and queue their outcome."""
+        while True:
+            item = self._jobs.get()
+            if item is None:
+                return
+            job, callback = item
+            try:
+                self._done.put((callback, job(), None))
+            except BaseException as exc:  # ส่งข้อผิดพลาดกลับไปให้ thread หลักจัดการ
+                self._done.put((callback, None, exc))
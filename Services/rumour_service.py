@@ -0,0 +1,304 @@
+"""UI-free business flow shared by the Tk controller and the HTTP API."""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from business_rules import (
+    REPORT_TYPES,
+    STATUS_NORMAL,
+    STATUS_PANIC,
+    SUMMARY_BUCKETS,
+    SUMMARY_PANIC,
+    SUMMARY_VERIFIED_FALSE,
+    SUMMARY_VERIFIED_TRUE,
+    can_accept_report,
+    can_verify_rumour,
+    should_end_panic,
+    should_trigger_panic_window,
+)
+from Models import RankingIndex, RumourQuery, SearchResults
+
+# เงื่อนไข query ของแต่ละหมวดหน้าสรุป (ใช้เมื่อหน้าสรุปถูกกรองเพิ่ม)
+SUMMARY_QUERIES: Dict[str, Dict[str, Any]] = {
+    SUMMARY_PANIC: {"status": STATUS_PANIC},
+    SUMMARY_VERIFIED_TRUE: {"verified": True},
+    SUMMARY_VERIFIED_FALSE: {"verified": False},
+}
+
+
+class ServiceError(Exception):
+    """A request that the business rules reject.
+
+    ``kind`` is one of "auth", "not_found", "forbidden", "invalid" or
+    "conflict"; ``level`` says whether the UI should show it as an error or
+    a warning.
+    """
+
+    ERROR_KINDS = {"auth", "not_found"}
+
+    def __init__(self, kind: str, message: str) -> None:
+        """Create an error of the given kind."""
+        super().__init__(message)
+        self.kind = kind
+        self.message = message
+
+    @property
+    def level(self) -> str:
+        """"error" or "warning" (how the desktop UI presents it)."""
+        return "error" if self.kind in self.ERROR_KINDS else "warning"
+
+
+class RumourService:
+    """Validation and mutations for rumours, reports and verifications.
+
+    The service holds no UI state and no "current user": every call names
+    the acting user, so one instance can serve many sessions.
+    """
+
+    def __init__(self, rumour_model, report_model, user_model) -> None:
+        """Create the service on top of the three models."""
+        self.rumour_model = rumour_model
+        self.report_model = report_model
+        self.user_model = user_model
+        # ลำดับข่าวลือ (สร้างครั้งแรกเมื่อมีการเรียกใช้ แล้วปรับทีละรายการ)
+        self._ranking: Optional[RankingIndex] = None
+
+    # ----- Queries -----
+
+    def validate_user(self, user_id: str) -> Optional[Dict]:
+        """Get a user by ID, or None if not found."""
+        return self.user_model.get_by_id(user_id)
+
+    def is_inspector(self, user_id: Optional[str]) -> bool:
+        """Check if a user is an inspector."""
+        if not user_id:
+            return False
+        return self.user_model.is_inspector(user_id)
+
+    def get_rumour(self, rumour_id: str) -> Optional[Dict]:
+        """Get a rumour by ID, or None if not found."""
+        return self.rumour_model.get_by_id(rumour_id)
+
+    def get_report_counts(self) -> Mapping[str, int]:
+        """Get report counts for each rumour."""
+        return self.report_model.get_report_counts()
+
+    def get_ranking(self) -> RankingIndex:
+        """Get the rumour ranking (report count, credibility score), building it on first use."""
+        if self._ranking is None:
+            self._ranking = RankingIndex.build(
+                self.rumour_model.view_all(),
+                self.report_model.get_report_counts(),
+                self.rumour_model.get_by_id,
+            )
+        return self._ranking
+
+    def search(self, query: str, **criteria: Any) -> Sequence[Dict]:
+        """Rumours whose title or source contains ``query``, best matches first (read lazily).
+
+        Extra keyword conditions (as for ``query()``) narrow the hits down.
+        """
+        results = self.rumour_model.search(query)
+        if not criteria:
+            return results
+        matches = RumourQuery(**criteria).matches
+        # กรองตามลำดับที่อ่าน (len() ต้องอ่านผลทั้งหมด)
+        hits = (rumour.get("rumourId") for rumour in results if matches(rumour))
+        return SearchResults(hits, self.rumour_model.get_by_id)
+
+    def query(self, **criteria: Any) -> Iterator[Dict]:
+        """Rumours matching every condition (status, verified, source, date and credibility ranges), streamed."""
+        return self.rumour_model.query(**criteria)
+
+    def get_sources(self) -> List[str]:
+        """Distinct rumour sources, most common first."""
+        return self.rumour_model.get_sources()
+
+    def get_summary(self, **criteria: Any) -> Dict[str, Iterator[Dict]]:
+        """Get the rumours of each summary bucket (panic, verified true, verified false), streamed.
+
+        Each bucket is an iterator to be read once. With conditions (e.g.
+        ``source`` or a date range) each bucket is narrowed down with a
+        query instead of being read whole.
+        """
+        if criteria:
+            return {
+                name: self.rumour_model.query(**{**criteria, **SUMMARY_QUERIES[name]})
+                for name in SUMMARY_BUCKETS
+            }
+        return {name: self.rumour_model.iter_bucket(name) for name in SUMMARY_BUCKETS}
+
+    # ----- Validation -----
+
+    def check_report(self, user_id: Optional[str], rumour_id: str, report_type: str) -> Optional[ServiceError]:
+        """Validate a report; return the reason it cannot be accepted, if any."""
+        # ตรวจสอบว่าผู้ใช้ได้เข้าสู่ระบบแล้วหรือไม่
+        if not user_id:
+            return ServiceError("auth", "Please login first")
+
+        # ตรวจสอบความถูกต้องของ rumour_id
+        rumour = self.get_rumour(rumour_id)
+        if not rumour:
+            return ServiceError("not_found", "Rumour not found")
+
+        # ตรวจสอบว่าข่าวลือสามารถรับรายงาน
+        is_verified = self.rumour_model.is_verified(rumour)
+        user_reported = self.report_model.has_report(user_id, rumour_id)
+        if not can_accept_report(rumour, user_reported, is_verified):
+            if is_verified:
+                return ServiceError("conflict", "Verified rumours cannot be reported")
+            return ServiceError("conflict", "You already reported this rumour")
+
+        if not report_type:
+            return ServiceError("invalid", "Report type is required")
+        if report_type not in REPORT_TYPES:
+            return ServiceError("invalid", f"Unknown report type: {report_type}")
+        return None
+
+    def check_verification(self, user_id: Optional[str], rumour_id: str, decision: str) -> Optional[ServiceError]:
+        """Validate a verification; return the reason it cannot be applied, if any."""
+        # ตรวจสอบว่า user ได้เข้าสู่ระบบหรือไม่
+        if not user_id:
+            return ServiceError("auth", "Please login first")
+
+        # ตรวจสอบว่าผู้ใช้สามารถยืนยันข่าวลือได้หรือไม่
+        if not can_verify_rumour({}, self.is_inspector(user_id)):
+            return ServiceError("forbidden", "Only inspectors can verify rumours")
+
+        # ตรวจสอบว่าเลือกผลลัพธ์หรือไม่
+        if decision not in {"true", "false"}:
+            return ServiceError("invalid", "Select a verification result")
+
+        # ตรวจสอบความถูกต้องของ rumour_id
+        if not self.get_rumour(rumour_id):
+            return ServiceError("not_found", "Rumour not found")
+        return None
+
+    # ----- Mutations -----
+
+    def submit_report(self, user_id: Optional[str], rumour_id: str, report_type: str, description: str) -> Dict:
+        """Submit one report; raise ServiceError if the rules reject it.
+
+        The rules are checked inside the models' batches, after other
+        processes' reports are merged under the file lock, so two processes
+        cannot both store the same reporter's report on one rumour.
+        """
+        with self.rumour_model.batch():
+            with self.report_model.batch():
+                problem = self.check_report(user_id, rumour_id, report_type)
+                if problem:
+                    raise problem
+                report = self.report_model.add_report(user_id, rumour_id, report_type, description)
+            # ปรับลำดับ และตรวจสอบว่าควรเปลี่ยนสถานะเป็น panic หรือไม่
+            self.refresh_after_reports([rumour_id])
+        return report
+
+    def submit_reports(self, user_id: Optional[str], items: Iterable[Tuple[str, str]]) -> List[Dict]:
+        """Submit many (rumourId, reportType) reports with one save and one panic pass.
+
+        Returns one result dict per item: ``{"rumourId", "ok", "message"}``.
+        """
+        results: List[Dict] = []
+        reported: List[str] = []
+        with self.rumour_model.batch():
+            with self.report_model.batch():
+                for rumour_id, report_type in items:
+                    problem = self.check_report(user_id, rumour_id, report_type)
+                    if problem:
+                        results.append({"rumourId": rumour_id, "ok": False, "message": problem.message})
+                        continue
+                    self.report_model.add_report(user_id, rumour_id, report_type, "")
+                    reported.append(rumour_id)
+                    results.append({"rumourId": rumour_id, "ok": True, "message": "Report submitted"})
+            # ประเมินสถานะ panic ครั้งเดียว หลังบันทึกรายงาน (จำนวนรวมรายงานจาก process อื่นแล้ว)
+            self.refresh_after_reports(dict.fromkeys(reported))
+        return results
+
+    def verify_rumour(self, user_id: Optional[str], rumour_id: str, decision: str) -> Dict:
+        """Verify one rumour as an inspector; raise ServiceError if the rules reject it."""
+        problem = self.check_verification(user_id, rumour_id, decision)
+        if problem:
+            raise problem
+        if not self.rumour_model.update_verified(rumour_id, decision == "true", user_id):
+            raise ServiceError("not_found", "Failed to verify rumour")
+        return self.get_rumour(rumour_id)
+
+    def verify_rumours(self, user_id: Optional[str], items: Iterable[Tuple[str, str]]) -> List[Dict]:
+        """Verify many (rumourId, decision) items with a single save.
+
+        Returns one result dict per item: ``{"rumourId", "ok", "message"}``.
+        """
+        results: List[Dict] = []
+        with self.rumour_model.batch():
+            for rumour_id, decision in items:
+                problem = self.check_verification(user_id, rumour_id, decision)
+                if problem:
+                    results.append({"rumourId": rumour_id, "ok": False, "message": problem.message})
+                    continue
+                if not self.rumour_model.update_verified(rumour_id, decision == "true", user_id):
+                    results.append({"rumourId": rumour_id, "ok": False, "message": "Failed to verify rumour"})
+                    continue
+                results.append({"rumourId": rumour_id, "ok": True, "message": "Rumour verified"})
+        return results
+
+    def sync(self) -> List[str]:
+        """Pick up changes saved by other processes sharing the data files.
+
+        New rumours are added to the ranking, rumours with new reports are
+        re-ranked and re-checked for panic. Returns the affected rumour IDs.
+        """
+        rumour_ids = self.rumour_model.refresh()
+        report_ids = self.report_model.refresh()
+        if self._ranking is not None:
+            for rumour_id in rumour_ids:
+                rumour = self.rumour_model.get_by_id(rumour_id)
+                if rumour and self._ranking.rank_of(rumour_id) is None:
+                    self._ranking.add(
+                        rumour_id, self.report_model.get_report_count(rumour_id), rumour.get("credibilityScore")
+                    )
+        self.refresh_after_reports(report_ids)
+        return list(dict.fromkeys(rumour_ids + report_ids))
+
+    def refresh_after_reports(self, rumour_ids: Iterable[str]) -> None:
+        """Re-rank rumours that got new reports and switch them to panic when reported fast.
+
+        Panic is decided from the reports in the recent time windows
+        (``business_rules.PANIC_WINDOWS``), not from the lifetime count.
+        """
+        for rumour_id in rumour_ids:
+            count = self.report_model.get_report_count(rumour_id)
+            if self._ranking is not None:
+                self._ranking.update_count(rumour_id, count)
+            rumour = self.rumour_model.get_by_id(rumour_id)
+            if (
+                rumour
+                and not self.rumour_model.is_panic(rumour)
+                and should_trigger_panic_window(self.report_model.get_recent_report_counts(rumour_id))
+            ):
+                # จำเวลาที่กฎหน้าต่างเวลาเปลี่ยนเป็น panic: cool_down คืนสถานะเฉพาะข่าวลือเหล่านี้
+                self.rumour_model.update_status(
+                    rumour_id, STATUS_PANIC, panic_since=datetime.now().isoformat(timespec="seconds")
+                )
+
+    def cool_down(self) -> List[str]:
+        """Return panic rumours that stopped being reported fast to normal; return their IDs.
+
+        Only rumours the panic-window rule put into panic (``panicSince`` is
+        set) are returned; panic set any other way, e.g. in data saved before
+        the rule existed, is left alone. Only the rumours currently in panic
+        are checked (one window lookup each), so this is cheap enough to run
+        every minute.
+        """
+        cooled = [
+            rumour.get("rumourId")
+            for rumour in self.rumour_model.iter_bucket(SUMMARY_PANIC)
+            if rumour.get("panicSince")
+            and should_end_panic(self.report_model.get_recent_report_counts(rumour.get("rumourId")))
+        ]
+        if cooled:
+            with self.rumour_model.batch():
+                for rumour_id in cooled:
+                    self.rumour_model.update_status(rumour_id, STATUS_NORMAL)
+        self.report_model.prune_recent()
+        return cooled
@@ -5,5 +5,7 @@ from .login_view import LoginView
 from .rumour_list_view import RumourListView
 from .rumour_detail_view import RumourDetailView
 from .summary_view import SummaryView
+from .debug_panel import DebugPanel
+from .filter_bar import FilterBar
 
-__all__ = ['LoginView', 'RumourListView', 'RumourDetailView', 'SummaryView']
+__all__ = ['LoginView', 'RumourListView', 'RumourDetailView', 'SummaryView', 'DebugPanel', 'FilterBar']
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import tkinter as tk
+from tkinter import ttk
+from typing import TYPE_CHECKING, Dict
+
+import metrics
+
+if TYPE_CHECKING:
+    from Controllers.app_controller import AppController
+
+
+class DebugPanel(tk.Toplevel):
+    """Hidden window (Ctrl+Shift+D) showing the recorded timings and counters."""
+
+    REFRESH_MS = 1000
+
+    def __init__(self, parent: tk.Widget, controller: AppController) -> None:
+        """Create the panel and start refreshing it."""
+        super().__init__(parent)
+        self.controller = controller
+        self.title("Debug – Metrics")
+        self.geometry("760x420")
+
+        # แถบควบคุม: เปิด/ปิดการเก็บสถิติ ล้างค่า และเขียนไฟล์ทันที
+        toolbar = tk.Frame(self)
+        toolbar.pack(fill=tk.X, padx=8, pady=6)
+        self.recording = tk.BooleanVar(value=metrics.is_enabled())
+        ttk.Checkbutton(toolbar, text="Record", variable=self.recording, command=self._toggle).pack(side=tk.LEFT)
+        ttk.Button(toolbar, text="Reset", command=self._reset).pack(side=tk.LEFT, padx=5)
+        ttk.Button(toolbar, text="Dump now", command=self.controller.dump_metrics).pack(side=tk.LEFT)
+        self.status = tk.Label(toolbar, text="", fg="gray")
+        self.status.pack(side=tk.RIGHT)
+
+        columns = ("labels", "count", "avg", "p95", "max")
+        self.tree = ttk.Treeview(self, columns=columns, height=16)
+        self.tree.heading("#0", text="Metric")
+        for column, text, width in (
+            ("labels", "Labels", 220),
+            ("count", "Count / value", 100),
+            ("avg", "Avg ms", 80),
+            ("p95", "p95 ms", 80),
+            ("max", "Max ms", 80),
+        ):
+            self.tree.heading(column, text=text)
+            self.tree.column(column, width=width, anchor="w" if column == "labels" else "e")
+        self.tree.column("#0", width=170)
+        self.tree.pack(fill=tk.BOTH, expand=True, padx=8, pady=(0, 8))
+
+        self._refresh()
+
+    def _toggle(self) -> None:
+        """Turn recording on or off."""
+        metrics.set_enabled(self.recording.get())
+        self._refresh_rows()
+
+    def _reset(self) -> None:
+        """Clear the recorded values."""
+        metrics.reset()
+        self._refresh_rows()
+
+    def _refresh(self) -> None:
+        """Redraw the table and schedule the next refresh while the window exists."""
+        self._refresh_rows()
+        self.after(self.REFRESH_MS, self._refresh)
+
+    def _refresh_rows(self) -> None:
+        """Fill the table from a snapshot of the metrics."""
+        data = metrics.snapshot()
+        self.tree.delete(*self.tree.get_children())
+        for histogram in data["histograms"]:
+            count = histogram["count"]
+            self.tree.insert(
+                "",
+                tk.END,
+                text=histogram["name"],
+                values=(
+                    self._labels(histogram["labels"]),
+                    count,
+                    f"{histogram['sum'] / count * 1000:.2f}" if count else "-",
+                    f"{histogram['p95'] * 1000:.2f}",
+                    f"{histogram['max'] * 1000:.2f}",
+                ),
+            )
+        for counter in data["counters"]:
+            self.tree.insert(
+                "", tk.END, text=counter["name"], values=(self._labels(counter["labels"]), f"{counter['value']:,.0f}")
+            )
+        self.status.config(text="recording" if metrics.is_enabled() else "off (RUMOUR_METRICS=1 to record)")
+
+    @staticmethod
+    def _labels(labels: Dict[str, str]) -> str:
+        """Format labels as ``key=value`` pairs."""
+        return ", ".join(f"{key}={value}" for key, value in labels.items())
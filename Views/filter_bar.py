@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import tkinter as tk
+from datetime import date
+from tkinter import messagebox, ttk
+from typing import TYPE_CHECKING, Any, Callable, Dict, Sequence
+
+from business_rules import STATUS_NORMAL, STATUS_PANIC
+
+if TYPE_CHECKING:
+    from Controllers.app_controller import AppController
+
+
+class FilterBar(tk.Frame):
+    """Row of filters (status, verified, source, created date range) shared by the list and summary views.
+
+    Every change calls ``on_change`` with keyword conditions for
+    ``RumourService.query``; an empty dict means "no filter".
+    """
+
+    ANY = "Any"
+    STATUS_CHOICES = (ANY, STATUS_PANIC, STATUS_NORMAL)
+    # ข้อความในตัวเลือก -> ค่า verified (None = ยังไม่ยืนยัน)
+    VERIFIED_CHOICES: Dict[str, Any] = {"True": True, "False": False, "Not verified": None}
+
+    def __init__(
+        self,
+        parent: tk.Widget,
+        controller: AppController,
+        on_change: Callable[[Dict[str, Any]], None],
+        fields: Sequence[str] = ("status", "verified", "source", "created"),
+    ) -> None:
+        """Create the filter widgets for ``fields``."""
+        super().__init__(parent)
+        self.controller = controller
+        self.on_change = on_change
+        self.fields = fields
+        self.status_var = tk.StringVar(value=self.ANY)
+        self.verified_var = tk.StringVar(value=self.ANY)
+        self.source_var = tk.StringVar(value=self.ANY)
+        self.created_from = tk.StringVar()
+        self.created_to = tk.StringVar()
+
+        font = ("Segoe UI", 10)
+        if "status" in fields:
+            self._combo("Status:", self.status_var, self.STATUS_CHOICES, 8)
+        if "verified" in fields:
+            self._combo("Verified:", self.verified_var, (self.ANY, *self.VERIFIED_CHOICES), 11)
+        if "source" in fields:
+            # รายชื่อแหล่งที่มาถูกดึงใหม่ทุกครั้งที่เปิดรายการ
+            self.source_combo = self._combo("Source:", self.source_var, (self.ANY,), 16)
+            self.source_combo.configure(postcommand=self._load_sources)
+        if "created" in fields:
+            tk.Label(self, text="Created:", font=font).pack(side=tk.LEFT, padx=(8, 3))
+            for variable in (self.created_from, self.created_to):
+                entry = tk.Entry(self, textvariable=variable, width=11, font=font)
+                entry.pack(side=tk.LEFT)
+                entry.bind("<Return>", lambda e: self._apply())
+                if variable is self.created_from:
+                    tk.Label(self, text="–", font=font).pack(side=tk.LEFT, padx=2)
+            ttk.Button(self, text="Apply", command=self._apply, width=6).pack(side=tk.LEFT, padx=(5, 0))
+        ttk.Button(self, text="Reset", command=self._reset_and_apply, width=6).pack(side=tk.LEFT, padx=5)
+
+    def _combo(self, label: str, variable: tk.StringVar, values: Sequence[str], width: int) -> ttk.Combobox:
+        """Add a labelled read-only combobox that applies the filters when changed."""
+        tk.Label(self, text=label, font=("Segoe UI", 10)).pack(side=tk.LEFT, padx=(8, 3))
+        combo = ttk.Combobox(self, textvariable=variable, values=values, width=width, state="readonly")
+        combo.pack(side=tk.LEFT)
+        combo.bind("<<ComboboxSelected>>", lambda e: self._apply())
+        return combo
+
+    def _load_sources(self) -> None:
+        """Fill the source list with the sources currently in the data."""
+        self.source_combo.configure(values=(self.ANY, *self.controller.service.get_sources()))
+
+    def criteria(self) -> Dict[str, Any]:
+        """The selected conditions; raises ValueError for a malformed date."""
+        criteria: Dict[str, Any] = {}
+        if self.status_var.get() != self.ANY:
+            criteria["status"] = self.status_var.get()
+        if self.verified_var.get() != self.ANY:
+            criteria["verified"] = self.VERIFIED_CHOICES[self.verified_var.get()]
+        if self.source_var.get() != self.ANY:
+            criteria["source"] = self.source_var.get()
+        for name, variable in (("created_from", self.created_from), ("created_to", self.created_to)):
+            text = variable.get().strip()
+            if text:
+                criteria[name] = date.fromisoformat(text).isoformat()
+        return criteria
+
+    def reset(self) -> None:
+        """Set every filter back to "Any" (without notifying)."""
+        for variable in (self.status_var, self.verified_var, self.source_var):
+            variable.set(self.ANY)
+        self.created_from.set("")
+        self.created_to.set("")
+
+    def _apply(self) -> None:
+        """Pass the current conditions to ``on_change``."""
+        try:
+            criteria = self.criteria()
+        except ValueError:
+            messagebox.showwarning("Warning", "Dates must be in YYYY-MM-DD format")
+            return
+        self.on_change(criteria)
+
+    def _reset_and_apply(self) -> None:
+        """Clear all filters and show everything again."""
+        self.reset()
+        self.on_change({})
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import tkinter as tk
 from tkinter import ttk
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Dict, Mapping, Optional
 
 from business_rules import REPORT_TYPES
 
@@ -18,7 +18,7 @@ class RumourDetailView(tk.Frame):
         super().__init__(parent)
         self.controller = controller
         self.rumour: Optional[Dict] = None
-        self.report_counts: Dict[str, int] = {}
+        self.report_counts: Mapping[str, int] = {}
 
         # Header with navigation
         header_frame = tk.Frame(self, bg="#f0f0f0")
@@ -84,15 +84,21 @@ class RumourDetailView(tk.Frame):
         if self.report_type_combo.get():
             self._submit_report()
 
-    def set_rumour(self, rumour: Optional[Dict], report_counts: Dict[str, int]) -> None:
+    def set_rumour(self, rumour: Optional[Dict], report_counts: Mapping[str, int]) -> None:
         """Set the rumour to display and update UI accordingly."""
-        self.rumour = rumour
-        self.report_counts = report_counts
+        self.clear_inputs()
+        self.update_rumour(rumour, report_counts)
 
-        # ล้างข้อมูลเดิม
+    def clear_inputs(self) -> None:
+        """Reset the report type and verification choices."""
         self.report_type_combo.set("")
         self.verify_choice.set("")
 
+    def update_rumour(self, rumour: Optional[Dict], report_counts: Mapping[str, int]) -> None:
+        """Show the current data of the displayed rumour (e.g. after a change), keeping the inputs."""
+        self.rumour = rumour
+        self.report_counts = report_counts
+
         # ซ่อน frames ก่อนแสดง frame ใหม่
         self.report_frame.pack_forget()
         self.verify_frame.pack_forget()
@@ -1,22 +1,49 @@
 from __future__ import annotations
 
 import tkinter as tk
-from tkinter import ttk
-from typing import TYPE_CHECKING, Dict, List, Optional
+import tkinter.font as tkfont
+from tkinter import messagebox, ttk
+from typing import TYPE_CHECKING, Dict, List, Mapping, Optional, Sequence
+
+from business_rules import REPORT_TYPES
+
+from .filter_bar import FilterBar
 
 if TYPE_CHECKING:
     from Controllers.app_controller import AppController
 
 
 class RumourListView(tk.Frame):
-    """View for displaying the list of all rumours."""
+    """View for displaying the list of all rumours.
+
+    The list is virtualized: the Listbox only ever holds the rows that fit on
+    screen, formatted on demand from the controller's sorted sequence, so the
+    cost of showing the list does not depend on the number of rumours.
+    The search box filters as you type (after a short pause); the filter
+    row narrows the list by status, verification, source and created date.
+    After a data change ``patch_rows()`` rewrites only the visible rows
+    whose text changed.
+    """
+
+    SEARCH_DELAY_MS = 150  # รอให้หยุดพิมพ์ก่อนค้นหา
 
     def __init__(self, parent: tk.Widget, controller: AppController) -> None:
         """Initialize the rumour list view."""
         super().__init__(parent)
         self.controller = controller
-        self.report_counts: Dict[str, int] = {}
-        self.rumours: List[Dict] = []
+        self.report_counts: Mapping[str, int] = {}
+        self.rumours: Sequence[Dict] = []
+        # ตำแหน่งแถวแรกที่แสดง และจำนวนแถวที่มองเห็นได้
+        self._offset = 0
+        self._visible_rows = 18
+        # rumourId ที่ถูกเลือก (เก็บแยกจาก Listbox เพราะแถวถูกวาดใหม่เมื่อเลื่อน)
+        self._selected_ids: Dict[str, None] = {}
+        # ข้อความของแถวที่แสดงอยู่ใน Listbox (เทียบเพื่อแก้เฉพาะแถวที่เปลี่ยน)
+        self._row_texts: List[str] = []
+        self._search_job: Optional[str] = None
+        # ป้ายตำแหน่งแถวปรับเมื่อ Tk ว่าง: นับผลทั้งหมดหลังจากแถวแรก ๆ ปรากฏแล้ว
+        self._position_job: Optional[str] = None
+        self._position_end = 0
 
         # Header with title and nav buttons
         header_frame = tk.Frame(self, bg="#f0f0f0")
@@ -35,45 +62,347 @@ class RumourListView(tk.Frame):
         content_frame = tk.LabelFrame(self, text="Select a rumour to view details", font=("Segoe UI", 11, "bold"))
         content_frame.pack(fill=tk.BOTH, expand=True, padx=12, pady=12)
 
+        # ช่องค้นหาจากชื่อเรื่องหรือแหล่งที่มา
+        search_bar = tk.Frame(content_frame)
+        search_bar.pack(fill=tk.X, pady=(0, 6))
+        tk.Label(search_bar, text="Search:", font=("Segoe UI", 10)).pack(side=tk.LEFT, padx=(0, 5))
+        self.search_var = tk.StringVar()
+        self.search_entry = tk.Entry(search_bar, textvariable=self.search_var, font=("Segoe UI", 10))
+        self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.search_entry.bind("<Escape>", lambda e: self.clear_search())
+        self.search_entry.bind("<Down>", lambda e: self._focus_list())
+        ttk.Button(search_bar, text="Clear", command=self.clear_search, width=6).pack(side=tk.LEFT, padx=5)
+        self.search_var.trace_add("write", self._on_search_changed)
+
+        # ตัวกรองตามสถานะ / การยืนยัน / แหล่งที่มา / วันที่สร้าง
+        self.filter_bar = FilterBar(content_frame, controller, controller.filter_rumours)
+        self.filter_bar.pack(fill=tk.X, pady=(0, 6))
+
         container = tk.Frame(content_frame)
         container.pack(fill=tk.BOTH, expand=True, padx=0, pady=0)
 
-        self.listbox = tk.Listbox(container, height=18, font=("Segoe UI", 10))
-        scrollbar = tk.Scrollbar(container, orient=tk.VERTICAL, command=self.listbox.yview)
-        self.listbox.configure(yscrollcommand=scrollbar.set)
+        list_font = tkfont.Font(font=("Segoe UI", 10))
+        self._row_height = list_font.metrics("linespace") + 1
+        self.listbox = tk.Listbox(
+            container, height=self._visible_rows, font=list_font, exportselection=False, activestyle="none"
+        )
+        # scrollbar ควบคุมตำแหน่งในข้อมูลทั้งหมด ไม่ใช่เฉพาะแถวใน Listbox
+        self.scrollbar = tk.Scrollbar(container, orient=tk.VERTICAL, command=self._on_scroll)
         self.listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         self.listbox.bind("<Double-1>", self._on_open_detail)
+        self.listbox.bind("<<ListboxSelect>>", self._on_select)
+        self.listbox.bind("<Configure>", self._on_resize)
+        self.listbox.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.listbox.bind("<Button-4>", lambda e: self._scroll_by(-3))
+        self.listbox.bind("<Button-5>", lambda e: self._scroll_by(3))
+        self.listbox.bind("<Up>", lambda e: self._move_selection(-1))
+        self.listbox.bind("<Down>", lambda e: self._move_selection(1))
+        self.listbox.bind("<Prior>", lambda e: self._scroll_by(-self._visible_rows))
+        self.listbox.bind("<Next>", lambda e: self._scroll_by(self._visible_rows))
+        self.listbox.bind("<Home>", lambda e: self._scroll_to(0))
+        self.listbox.bind("<End>", lambda e: self._scroll_to(len(self.rumours)))
+
+        # Page / jump controls
+        page_bar = tk.Frame(content_frame)
+        page_bar.pack(fill=tk.X, pady=(6, 0))
+        ttk.Button(page_bar, text="< Prev", command=lambda: self._scroll_by(-self._visible_rows)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(page_bar, text="Next >", command=lambda: self._scroll_by(self._visible_rows)).pack(side=tk.LEFT, padx=5)
+        self.position_label = tk.Label(page_bar, text="", font=("Segoe UI", 9), fg="gray")
+        self.position_label.pack(side=tk.LEFT, padx=10)
+        ttk.Button(page_bar, text="Go", command=self._on_jump, width=5).pack(side=tk.RIGHT, padx=5)
+        self.jump_entry = tk.Entry(page_bar, width=8, font=("Segoe UI", 10))
+        self.jump_entry.pack(side=tk.RIGHT)
+        self.jump_entry.bind("<Return>", lambda e: self._on_jump())
+        tk.Label(page_bar, text="Go to row:", font=("Segoe UI", 9)).pack(side=tk.RIGHT, padx=5)
 
         button_bar = tk.Frame(self)
         button_bar.pack(pady=12, padx=12)
 
         open_btn = ttk.Button(button_bar, text="View Details", command=self._on_open_detail, width=25)
-        open_btn.pack(padx=5)
+        open_btn.pack(side=tk.LEFT, padx=5)
+
+        # โหมดเลือกหลายรายการ สำหรับรายงาน/ยืนยันทีละหลายข่าว
+        self.multi_select = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            button_bar, text="Multi-select", variable=self.multi_select, command=self._on_toggle_multi_select
+        ).pack(side=tk.LEFT, padx=5)
+
+        self.bulk_frame = tk.LabelFrame(self, text="Selected Rumours", font=("Segoe UI", 11, "bold"))
+
+        tk.Label(self.bulk_frame, text="Report type:", font=("Segoe UI", 10)).grid(row=0, column=0, padx=12, pady=8, sticky="w")
+        self.bulk_report_combo = ttk.Combobox(self.bulk_frame, values=REPORT_TYPES, width=25, state="readonly", font=("Segoe UI", 10))
+        self.bulk_report_combo.grid(row=0, column=1, padx=12, pady=8, sticky="w")
+        ttk.Button(self.bulk_frame, text="Report Selected", command=self._bulk_report).grid(row=0, column=2, padx=12, pady=8)
+
+        self.bulk_verify_frame = tk.Frame(self.bulk_frame)
+        tk.Label(self.bulk_verify_frame, text="Verify as:", font=("Segoe UI", 10)).pack(side=tk.LEFT, padx=(12, 5))
+        self.bulk_verify_choice = tk.StringVar(value="")
+        ttk.Radiobutton(self.bulk_verify_frame, text="True", variable=self.bulk_verify_choice, value="true").pack(side=tk.LEFT, padx=10)
+        ttk.Radiobutton(self.bulk_verify_frame, text="False", variable=self.bulk_verify_choice, value="false").pack(side=tk.LEFT, padx=10)
+        ttk.Button(self.bulk_verify_frame, text="Verify Selected", command=self._bulk_verify).pack(side=tk.LEFT, padx=12)
+
+    def set_data(self, rumours: Sequence[Dict], report_counts: Mapping[str, int]) -> None:
+        """Set rumour data to be displayed in the list.
 
-    def set_data(self, rumours: List[Dict], report_counts: Dict[str, int]) -> None:
-        """Set rumour data to be displayed in the list."""
+        ``rumours`` can be any sequence supporting ``len`` and indexing; only
+        the rows currently on screen are read and formatted. The total for the
+        position label is counted on the next idle cycle, after the rows are
+        drawn (counting lazy search results can take longer than the page).
+        """
         self.rumours = rumours
         self.report_counts = report_counts
-        # ล้างรายการเดิม
+        self._selected_ids = {}
+        self._offset = 0
+        self._render()
+
+    def replace_data(self, rumours: Sequence[Dict], report_counts: Mapping[str, int]) -> None:
+        """Show a re-run of the current list after a data change, keeping the scroll position.
+
+        Selected rumours that are no longer in the list are deselected.
+        """
+        self.rumours = rumours
+        self.report_counts = report_counts
+        if self._selected_ids:
+            shown = {rumour.get("rumourId") for rumour in rumours}
+            self._selected_ids = {rumour_id: None for rumour_id in self._selected_ids if rumour_id in shown}
+        self._render()
+
+    def clear_search(self) -> None:
+        """Empty the search box (the full list comes back after the search delay)."""
+        self.search_var.set("")
+
+    def _on_search_changed(self, *args: str) -> None:
+        """Restart the search delay on every keystroke."""
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(self.SEARCH_DELAY_MS, self._run_search)
+
+    def _run_search(self) -> None:
+        """Ask the controller for the rumours matching the search box."""
+        self._search_job = None
+        query = self.search_var.get().strip()
+        if query != self.controller.search_query:
+            self.controller.search_rumours(query)
+
+    def _focus_list(self) -> str:
+        """Move the keyboard focus from the search box to the first row."""
+        self.listbox.focus_set()
+        return self._move_selection(1)
+
+    def refresh_rows(self) -> None:
+        """Redraw the visible rows after the data changed, keeping scroll position and selection."""
+        self._render()
+
+    def patch_rows(self, report_counts: Mapping[str, int]) -> None:
+        """Bring the visible rows up to date after a data change, rewriting only rows whose text changed.
+
+        The cost depends on the number of visible rows, not on the number
+        of rumours or of changes; rows that moved (e.g. up the ranking after
+        a new report) are rewritten in place, and the scroll position and
+        selection are kept.
+        """
+        self.report_counts = report_counts
+        rumours = self._window()
+        texts = self._row_texts
+        for row, rumour in enumerate(rumours):
+            text = self._format_row(rumour)
+            if row < len(texts) and texts[row] == text:
+                continue
+            if row < len(texts):
+                self.listbox.delete(row)
+                texts[row] = text
+            else:
+                texts.append(text)
+            self.listbox.insert(row, text)
+            if rumour.get("rumourId") in self._selected_ids:
+                self.listbox.selection_set(row)
+        if len(texts) > len(rumours):
+            # รายการสั้นลง: ลบแถวที่เกินออก
+            self.listbox.delete(len(rumours), tk.END)
+            del texts[len(rumours) :]
+        self._show_position(self._offset + len(rumours))
+
+    def _format_row(self, rumour: Dict) -> str:
+        """Format one rumour as a list row."""
+        rumour_id = rumour.get("rumourId", "-")
+        title = rumour.get("title", "-")
+        status = self.controller.get_status_label(rumour)
+        count = self.report_counts.get(rumour_id, 0)
+        return f"[{rumour_id}] {title} | reports: {count} | status: {status}"
+
+    def _window(self) -> List[Dict]:
+        """The rumours of the visible window, moving the offset back if it is past the end."""
+        if self._offset:
+            # ตำแหน่งแรก (offset 0) ไม่ต้องรู้จำนวนทั้งหมด
+            self._offset = max(0, min(self._offset, len(self.rumours) - self._visible_rows))
+        return self.rumours[self._offset : self._offset + self._visible_rows]
+
+    def _render(self) -> None:
+        """Redraw only the visible window of rows starting at the current offset."""
+        rumours = self._window()
+        # ล้างรายการเดิม แล้วเพิ่มเฉพาะแถวที่มองเห็น
         self.listbox.delete(0, tk.END)
-        # เพิ่มรายการใหม่พร้อม ID, ชื่อ, จำนวนรายงาน, สถานะ
-        for rumour in rumours:
-            rumour_id = rumour.get("rumourId", "-")
-            title = rumour.get("title", "-")
-            status = self.controller.get_status_label(rumour)
-            count = report_counts.get(rumour_id, 0)
-            self.listbox.insert(tk.END, f"[{rumour_id}] {title} | reports: {count} | status: {status}")
+        self._row_texts = []
+        for row, rumour in enumerate(rumours):
+            text = self._format_row(rumour)
+            self._row_texts.append(text)
+            self.listbox.insert(tk.END, text)
+            if rumour.get("rumourId") in self._selected_ids:
+                self.listbox.selection_set(row)
+        self._show_position(self._offset + len(rumours))
+
+    def _show_position(self, end: int) -> None:
+        """Update the scrollbar and the "Rows x-y of n" label for the window ending at ``end`` when Tk is idle."""
+        self._position_end = end
+        if self._position_job is None:
+            self._position_job = self.after_idle(self._update_position)
+
+    def _update_position(self) -> None:
+        """Count the rows and update the scrollbar and the position label."""
+        self._position_job = None
+        total, end = len(self.rumours), self._position_end
+        if total:
+            self.scrollbar.set(self._offset / total, end / total)
+            self.position_label.config(text=f"Rows {self._offset + 1}-{end} of {total}")
+        else:
+            self.scrollbar.set(0.0, 1.0)
+            filtered = self.search_var.get().strip() or self.controller.list_filters
+            self.position_label.config(text="No matching rumours" if filtered else "No rumours")
+
+    def _scroll_to(self, offset: int) -> str:
+        """Show the window of rows starting at ``offset``."""
+        self._offset = offset
+        self._render()
+        return "break"
+
+    def _scroll_by(self, rows: int) -> str:
+        """Move the visible window by ``rows`` rows."""
+        return self._scroll_to(self._offset + rows)
+
+    def _on_scroll(self, *args: str) -> None:
+        """Handle scrollbar commands (moveto / scroll units / scroll pages)."""
+        if args[0] == "moveto":
+            self._scroll_to(int(float(args[1]) * len(self.rumours)))
+        elif args[0] == "scroll":
+            step = self._visible_rows if args[2] == "pages" else 1
+            self._scroll_by(int(args[1]) * step)
+
+    def _on_mouse_wheel(self, event: tk.Event) -> str:
+        """Scroll three rows per wheel notch (Windows / macOS)."""
+        return self._scroll_by(-3 if event.delta > 0 else 3)
+
+    def _on_resize(self, event: tk.Event) -> None:
+        """Recompute how many rows fit when the Listbox is resized."""
+        rows = max(1, event.height // self._row_height)
+        if rows != self._visible_rows:
+            self._visible_rows = rows
+            self._render()
+
+    def _move_selection(self, delta: int) -> str:
+        """Move the keyboard selection, scrolling the window at its edges."""
+        if not self.rumours:
+            return "break"
+        selection = self.listbox.curselection()
+        current = self._offset + selection[0] if selection else self._offset - delta
+        target = max(0, min(len(self.rumours) - 1, current + delta))
+        if target < self._offset:
+            self._offset = target
+        elif target >= self._offset + self._visible_rows:
+            self._offset = target - self._visible_rows + 1
+        if not self.multi_select.get():
+            self._selected_ids = {}
+        self._selected_ids[self.rumours[target].get("rumourId")] = None
+        self._render()
+        return "break"
+
+    def _on_jump(self) -> None:
+        """Jump to the row number typed in the Go to row box."""
+        text = self.jump_entry.get().strip()
+        if not text.isdigit() or not self.rumours:
+            return
+        row = max(0, min(len(self.rumours) - 1, int(text) - 1))
+        self._selected_ids = {self.rumours[row].get("rumourId"): None}
+        self._scroll_to(row)
+
+    def _on_select(self, event: Optional[tk.Event] = None) -> None:
+        """Keep the selected rumour IDs in sync with the visible selection."""
+        selected = set(self.listbox.curselection())
+        if not self.multi_select.get():
+            if selected:
+                self._selected_ids = {}
+            else:
+                return
+        for row in range(self.listbox.size()):
+            rumour_id = self.rumours[self._offset + row].get("rumourId")
+            if row in selected:
+                self._selected_ids[rumour_id] = None
+            else:
+                self._selected_ids.pop(rumour_id, None)
 
     def _get_selected_rumour_id(self) -> Optional[str]:
         """Get the ID of the currently selected rumour."""
-        selection = self.listbox.curselection()
-        if not selection:
-            return None
-        index = selection[0]
-        rumour = self.rumours[index]
-        return rumour.get("rumourId")
+        return next(iter(self._selected_ids), None)
+
+    def _get_selected_rumour_ids(self) -> List[str]:
+        """Get the IDs of all selected rumours (multi-select mode)."""
+        return list(self._selected_ids)
+
+    def _on_toggle_multi_select(self) -> None:
+        """Switch the list between single and multiple selection."""
+        self.listbox.selection_clear(0, tk.END)
+        self._selected_ids = {}
+        if self.multi_select.get():
+            self.listbox.configure(selectmode=tk.EXTENDED)
+            self.bulk_frame.pack(fill=tk.X, padx=12, pady=(0, 12))
+            # แสดงส่วนยืนยันเฉพาะผู้ตรวจสอบ
+            if self.controller.can_show_verify_frame():
+                self.bulk_verify_frame.grid(row=1, column=0, columnspan=3, sticky="w", pady=8)
+            else:
+                self.bulk_verify_frame.grid_forget()
+        else:
+            self.listbox.configure(selectmode=tk.BROWSE)
+            self.bulk_frame.pack_forget()
+
+    def _bulk_report(self) -> None:
+        """Report all selected rumours with the chosen report type."""
+        rumour_ids = self._get_selected_rumour_ids()
+        if not rumour_ids:
+            messagebox.showwarning("Warning", "Select at least one rumour")
+            return
+        report_type = self.bulk_report_combo.get()
+        results = self.controller.submit_reports([(rumour_id, report_type) for rumour_id in rumour_ids])
+        self._show_bulk_results("Report", results)
+
+    def _bulk_verify(self) -> None:
+        """Verify all selected rumours with the chosen result."""
+        rumour_ids = self._get_selected_rumour_ids()
+        if not rumour_ids:
+            messagebox.showwarning("Warning", "Select at least one rumour")
+            return
+        decision = self.bulk_verify_choice.get()
+        results = self.controller.verify_rumours([(rumour_id, decision) for rumour_id in rumour_ids])
+        self._show_bulk_results("Verify", results)
+
+    def _show_bulk_results(self, action: str, results: List[Dict]) -> None:
+        """Summarize a bulk action in one message box and clear the selection.
+
+        The list itself is updated from the model's change events (filtered
+        and searched lists are re-run, see ``AppController._apply_changes``).
+        """
+        succeeded = sum(1 for result in results if result["ok"])
+        failed = [f"[{result['rumourId']}] {result['message']}" for result in results if not result["ok"]]
+        message = f"{action}: {succeeded} succeeded, {len(failed)} failed"
+        if failed:
+            # แสดงรายการที่ล้มเหลวไม่เกิน 10 รายการ
+            message += "\n\n" + "\n".join(failed[:10])
+            if len(failed) > 10:
+                message += f"\n... and {len(failed) - 10} more"
+        # ข่าวลือที่ทำรายการแล้วไม่ควรถูกส่งซ้ำเมื่อกดปุ่มอีกครั้ง
+        self._selected_ids = {}
+        self.listbox.selection_clear(0, tk.END)
+        messagebox.showinfo(action, message)
 
     def _on_open_detail(self, event: Optional[tk.Event] = None) -> None:
         """Handle opening the detail view for selected rumour."""
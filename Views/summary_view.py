@@ -2,12 +2,74 @@ from __future__ import annotations
 
 import tkinter as tk
 from tkinter import ttk
-from typing import TYPE_CHECKING, Dict, List
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from business_rules import SUMMARY_PANIC, SUMMARY_VERIFIED_FALSE, SUMMARY_VERIFIED_TRUE
+
+from .filter_bar import FilterBar
 
 if TYPE_CHECKING:
     from Controllers.app_controller import AppController
 
 
+class _RowPositions:
+    """Listbox positions of the rumours shown in one summary category.
+
+    Each added row takes the next slot and a removed row leaves its slot
+    empty; a Fenwick tree over the slots counts the rows before a slot, so
+    finding, adding and removing a row are O(log n) instead of a scan of
+    the category. Empty slots are dropped once they outnumber the rows.
+    """
+
+    __slots__ = ("_slots", "_tree")
+
+    def __init__(self) -> None:
+        """Create positions for an empty category."""
+        self._slots: Dict[str, int] = {}  # rumourId -> slot (เริ่มที่ 1) เรียงตามลำดับ slot
+        self._tree: List[int] = [0]
+
+    def __contains__(self, rumour_id: object) -> bool:
+        """Whether ``rumour_id`` has a row."""
+        return rumour_id in self._slots
+
+    def _prefix(self, slot: int) -> int:
+        """Number of rows in slots 1..``slot``."""
+        total = 0
+        while slot:
+            total += self._tree[slot]
+            slot &= slot - 1
+        return total
+
+    def append(self, rumour_id: str) -> None:
+        """Add a row for ``rumour_id`` after the last row."""
+        slot = len(self._tree)
+        # node ของ slot นี้เก็บผลรวมของช่วง (slot - lowbit, slot]
+        self._tree.append(self._prefix(slot - 1) - self._prefix(slot - (slot & -slot)) + 1)
+        self._slots[rumour_id] = slot
+
+    def index(self, rumour_id: str) -> Optional[int]:
+        """Listbox index of the row of ``rumour_id``, or None if it has none."""
+        slot = self._slots.get(rumour_id)
+        return None if slot is None else self._prefix(slot) - 1
+
+    def remove(self, rumour_id: str) -> Optional[int]:
+        """Drop the row of ``rumour_id``; return the listbox index it had (None if it had none)."""
+        slot = self._slots.pop(rumour_id, None)
+        if slot is None:
+            return None
+        index = self._prefix(slot) - 1
+        while slot < len(self._tree):
+            self._tree[slot] -= 1
+            slot += slot & -slot
+        if len(self._tree) > 2 * len(self._slots) + 64:
+            # ลำดับของ dict ตรงกับลำดับ slot อยู่แล้ว จึงสร้างใหม่ได้โดยไม่ต้อง sort
+            rumour_ids = list(self._slots)
+            self._slots, self._tree = {}, [0]
+            for rumour_id in rumour_ids:
+                self.append(rumour_id)
+        return index
+
+
 class SummaryView(tk.Frame):
     """View for displaying categorized summary of rumours."""
 
@@ -28,6 +90,10 @@ class SummaryView(tk.Frame):
         ttk.Button(nav_frame, text="Back to List", command=self.controller.show_list_view).pack(side=tk.LEFT, padx=5)
         ttk.Button(nav_frame, text="Logout", command=self.controller.logout).pack(side=tk.LEFT, padx=5)
 
+        # จำกัดหน้าสรุปเฉพาะแหล่งที่มา / ช่วงวันที่สร้าง
+        self.filter_bar = FilterBar(self, controller, controller.filter_summary, fields=("source", "created"))
+        self.filter_bar.pack(fill=tk.X, padx=12, pady=(8, 0))
+
         # Main content area
         content_frame = tk.Frame(self)
         content_frame.pack(fill=tk.BOTH, expand=True, padx=12, pady=12)
@@ -47,37 +113,72 @@ class SummaryView(tk.Frame):
         self.verified_false_list = tk.Listbox(self.verified_false_frame, height=6, font=("Segoe UI", 10))
         self.verified_false_list.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
+        # ตำแหน่งแถวของแต่ละ rumourId ในแต่ละหมวด เพื่อแก้ไขเฉพาะแถวที่เปลี่ยน
+        self._lists: Dict[str, tk.Listbox] = {
+            SUMMARY_PANIC: self.panic_list,
+            SUMMARY_VERIFIED_TRUE: self.verified_true_list,
+            SUMMARY_VERIFIED_FALSE: self.verified_false_list,
+        }
+        self._rows: Dict[str, _RowPositions] = {name: _RowPositions() for name in self._lists}
+
     def set_data(
         self,
-        panic_rumours: List[Dict],
-        verified_true_rumours: List[Dict],
-        verified_false_rumours: List[Dict],
-        report_counts: Dict[str, int],
+        panic_rumours: Iterable[Dict],
+        verified_true_rumours: Iterable[Dict],
+        verified_false_rumours: Iterable[Dict],
+        report_counts: Mapping[str, int],
     ) -> None:
-        """Set data for all three summary categories."""
-        # ล้างรายการทั้ง 3 หมวด
-        self.panic_list.delete(0, tk.END)
-        self.verified_true_list.delete(0, tk.END)
-        self.verified_false_list.delete(0, tk.END)
-
-        # แสดงข่าวลือที่ฉุกเฉิน
-        for rumour in panic_rumours:
-            rumour_id = rumour.get("rumourId", "-")
-            title = rumour.get("title", "-")
-            count = report_counts.get(rumour_id, 0)
-            self.panic_list.insert(tk.END, f"[{rumour_id}] {title} | reports: {count}")
+        """Set data for all three summary categories (each iterable is read once)."""
+        # ล้างรายการทั้ง 3 หมวด แล้วแสดงข่าวลือฉุกเฉิน / ยืนยันว่าจริง / ยืนยันว่าเท็จ
+        for name, rumours in (
+            (SUMMARY_PANIC, panic_rumours),
+            (SUMMARY_VERIFIED_TRUE, verified_true_rumours),
+            (SUMMARY_VERIFIED_FALSE, verified_false_rumours),
+        ):
+            listbox = self._lists[name]
+            listbox.delete(0, tk.END)
+            rows = self._rows[name] = _RowPositions()
+            for rumour in rumours:
+                rows.append(rumour.get("rumourId", "-"))
+                listbox.insert(tk.END, self._format_row(rumour, report_counts))
+
+    def apply_changes(
+        self,
+        changes: Iterable[Tuple[str, str, Dict]],
+        updated_rumours: Iterable[Dict],
+        report_counts: Mapping[str, int],
+    ) -> None:
+        """Apply only what changed since the last render.
 
-        # แสดงข่าวลือที่ยืนยันว่าจริง
-        for rumour in verified_true_rumours:
+        ``changes`` holds (bucket, "add"/"remove", rumour) moves and
+        ``updated_rumours`` holds rumours whose row text (e.g. report count)
+        changed. Each change finds its row in O(log n), not by scanning the category.
+        """
+        for name, action, rumour in changes:
             rumour_id = rumour.get("rumourId", "-")
-            title = rumour.get("title", "-")
-            count = report_counts.get(rumour_id, 0)
-            self.verified_true_list.insert(tk.END, f"[{rumour_id}] {title} | reports: {count}")
+            rows = self._rows[name]
+            if action == "add":
+                if rumour_id not in rows:
+                    rows.append(rumour_id)
+                    self._lists[name].insert(tk.END, self._format_row(rumour, report_counts))
+            else:
+                index = rows.remove(rumour_id)
+                if index is not None:
+                    self._lists[name].delete(index)
 
-        # แสดงข่าวลือที่ยืนยันว่าเท็จ
-        for rumour in verified_false_rumours:
+        # แก้ข้อความเฉพาะแถวของข่าวลือที่จำนวนรายงานเปลี่ยน
+        for rumour in updated_rumours:
             rumour_id = rumour.get("rumourId", "-")
-            title = rumour.get("title", "-")
-            count = report_counts.get(rumour_id, 0)
-            self.verified_false_list.insert(tk.END, f"[{rumour_id}] {title} | reports: {count}")
+            for name, rows in self._rows.items():
+                index = rows.index(rumour_id)
+                if index is not None:
+                    listbox = self._lists[name]
+                    listbox.delete(index)
+                    listbox.insert(index, self._format_row(rumour, report_counts))
 
+    def _format_row(self, rumour: Dict, report_counts: Mapping[str, int]) -> str:
+        """Format one rumour as a summary row."""
+        rumour_id = rumour.get("rumourId", "-")
+        title = rumour.get("title", "-")
+        count = report_counts.get(rumour_id, 0)
+        return f"[{rumour_id}] {title} | reports: {count}"
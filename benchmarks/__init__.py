@@ -0,0 +1,2 @@
+# Benchmarks Package
+# สคริปต์วัดประสิทธิภาพแบบ headless (ไม่เปิดหน้าต่าง Tk)
@@ -0,0 +1,138 @@
+"""HTTP benchmark: report submissions per second through the JSON API.
+
+Run with ``python -m benchmarks.bench_http [--clients N] [--reports N] [--journal] [--write-behind]``.
+The server runs on its own event loop thread against a temporary data
+directory; each client logs in as a different user and POSTs reports over
+one keep-alive connection.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from business_rules import REPORT_TYPES
+from Models import ReportModel, RumourModel, UserModel
+from Services import RumourAPIServer, RumourService
+
+
+def _write_json(path: Path, records: List[Dict]) -> None:
+    """Write records to a JSON file."""
+    with path.open("w", encoding="utf-8") as handle:
+        json.dump(records, handle, ensure_ascii=False)
+
+
+def _make_service(data_dir: Path, rumours: int, users: int, journal: bool, write_behind: bool) -> RumourService:
+    """Create a service over a fresh dataset."""
+    _write_json(
+        data_dir / "rumours.json",
+        [
+            {"rumourId": str(10000001 + i), "title": f"ข่าวลือ {i}", "credibilityScore": i % 100, "status": "ปกติ"}
+            for i in range(rumours)
+        ],
+    )
+    _write_json(data_dir / "users.json", [{"userId": f"U{i:04d}", "role": "ผู้ใช้ทั่วไป"} for i in range(users)])
+    _write_json(data_dir / "reports.json", [])
+    return RumourService(
+        RumourModel(data_dir / "rumours.json", write_behind=write_behind),
+        ReportModel(data_dir / "reports.json", journal=journal),
+        UserModel(data_dir / "users.json"),
+    )
+
+
+async def _request(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, method: str, path: str, body: Dict, token: str = ""
+) -> Tuple[int, Dict]:
+    """Send one keep-alive request and read its JSON response."""
+    payload = json.dumps(body).encode("utf-8")
+    auth = f"Authorization: Bearer {token}\r\n" if token else ""
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: bench\r\n{auth}Content-Length: {len(payload)}\r\n\r\n".encode("latin-1")
+        + payload
+    )
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def _client(port: int, user_id: str, rumour_ids: List[str]) -> int:
+    """Log in and report each rumour once; return the number of accepted reports."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    _, login = await _request(reader, writer, "POST", "/login", {"userId": user_id})
+    accepted = 0
+    for i, rumour_id in enumerate(rumour_ids):
+        status, _ = await _request(
+            reader,
+            writer,
+            "POST",
+            f"/rumours/{rumour_id}/reports",
+            {"reportType": REPORT_TYPES[i % len(REPORT_TYPES)], "description": ""},
+            login["token"],
+        )
+        accepted += status == 201
+    writer.close()
+    return accepted
+
+
+async def _drive(port: int, clients: int, reports: int, rumours: int) -> Tuple[int, float]:
+    """Run all clients concurrently; return (accepted reports, elapsed seconds)."""
+    jobs = [
+        _client(port, f"U{c:04d}", [str(10000001 + (c + i) % rumours) for i in range(reports)])
+        for c in range(clients)
+    ]
+    start = time.perf_counter()
+    accepted = sum(await asyncio.gather(*jobs))
+    return accepted, time.perf_counter() - start
+
+
+def main() -> None:
+    """Measure report submissions per second."""
+    parser = argparse.ArgumentParser(description="Benchmark report submission over HTTP")
+    parser.add_argument("--clients", type=int, default=20, help="concurrent keep-alive clients")
+    parser.add_argument("--reports", type=int, default=50, help="reports sent by each client")
+    parser.add_argument("--rumours", type=int, default=1000, help="rumours in the dataset")
+    parser.add_argument("--journal", action="store_true", help="append reports to the journal instead of rewriting")
+    parser.add_argument("--write-behind", action="store_true", help="defer rumour saves until the server closes")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        service = _make_service(Path(tmp), args.rumours, args.clients, args.journal, args.write_behind)
+        server = RumourAPIServer(service, port=0)
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def serve() -> None:
+            asyncio.set_event_loop(loop)
+            loop.run_until_complete(server.start())
+            ready.set()
+            loop.run_forever()
+
+        thread = threading.Thread(target=serve, daemon=True)
+        thread.start()
+        ready.wait()
+        try:
+            accepted, elapsed = asyncio.run(_drive(server.port, args.clients, args.reports, args.rumours))
+        finally:
+            asyncio.run_coroutine_threadsafe(server.close(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+
+    mode = ("journal" if args.journal else "snapshot") + (", write-behind" if args.write_behind else "")
+    print(f"{accepted} reports from {args.clients} clients in {elapsed:.2f}s ({accepted / elapsed:,.0f} req/s, {mode})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Insert throughput benchmark for the ID allocator.
+
+Run with ``python -m benchmarks.bench_inserts [--reports 10000 100000] [--inserts 20000] [--processes 4]``.
+
+For every scale a synthetic dataset is generated with ``benchmarks.datagen``
+and ``add_report`` / ``add_rumour`` are timed in write-behind mode, so the
+numbers show the in-memory insert cost (ID allocation included) without
+the file writes. Then ``--processes`` processes insert reports into the
+same directory at once (saving in batches) and the reloaded data is
+checked for duplicate report IDs.
+"""
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Tuple
+
+from benchmarks.datagen import RUMOUR_ID_BASE, generate
+from business_rules import REPORT_TYPES
+from Models import ReportModel, RumourModel
+
+BATCH = 50  # รายงานต่อการบันทึกหนึ่งครั้งในการทดสอบหลาย process
+
+
+def _insert_reports(data_dir: Path, rumours: int, inserts: int) -> float:
+    """Add ``inserts`` reports in memory; return reports per second."""
+    model = ReportModel(data_dir / "reports.json", write_behind=True)
+    start = time.perf_counter()
+    for i in range(inserts):
+        model.add_report(f"B{i:07d}", str(RUMOUR_ID_BASE + i % rumours), REPORT_TYPES[0], "")
+    return inserts / (time.perf_counter() - start)
+
+
+def _insert_rumours(data_dir: Path, inserts: int) -> float:
+    """Add ``inserts`` rumours in memory; return rumours per second."""
+    model = RumourModel(data_dir / "rumours.json", write_behind=True)
+    start = time.perf_counter()
+    for i in range(inserts):
+        model.add_rumour(f"ข่าวทดสอบ {i}", "Benchmark", 50)
+    return inserts / (time.perf_counter() - start)
+
+
+def _inserter(data_dir: str, process: int, inserts: int, rumours: int, barrier) -> None:
+    """Insert reports from one process, saving every ``BATCH`` reports."""
+    model = ReportModel(Path(data_dir) / "reports.json", journal=True, write_behind=True)
+    barrier.wait()
+    for i in range(inserts):
+        model.add_report(f"P{process}-{i:07d}", str(RUMOUR_ID_BASE + i % rumours), REPORT_TYPES[0], "")
+        if i % BATCH == BATCH - 1:
+            model.flush()
+    model.flush()
+
+
+def run_concurrent(data_dir: Path, processes: int, inserts: int, rumours: int) -> Tuple[float, int, int]:
+    """Insert from several processes at once; return (reports/s, stored reports, duplicate IDs)."""
+    before = len(ReportModel(data_dir / "reports.json", journal=True).view_all())
+    barrier = multiprocessing.Barrier(processes + 1)
+    workers = [
+        multiprocessing.Process(target=_inserter, args=(str(data_dir), p, inserts, rumours, barrier))
+        for p in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    reports = ReportModel(data_dir / "reports.json", journal=True).view_all()
+    duplicates = sum(count - 1 for count in Counter(report["reportId"] for report in reports).values() if count > 1)
+    return (len(reports) - before) / elapsed, len(reports) - before, duplicates
+
+
+def main() -> None:
+    """Measure insert throughput at the requested scales."""
+    parser = argparse.ArgumentParser(description="Benchmark rumour/report inserts and ID allocation")
+    parser.add_argument("--reports", type=int, nargs="+", default=[10_000, 100_000], help="dataset scales")
+    parser.add_argument("--inserts", type=int, default=20_000, help="inserts per measurement")
+    parser.add_argument("--processes", type=int, default=4, help="concurrent inserting processes")
+    parser.add_argument("--process-inserts", type=int, default=500, help="reports inserted by each process")
+    args = parser.parse_args()
+
+    for reports in args.reports:
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = Path(tmp)
+            sizes = generate(data_dir, reports)
+            print(f"--- {reports:,} reports ---")
+            print(f"  add_report           {_insert_reports(data_dir, sizes['rumours'], args.inserts):>12,.0f} /s")
+            print(f"  add_rumour           {_insert_rumours(data_dir, args.inserts):>12,.0f} /s")
+            rate, stored, duplicates = run_concurrent(
+                data_dir, args.processes, args.process_inserts, sizes["rumours"]
+            )
+            print(
+                f"  {args.processes} processes          {rate:>12,.0f} /s"
+                f"  ({stored:,} stored, {duplicates} duplicate IDs)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""UI latency benchmark: main-thread stalls while rumours are saved.
+
+Run with ``python -m benchmarks.bench_io_latency [--count N]``. A loop on the
+main thread ticks every millisecond (standing in for the Tk event loop) and
+records the longest gap between ticks while the model is saved either
+synchronously or on the IOWorker thread. One frame at 60 Hz is 16.7 ms.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+from Models import RumourModel
+from Services import IOWorker
+
+TICK_SECONDS = 0.001
+
+
+def _make_model(data_dir: Path, count: int) -> RumourModel:
+    """Create a write-behind model with ``count`` rumours."""
+    path = data_dir / "rumours.json"
+    with path.open("w", encoding="utf-8") as handle:
+        json.dump(
+            [{"rumourId": str(10000001 + i), "title": f"ข่าวลือ {i}", "status": "ปกติ"} for i in range(count)],
+            handle,
+            ensure_ascii=False,
+        )
+    return RumourModel(path, write_behind=True)
+
+
+def _max_gap(run_until_done: Callable[[], bool]) -> float:
+    """Tick until ``run_until_done()`` returns True; return the longest gap in ms."""
+    longest = 0.0
+    last = time.perf_counter()
+    while not run_until_done():
+        time.sleep(TICK_SECONDS)
+        now = time.perf_counter()
+        longest = max(longest, now - last)
+        last = now
+    return longest * 1000
+
+
+def measure_sync(model: RumourModel) -> float:
+    """Longest main-thread stall when saving inline."""
+    model.update_status("10000001", "panic")
+    start = time.perf_counter()
+    model.flush()
+    return (time.perf_counter() - start) * 1000
+
+
+def measure_background(model: RumourModel, worker: IOWorker) -> float:
+    """Longest main-thread stall when the save runs on the worker."""
+    model.update_status("10000001", "ปกติ")
+    done = []
+    job = model.begin_flush()
+    worker.submit(job, lambda result, error: (model.end_flush(None if error else result), done.append(True)))
+
+    def finished() -> bool:
+        worker.poll()
+        return bool(done)
+
+    return _max_gap(finished)
+
+
+def main() -> None:
+    """Compare inline and background saves."""
+    parser = argparse.ArgumentParser(description="Measure UI stalls during saves")
+    parser.add_argument("--count", type=int, nargs="+", default=[10_000, 100_000], help="rumours in the file")
+    args = parser.parse_args()
+
+    worker = IOWorker()
+    print(f"{'rumours':>8} {'inline stall ms':>16} {'background max gap ms':>22}")
+    for count in args.count:
+        with tempfile.TemporaryDirectory() as tmp:
+            model = _make_model(Path(tmp), count)
+            inline = measure_sync(model)
+            background = measure_background(model, worker)
+        print(f"{count:>8} {inline:>16.1f} {background:>22.1f}")
+    worker.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Micro-benchmark: lookup time of the model indexes as the dataset grows.
+
+Run with ``python -m benchmarks.bench_lookups``.
+"""
+from __future__ import annotations
+
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from Models import ReportModel, RumourModel, UserModel
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+LOOKUPS = 100_000
+
+
+def _write_json(path: Path, records: List[Dict]) -> None:
+    """Write records to a JSON file (compact, for speed)."""
+    with path.open("w", encoding="utf-8") as handle:
+        json.dump(records, handle, ensure_ascii=False)
+
+
+def _time_per_call(func: Callable[[int], object], calls: int) -> float:
+    """Return average time per call in microseconds."""
+    start = time.perf_counter()
+    for i in range(calls):
+        func(i)
+    return (time.perf_counter() - start) / calls * 1_000_000
+
+
+def run(size: int, data_dir: Path) -> Dict[str, float]:
+    """Build a dataset of ``size`` records and time id lookups on it."""
+    rumour_ids = [str(10000001 + i) for i in range(size)]
+    user_ids = [f"U{i:07d}" for i in range(size)]
+    _write_json(data_dir / "rumours.json", [{"rumourId": rid, "title": "-"} for rid in rumour_ids])
+    _write_json(data_dir / "users.json", [{"userId": uid, "role": "ผู้ใช้ทั่วไป"} for uid in user_ids])
+    _write_json(
+        data_dir / "reports.json",
+        [
+            {"reportId": f"R{i + 1:04d}", "reporterId": user_ids[i], "rumourId": rumour_ids[i]}
+            for i in range(size)
+        ],
+    )
+
+    rumour_model = RumourModel(data_dir / "rumours.json")
+    user_model = UserModel(data_dir / "users.json")
+    report_model = ReportModel(data_dir / "reports.json")
+
+    rng = random.Random(size)
+    picks = [rng.randrange(size) for _ in range(LOOKUPS)]
+    return {
+        "rumour_get_by_id_us": _time_per_call(lambda i: rumour_model.get_by_id(rumour_ids[picks[i]]), LOOKUPS),
+        "user_get_by_id_us": _time_per_call(lambda i: user_model.get_by_id(user_ids[picks[i]]), LOOKUPS),
+        "report_has_report_us": _time_per_call(
+            lambda i: report_model.has_report(user_ids[picks[i]], rumour_ids[picks[i]]), LOOKUPS
+        ),
+    }
+
+
+def main() -> None:
+    """Print lookup latency for each dataset size."""
+    print(f"{'records':>10} {'rumour.get_by_id':>18} {'user.get_by_id':>16} {'has_report':>12}  (us/call)")
+    for size in SIZES:
+        with tempfile.TemporaryDirectory() as tmp:
+            result = run(size, Path(tmp))
+        print(
+            f"{size:>10} {result['rumour_get_by_id_us']:>18.3f} "
+            f"{result['user_get_by_id_us']:>16.3f} {result['report_has_report_us']:>12.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Memory benchmark: RSS per million rumours/reports as dicts vs slotted records.
+
+Run with ``python -m benchmarks.bench_memory [--count N]``. Every measurement
+runs in a fresh subprocess so earlier allocations do not distort the result.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+from typing import Callable, Dict, List, Optional
+
+from business_rules import REPORT_TYPES, STATUS_NORMAL, STATUS_PANIC
+from Models import ReportRecord, RumourRecord
+
+SOURCES = ["Facebook Group", "LINE Chat", "Twitter", "TikTok", "YouTube", "เว็บไซต์ข่าว"]
+
+
+def _rss_bytes() -> int:
+    """Current resident set size of this process (Linux), or 0 if unknown."""
+    try:
+        with open("/proc/self/statm", "r", encoding="ascii") as handle:
+            return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+
+def _rumours_json(count: int) -> str:
+    """Generate a JSON array of ``count`` rumours."""
+    rng = random.Random(1)
+    return json.dumps(
+        [
+            {
+                "rumourId": str(10000001 + i),
+                "title": f"ข่าวลือหมายเลข {i}",
+                "source": rng.choice(SOURCES),
+                "createdDate": f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                "credibilityScore": rng.randint(0, 100),
+                "status": STATUS_PANIC if rng.random() < 0.1 else STATUS_NORMAL,
+                "verified": None,
+                "verifiedBy": None,
+                "verifiedDate": None,
+            }
+            for i in range(count)
+        ],
+        ensure_ascii=False,
+    )
+
+
+def _reports_json(count: int) -> str:
+    """Generate a JSON array of ``count`` reports."""
+    rng = random.Random(2)
+    return json.dumps(
+        [
+            {
+                "reportId": f"R{i + 1:04d}",
+                "reporterId": f"U{rng.randint(1, 50000):04d}",
+                "rumourId": str(10000001 + rng.randint(0, count // 10)),
+                "reportDate": f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                "reportType": rng.choice(REPORT_TYPES),
+                "description": "",
+            }
+            for i in range(count)
+        ],
+        ensure_ascii=False,
+    )
+
+
+def measure(kind: str, mode: str, count: int) -> int:
+    """Parse ``count`` records of ``kind`` in ``mode`` and return the RSS growth in bytes."""
+    text = _rumours_json(count) if kind == "rumours" else _reports_json(count)
+    hook: Optional[Callable[[Dict], object]] = None
+    if mode == "records":
+        hook = RumourRecord.from_dict if kind == "rumours" else ReportRecord.from_dict
+    before = _rss_bytes()
+    records: List = json.loads(text, object_hook=hook)
+    after = _rss_bytes()
+    assert len(records) == count
+    return after - before
+
+
+def main() -> None:
+    """Compare dict and record representations, scaled to one million records."""
+    parser = argparse.ArgumentParser(description="Compare RSS of dict vs slotted records")
+    parser.add_argument("--count", type=int, default=1_000_000, help="records per measurement")
+    parser.add_argument("--child", nargs=2, metavar=("KIND", "MODE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(measure(args.child[0], args.child[1], args.count))
+        return
+
+    if not _rss_bytes():
+        print("RSS measurement is only supported on Linux (/proc/self/statm)")
+        return
+    print(f"{'kind':>8} {'dict MB/1M':>12} {'records MB/1M':>14} {'saving':>8}")
+    for kind in ("rumours", "reports"):
+        result = {}
+        for mode in ("dict", "records"):
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_memory", "--count", str(args.count), "--child", kind, mode],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            result[mode] = int(output.strip()) / args.count * 1_000_000 / (1024 * 1024)
+        saving = 1 - result["records"] / result["dict"] if result["dict"] else 0.0
+        print(f"{kind:>8} {result['dict']:>12.1f} {result['records']:>14.1f} {saving:>7.0%}")
+
+
+if __name__ == "__main__":
+    main()
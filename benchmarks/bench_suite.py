@@ -0,0 +1,274 @@
+"""Headless benchmark suite for model and controller operations.
+
+Run with ``python -m benchmarks.bench_suite [--reports 1000 10000 100000] [--output FILE] [--compare BASELINE]``.
+
+For every scale a synthetic dataset is generated with ``benchmarks.datagen``
+and the operations behind each screen are timed without opening a Tk
+window: loading the files (parsed and from the snapshot cache), ``get_report_counts``, ``has_report``, the
+ordering used by ``show_list_view``, the summary buckets (and the old full
+scan with the ``business_rules`` filters), the peak memory of a view
+refresh read through copy-free views against one built from copied
+lists, combined queries on the
+secondary indexes (against a full scan), title search, ``add_report`` +
+save in both storage modes and ``_next_id``. Results are written as JSON; ``--compare``
+prints the ratio to an earlier run and exits with status 1 on regressions.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional
+
+from benchmarks.datagen import RUMOUR_ID_BASE, generate
+from business_rules import (
+    REPORT_TYPES,
+    STATUS_PANIC,
+    SUMMARY_BUCKETS,
+    filter_rumours_by_status,
+    filter_rumours_by_verified,
+)
+from Models import ReportModel, RumourModel, RumourQuery, UserModel
+from Services import RumourService
+
+LOOKUPS = 20_000
+PAGE_SIZE = 50
+# "ข่าวลือ panic จาก LINE Chat ที่สร้างในเดือนกรกฎาคม"
+QUERY = {"status": STATUS_PANIC, "source": "LINE Chat", "created_from": "2025-07-01", "created_to": "2025-07-31"}
+# จำนวนรายงานที่เพิ่มในแต่ละโหมด (โหมด snapshot เขียนทั้งไฟล์ทุกครั้ง จึงใช้น้อยกว่า)
+SNAPSHOT_ADDS = 5
+JOURNAL_ADDS = 200
+
+
+def _best(func: Callable[[], object], repeat: int) -> float:
+    """Return the fastest of ``repeat`` runs of ``func`` in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _per_call_us(func: Callable[[int], object], calls: int) -> float:
+    """Return average time per call of ``func(i)`` in microseconds."""
+    start = time.perf_counter()
+    for i in range(calls):
+        func(i)
+    return (time.perf_counter() - start) / calls * 1_000_000
+
+
+def _drain(iterables: Iterable[Iterable[object]]) -> int:
+    """Read every item of every iterable once; return how many there were."""
+    return sum(sum(1 for _ in items) for items in iterables)
+
+
+def _peak_kb(func: Callable[[], object]) -> float:
+    """Return the peak memory allocated while running ``func`` in KiB."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def _open(data_dir: Path, journal: bool = False) -> RumourService:
+    """Load the three models from ``data_dir``."""
+    return RumourService(
+        RumourModel(data_dir / "rumours.json"),
+        ReportModel(data_dir / "reports.json", journal=journal),
+        UserModel(data_dir / "users.json"),
+    )
+
+
+def _add_reports(data_dir: Path, sizes: Dict[str, int], journal: bool, count: int) -> float:
+    """Submit ``count`` new reports through the service; return ms per report including the save."""
+    service = _open(data_dir, journal)
+    rng = random.Random(1)
+    submitted = 0
+    start = time.perf_counter()
+    while submitted < count:
+        user_id = f"U{rng.randrange(sizes['users']) + 1:04d}"
+        rumour_id = str(RUMOUR_ID_BASE + rng.randrange(sizes["rumours"]))
+        if service.check_report(user_id, rumour_id, REPORT_TYPES[0]) is None:
+            service.submit_report(user_id, rumour_id, REPORT_TYPES[0], "")
+            submitted += 1
+    return (time.perf_counter() - start) / count * 1000
+
+
+def run(reports: int, repeat: int) -> Dict[str, float]:
+    """Generate one dataset and time every operation on it."""
+    results: Dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        start = time.perf_counter()
+        sizes = generate(data_dir, reports)
+        results["generate_s"] = time.perf_counter() - start
+
+        # ----- โหลดข้อมูล -----
+        results["load_rumours_s"] = _best(lambda: RumourModel(data_dir / "rumours.json"), repeat)
+        results["load_reports_s"] = _best(lambda: ReportModel(data_dir / "reports.json"), repeat)
+        results["load_users_s"] = _best(lambda: UserModel(data_dir / "users.json"), repeat)
+        # ครั้งแรกเขียน cache ครั้งต่อไปอ่านจาก cache (เก็บเวลาที่เร็วที่สุด)
+        results["load_rumours_cached_s"] = _best(
+            lambda: RumourModel(data_dir / "rumours.json", snapshot_cache=True), repeat + 1
+        )
+        results["load_reports_cached_s"] = _best(
+            lambda: ReportModel(data_dir / "reports.json", snapshot_cache=True), repeat + 1
+        )
+        service = _open(data_dir)
+        rumours, report_model = service.rumour_model, service.report_model
+
+        # ----- การค้นหา -----
+        rng = random.Random(0)
+        pairs = [
+            (f"U{rng.randrange(sizes['users']) + 1:04d}", str(RUMOUR_ID_BASE + rng.randrange(sizes["rumours"])))
+            for _ in range(LOOKUPS)
+        ]
+        results["get_report_counts_us"] = _per_call_us(lambda i: report_model.get_report_counts(), LOOKUPS)
+        results["has_report_us"] = _per_call_us(lambda i: report_model.has_report(*pairs[i]), LOOKUPS)
+
+        # ----- show_list_view: สร้างลำดับครั้งแรก แล้วดึงหน้าแรก -----
+        def build_ranking() -> None:
+            service._ranking = None
+            service.get_ranking()
+
+        results["list_view_ranking_s"] = _best(build_ranking, repeat)
+        ranking = service.get_ranking()
+        results["list_view_page_us"] = _per_call_us(lambda i: ranking.page(i % 10 * PAGE_SIZE, PAGE_SIZE), 1000)
+
+        # ----- show_summary_view: bucket ที่เก็บไว้ เทียบกับการกรองทั้งหมด -----
+        results["summary_buckets_us"] = _per_call_us(lambda i: _drain(service.get_summary().values()), 1000)
+        all_rumours = rumours.view_all()
+        results["summary_scan_ms"] = _best(
+            lambda: _drain(
+                (
+                    filter_rumours_by_status(all_rumours, STATUS_PANIC),
+                    filter_rumours_by_verified(all_rumours, True),
+                    filter_rumours_by_verified(all_rumours, False),
+                )
+            ),
+            repeat,
+        ) * 1000
+        results["summary_panic_rumours"] = _drain([service.get_summary()[SUMMARY_BUCKETS[0]]])
+
+        # ----- หน่วยความจำสูงสุดระหว่าง refresh: อ่านผ่าน view / iterator เทียบกับการ copy เป็น list -----
+        results["summary_refresh_peak_kb"] = _peak_kb(lambda: _drain(service.get_summary().values()))
+        results["summary_refresh_copy_peak_kb"] = _peak_kb(
+            lambda: [rumours.get_bucket(name) for name in SUMMARY_BUCKETS]
+        )
+        results["filter_pipeline_peak_kb"] = _peak_kb(
+            lambda: _drain([filter_rumours_by_verified(filter_rumours_by_status(rumours.view_all(), STATUS_PANIC), None)])
+        )
+        results["filter_pipeline_copy_peak_kb"] = _peak_kb(
+            lambda: list(filter_rumours_by_verified(list(filter_rumours_by_status(rumours.get_all(), STATUS_PANIC)), None))
+        )
+
+        # ----- query หลายเงื่อนไข: ดัชนีรอง เทียบกับการกรองทั้งหมด -----
+        start = time.perf_counter()
+        rumours._query_index()
+        results["query_index_build_s"] = time.perf_counter() - start
+        results["query_ms"] = _best(lambda: list(rumours.query(**QUERY)), repeat) * 1000
+        matches = RumourQuery(**QUERY).matches
+        results["query_scan_ms"] = _best(lambda: [r for r in all_rumours if matches(r)], repeat) * 1000
+        results["query_rumours"] = len(list(rumours.query(**QUERY)))
+
+        # ----- ค้นหาจากช่องค้นหาใน list view -----
+        start = time.perf_counter()
+        rumours.build_search_index()
+        results["search_index_build_s"] = time.perf_counter() - start
+        queries = [all_rumours[rng.randrange(len(all_rumours))]["title"][2:8] for _ in range(50)]
+        # ผลค้นหาจัดอันดับเมื่ออ่าน: เวลาถึงหน้าแรก (สิ่งที่ list view วาดก่อน) และเวลานับผลทั้งหมด
+        results["search_ms"] = _per_call_us(lambda i: rumours.search(queries[i])[:50], len(queries)) / 1000
+        results["search_count_ms"] = _per_call_us(lambda i: len(rumours.search(queries[i])), len(queries)) / 1000
+
+        # ----- การสร้างรหัสใหม่ -----
+        results["next_id_report_us"] = _per_call_us(lambda i: report_model._next_id(), 100)
+        results["next_id_rumour_us"] = _per_call_us(lambda i: rumours._next_id(), 100)
+
+        # ----- add_report + save (ทำท้ายสุด เพราะแก้ไขไฟล์) -----
+        results["add_report_snapshot_ms"] = _add_reports(data_dir, sizes, False, SNAPSHOT_ADDS)
+        results["add_report_journal_ms"] = _add_reports(data_dir, sizes, True, JOURNAL_ADDS)
+    return results
+
+
+def _git_commit() -> Optional[str]:
+    """Return the current git commit, if available."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: Dict, baseline: Dict, tolerance: float) -> int:
+    """Print time ratios against ``baseline``; return the number of regressions."""
+    regressions = 0
+    print(f"{'scale':>9} {'metric':<26} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for scale, metrics in current["results"].items():
+        old_metrics = baseline.get("results", {}).get(scale, {})
+        for name, value in metrics.items():
+            old = old_metrics.get(name)
+            # เปรียบเทียบเฉพาะค่าที่เป็นเวลา (ลงท้ายด้วยหน่วย)
+            if old is None or not old or not name.endswith(("_s", "_ms", "_us")):
+                continue
+            ratio = value / old
+            flag = ""
+            if ratio > 1 + tolerance:
+                flag = "  REGRESSION"
+                regressions += 1
+            print(f"{scale:>9} {name:<26} {old:>12.3f} {value:>12.3f} {ratio:>7.2f}{flag}")
+    return regressions
+
+
+def main() -> None:
+    """Run the suite at the requested scales."""
+    parser = argparse.ArgumentParser(description="Time model and controller operations headlessly")
+    parser.add_argument(
+        "--reports", type=int, nargs="+", default=[1_000, 10_000, 100_000], help="dataset scales (10^3 .. 10^7)"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="runs per timing (the fastest is kept)")
+    parser.add_argument("--output", type=Path, help="write the results to this JSON file")
+    parser.add_argument("--compare", type=Path, help="baseline JSON file from an earlier run")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown before flagging (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+        },
+        "results": {},
+    }
+    for reports in args.reports:
+        results = run(reports, args.repeat)
+        report["results"][str(reports)] = results
+        print(f"--- {reports:,} reports ---")
+        for name, value in results.items():
+            print(f"  {name:<26} {value:>12.3f}")
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"Results written to {args.output}")
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print(f"{regressions} regression(s) above {args.tolerance:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
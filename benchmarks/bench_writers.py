@@ -0,0 +1,123 @@
+"""Multi-process benchmark: N writer processes sharing one data directory.
+
+Run with ``python -m benchmarks.bench_writers [--writers 1 2 4 8] [--reports N] [--no-journal]``.
+Each writer process submits reports as its own users through RumourService;
+the clock starts once every writer has loaded the data.
+Afterwards the files are reloaded and checked for lost reports and for
+rumours that crossed the panic threshold without switching status.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from business_rules import REPORT_TYPES, should_trigger_panic_window
+from Models import ReportModel, RumourModel, UserModel
+from Services import RumourService, ServiceError
+
+USERS_PER_WRITER = 50
+
+
+def _write_json(path: Path, records: List[Dict]) -> None:
+    """Write records to a JSON file."""
+    with path.open("w", encoding="utf-8") as handle:
+        json.dump(records, handle, ensure_ascii=False)
+
+
+def _prepare(data_dir: Path, rumours: int, writers: int) -> None:
+    """Create a fresh dataset with enough users for every writer."""
+    _write_json(
+        data_dir / "rumours.json",
+        [{"rumourId": str(10000001 + i), "title": f"ข่าวลือ {i}", "status": "ปกติ"} for i in range(rumours)],
+    )
+    _write_json(
+        data_dir / "users.json",
+        [{"userId": f"U{i:05d}", "role": "ผู้ใช้ทั่วไป"} for i in range(writers * USERS_PER_WRITER)],
+    )
+    _write_json(data_dir / "reports.json", [])
+
+
+def _open(data_dir: Path, journal: bool) -> RumourService:
+    """Open the models on the shared directory."""
+    return RumourService(
+        RumourModel(data_dir / "rumours.json"),
+        ReportModel(data_dir / "reports.json", journal=journal),
+        UserModel(data_dir / "users.json"),
+    )
+
+
+def _writer(
+    data_dir: str, journal: bool, writer: int, reports: int, rumours: int, barrier, results
+) -> None:
+    """Submit ``reports`` reports from one process; put (accepted, start, end) on ``results``."""
+    service = _open(Path(data_dir), journal)
+    # เริ่มจับเวลาพร้อมกันหลังทุก process โหลดข้อมูลเสร็จ
+    barrier.wait()
+    start = time.perf_counter()
+    accepted = 0
+    for i in range(reports):
+        user_id = f"U{writer * USERS_PER_WRITER + i % USERS_PER_WRITER:05d}"
+        rumour_id = str(10000001 + (i // USERS_PER_WRITER * 7 + writer) % rumours)
+        try:
+            service.submit_report(user_id, rumour_id, REPORT_TYPES[i % len(REPORT_TYPES)], "")
+            accepted += 1
+        except ServiceError:  # รายงานซ้ำ
+            pass
+    results.put((accepted, start, time.perf_counter()))
+
+
+def run(writers: int, reports: int, rumours: int, journal: bool) -> Tuple[float, int, int, int]:
+    """Run one configuration; return (seconds, accepted, stored, panic mistakes)."""
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        _prepare(data_dir, rumours, writers)
+        barrier = multiprocessing.Barrier(writers)
+        results = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(target=_writer, args=(tmp, journal, w, reports, rumours, barrier, results))
+            for w in range(writers)
+        ]
+        for process in processes:
+            process.start()
+        outcomes = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+        accepted = sum(outcome[0] for outcome in outcomes)
+        elapsed = max(outcome[2] for outcome in outcomes) - min(outcome[1] for outcome in outcomes)
+        service = _open(data_dir, journal)
+        stored = len(service.report_model.view_all())
+        mistakes = sum(
+            1
+            for rumour in service.rumour_model.view_all()
+            if should_trigger_panic_window(service.report_model.get_recent_report_counts(rumour["rumourId"]))
+            and not service.rumour_model.is_panic(rumour)
+        )
+    return elapsed, accepted, stored, mistakes
+
+
+def main() -> None:
+    """Measure aggregate report throughput as writer processes are added."""
+    parser = argparse.ArgumentParser(description="Benchmark concurrent writer processes")
+    parser.add_argument("--writers", type=int, nargs="+", default=[1, 2, 4, 8], help="writer process counts")
+    parser.add_argument("--reports", type=int, default=200, help="reports per writer")
+    parser.add_argument("--rumours", type=int, default=500, help="rumours in the dataset")
+    parser.add_argument(
+        "--no-journal", dest="journal", action="store_false", help="rewrite reports.json for every report"
+    )
+    args = parser.parse_args()
+
+    print(f"{'writers':>7} {'accepted':>9} {'stored':>7} {'lost':>5} {'panic errors':>13} {'reports/s':>10}")
+    for writers in args.writers:
+        elapsed, accepted, stored, mistakes = run(writers, args.reports, args.rumours, args.journal)
+        print(
+            f"{writers:>7} {accepted:>9} {stored:>7} {accepted - stored:>5} {mistakes:>13} {accepted / elapsed:>10,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
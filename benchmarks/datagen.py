@@ -0,0 +1,208 @@
+"""Synthetic data generator for ``rumours.json``, ``reports.json`` and ``users.json``.
+
+Run with ``python -m benchmarks.datagen OUT_DIR --reports N [--rumours N] [--users N]``.
+
+The data follows the shape of the files in ``Data/``: Thai titles and
+names, sources and report types drawn with realistic weights, and a
+Zipf-like report distribution (a few rumours collect most reports). Every
+(reporterId, rumourId) pair is unique, rumours with enough reports are in
+panic status and a share of rumours is already verified by an inspector.
+Files are written as a stream, so 10^7 reports never sit in memory.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+from datetime import date, timedelta
+from math import gcd
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from business_rules import REPORT_TYPES, STATUS_NORMAL, STATUS_PANIC, should_trigger_panic
+
+ROLE_INSPECTOR = "ผู้ตรวจสอบ"
+ROLE_USER = "ผู้ใช้ทั่วไป"
+
+SUBJECTS = [
+    "วัคซีนโควิด-19", "น้ำมะนาว", "ธนาคารออมสิน", "รถไฟฟ้าสายสีม่วง", "น้ำท่วมกรุงเทพ", "ไข่ไก่",
+    "มหาวิทยาลัยชื่อดัง", "ห้างสรรพสินค้า", "สัญญาณ 5G", "แผ่นดินไหว", "ค่าไฟฟ้า", "บัตรประชาชน",
+    "นมกล่อง", "ยาสมุนไพร", "โรงภาพยนตร์", "เงินดิจิทัล", "ร้านอาหารดัง", "กระทรวงสาธารณสุข",
+]
+CLAIMS = [
+    "มีชิปติดตามตัว", "รักษามะเร็งได้", "จะปิดทำการถาวร", "ทำให้เป็นหมัน", "แจกเงินฟรี",
+    "ปนเปื้อนสารพิษ", "จะขึ้นราคาสามเท่า", "ถูกแฮกข้อมูลทั้งหมด", "ทำให้ภูมิคุ้มกันลดลง",
+    "จะงดให้บริการ", "เป็นของปลอม", "ทำให้เกิดมะเร็ง",
+]
+SUFFIXES = ["", "", "", " ภายใน 3 วัน", " จริงหรือ?", " แชร์ด่วน!", " ตั้งแต่เดือนหน้า", " ทั่วประเทศ"]
+
+# แหล่งที่มาพร้อมน้ำหนัก (โซเชียลมีเดียพบบ่อยกว่า)
+SOURCES = {
+    "Facebook": 20, "Facebook Group": 15, "LINE Chat": 15, "LINE Group": 10, "Twitter": 12, "TikTok": 10,
+    "Instagram": 6, "YouTube": 5, "News Website": 4, "Local News": 2, "Food Blog": 1,
+}
+REPORT_TYPE_WEIGHTS = [50, 30, 20]
+DESCRIPTIONS = [
+    "", "", "ไม่มีหลักฐานทางวิทยาศาสตร์รองรับ", "ทำให้ประชาชนเกิดความหวาดกลัว", "ข้อมูลไม่ตรงกับแหล่งทางการ",
+    "มีการตัดต่อภาพ", "อ้างแหล่งข่าวที่ไม่มีอยู่จริง",
+]
+FIRST_NAMES = ["สมชาย", "สมหญิง", "วิชัย", "มาลี", "ประเสริฐ", "สุดา", "อนันต์", "กมลา", "ธนา", "ปิยะ", "นภา", "ชัยวัฒน์"]
+LAST_NAMES = ["ใจดี", "รักษ์ดี", "ศรีสุข", "วงศ์ทอง", "มั่นคง", "แสงทอง", "บุญมา", "ทองคำ", "สายชล", "พรหมมา"]
+
+START_DATE = date(2025, 6, 1)
+RUMOUR_ID_BASE = 10000001
+INSPECTOR_SHARE = 0.1
+VERIFIED_SHARE = 0.05
+
+
+def write_json_array(path: Path, items: Iterable[Dict], indent: Optional[int] = None) -> int:
+    """Stream ``items`` to ``path`` as one JSON array; return the number written."""
+    count = 0
+    separator = ",\n" if indent else ","
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write("[\n" if indent else "[")
+        for item in items:
+            if count:
+                handle.write(separator)
+            text = json.dumps(item, ensure_ascii=False, indent=indent)
+            handle.write(text.replace("\n", "\n" + " " * indent) if indent else text)
+            count += 1
+        handle.write("\n]" if indent else "]")
+    return count
+
+
+def skewed_counts(total: int, buckets: int, cap: int, skew: float, rng: random.Random) -> List[int]:
+    """Split ``total`` into ``buckets`` Zipf-distributed counts of at most ``cap``, in random order."""
+    if total > buckets * cap:
+        raise ValueError(f"cannot place {total} reports on {buckets} rumours with {cap} users")
+    weights = [1.0 / (rank + 1) ** skew for rank in range(buckets)]
+    scale = total / sum(weights)
+    counts = [min(cap, int(weight * scale)) for weight in weights]
+    # แจกส่วนที่เหลือ (จากการปัดเศษและการจำกัดเพดาน) ให้ข่าวลือที่ยังไม่เต็ม ไล่จากอันดับสูง
+    remaining = total - sum(counts)
+    while remaining:
+        for index in range(buckets):
+            if counts[index] < cap:
+                counts[index] += 1
+                remaining -= 1
+                if not remaining:
+                    break
+    rng.shuffle(counts)
+    return counts
+
+
+def _day(rng: random.Random, start: date, span_days: int) -> str:
+    """A random ISO date within ``span_days`` after ``start``."""
+    return (start + timedelta(days=rng.randrange(span_days))).isoformat()
+
+
+def _users(count: int, seed: int) -> Iterator[Dict]:
+    """Generate user records; about one in ten is an inspector."""
+    rng = random.Random(seed)
+    for n in range(1, count + 1):
+        yield {
+            "userId": f"U{n:04d}",
+            "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "role": ROLE_INSPECTOR if rng.random() < INSPECTOR_SHARE else ROLE_USER,
+            "email": f"user{n}@example.com",
+            "password": f"hashed_password_{n}",
+            "joinedDate": _day(rng, START_DATE - timedelta(days=365), 365),
+        }
+
+
+def _rumours(counts: List[int], inspectors: List[str], seed: int) -> Iterator[Dict]:
+    """Generate rumour records whose status matches their report count."""
+    rng = random.Random(seed)
+    sources, source_weights = list(SOURCES), list(SOURCES.values())
+    for index, report_count in enumerate(counts):
+        verified = None
+        if inspectors and rng.random() < VERIFIED_SHARE:
+            verified = rng.random() < 0.3
+        created = _day(rng, START_DATE, 300)
+        yield {
+            "rumourId": str(RUMOUR_ID_BASE + index),
+            "title": f"{rng.choice(SUBJECTS)}{rng.choice(CLAIMS)}{rng.choice(SUFFIXES)}",
+            "source": rng.choices(sources, source_weights)[0],
+            "createdDate": created,
+            "credibilityScore": int(100 * rng.betavariate(2, 5)),
+            "status": STATUS_PANIC if should_trigger_panic(report_count) else STATUS_NORMAL,
+            "verified": verified,
+            "verifiedBy": rng.choice(inspectors) if verified is not None else None,
+            "verifiedDate": _day(rng, date.fromisoformat(created), 30) if verified is not None else None,
+        }
+
+
+def _reports(counts: List[int], users: int, seed: int) -> Iterator[Dict]:
+    """Generate reports; each rumour's reporters are distinct users."""
+    rng = random.Random(seed)
+    order = list(range(len(counts)))
+    rng.shuffle(order)
+    report_number = 0
+    for index in order:
+        # เดินแบบก้าวคงที่ที่เป็นจำนวนเฉพาะสัมพัทธ์กับจำนวนผู้ใช้ จึงได้ผู้รายงานไม่ซ้ำกัน
+        start = rng.randrange(users)
+        step = rng.randrange(1, users) if users > 1 else 1
+        while gcd(step, users) != 1:
+            step = rng.randrange(1, users)
+        base = START_DATE + timedelta(days=rng.randrange(300))
+        for k in range(counts[index]):
+            report_number += 1
+            yield {
+                "reportId": f"R{report_number:04d}",
+                "reporterId": f"U{(start + k * step) % users + 1:04d}",
+                "rumourId": str(RUMOUR_ID_BASE + index),
+                "reportDate": _day(rng, base, 30),
+                "reportType": rng.choices(REPORT_TYPES, REPORT_TYPE_WEIGHTS)[0],
+                "description": rng.choice(DESCRIPTIONS),
+            }
+
+
+def generate(
+    out_dir: Path,
+    reports: int,
+    rumours: Optional[int] = None,
+    users: Optional[int] = None,
+    skew: float = 1.1,
+    seed: int = 0,
+    indent: Optional[int] = None,
+) -> Dict[str, int]:
+    """Write the three data files into ``out_dir``; return the number of records of each kind.
+
+    By default there is one rumour per 10 reports and one user per 20
+    reports (with small minimums so tiny scales still work).
+    """
+    rumours = rumours or max(100, reports // 10)
+    users = users or max(100, reports // 20)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed)
+    counts = skewed_counts(reports, rumours, users, skew, rng)
+
+    user_records = list(_users(users, seed + 1)) if users <= 1_000_000 else None
+    if user_records is not None:
+        inspectors = [user["userId"] for user in user_records if user["role"] == ROLE_INSPECTOR]
+        write_json_array(out_dir / "users.json", user_records, indent)
+    else:
+        inspectors = [user["userId"] for user in _users(1000, seed + 1) if user["role"] == ROLE_INSPECTOR]
+        write_json_array(out_dir / "users.json", _users(users, seed + 1), indent)
+    write_json_array(out_dir / "rumours.json", _rumours(counts, inspectors, seed + 2), indent)
+    write_json_array(out_dir / "reports.json", _reports(counts, users, seed + 3), indent)
+    return {"rumours": rumours, "reports": reports, "users": users}
+
+
+def main() -> None:
+    """Generate a dataset from the command line."""
+    parser = argparse.ArgumentParser(description="Generate synthetic rumour tracking data")
+    parser.add_argument("out_dir", type=Path, help="directory to write rumours.json, reports.json and users.json")
+    parser.add_argument("--reports", type=int, default=100_000, help="number of reports (10^3 .. 10^7)")
+    parser.add_argument("--rumours", type=int, help="number of rumours (default: reports / 10)")
+    parser.add_argument("--users", type=int, help="number of users (default: reports / 20)")
+    parser.add_argument("--skew", type=float, default=1.1, help="Zipf exponent of reports per rumour")
+    parser.add_argument("--seed", type=int, default=0, help="random seed (same seed, same data)")
+    parser.add_argument("--indent", type=int, help="pretty-print like Data/ (larger, slower files)")
+    args = parser.parse_args()
+    sizes = generate(args.out_dir, args.reports, args.rumours, args.users, args.skew, args.seed, args.indent)
+    print(f"Wrote {sizes['rumours']} rumours, {sizes['reports']} reports, {sizes['users']} users to {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,21 @@
 """ระบบธุรกิจกฎเกณฑ์และตรรกะสำหรับระบบตติดตามข่าวลือ"""
 
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, Optional, Sequence, Tuple
 
 # กฎการประกาศสถานะ
 PANIC_THRESHOLD = 2  # จำนวนรายงานขั้นต่ำที่ทำให้เปลี่ยนสถานะเป็น panic
 
+# panic ตามความเร็วของรายงาน: (ความยาวหน้าต่างเวลา วินาที, จำนวนรายงานขั้นต่ำในหน้าต่าง)
+# ถึงเกณฑ์หน้าต่างใดหน้าต่างหนึ่ง -> panic
+PANIC_WINDOWS: Tuple[Tuple[int, int], ...] = (
+    (60 * 60, PANIC_THRESHOLD),            # ≥ 2 รายงานใน 1 ชั่วโมงล่าสุด
+    (24 * 60 * 60, 3 * PANIC_THRESHOLD),   # ≥ 6 รายงานใน 24 ชั่วโมงล่าสุด
+)
+# ช่วงคลายตัว: panic จะกลับเป็นปกติเมื่อไม่ถึงเกณฑ์ใน PANIC_WINDOWS และมีรายงานในหน้าต่างนี้น้อยกว่าที่กำหนด
+PANIC_COOLDOWN_WINDOW: Tuple[int, int] = (6 * 60 * 60, PANIC_THRESHOLD)
+# ความยาวหน้าต่างทั้งหมดที่ต้องนับ (ลำดับเดียวกับจำนวนรายงานที่ส่งให้ฟังก์ชันด้านล่าง)
+PANIC_WINDOW_SECONDS: Tuple[int, ...] = tuple(seconds for seconds, _ in PANIC_WINDOWS) + (PANIC_COOLDOWN_WINDOW[0],)
+
 # ประเภทการรายงาน
 REPORT_TYPES = [
     "ข้อมูลเท็จ",
@@ -16,6 +27,12 @@ REPORT_TYPES = [
 STATUS_PANIC = "panic"
 STATUS_NORMAL = "ปกติ"
 
+# หมวดหมู่ในหน้าสรุป
+SUMMARY_PANIC = "panic"
+SUMMARY_VERIFIED_TRUE = "verified_true"
+SUMMARY_VERIFIED_FALSE = "verified_false"
+SUMMARY_BUCKETS = (SUMMARY_PANIC, SUMMARY_VERIFIED_TRUE, SUMMARY_VERIFIED_FALSE)
+
 
 # ฟังก์ชั่น Business Logic
 def should_trigger_panic(report_count: int) -> bool:
@@ -23,6 +40,18 @@ def should_trigger_panic(report_count: int) -> bool:
     return report_count >= PANIC_THRESHOLD
 
 
+def should_trigger_panic_window(window_counts: Sequence[int]) -> bool:
+    """ตรวจสอบว่ารายงานล่าสุดเร็วพอที่จะเปลี่ยนเป็น panic หรือไม่ (จำนวนรายงานตามลำดับ PANIC_WINDOW_SECONDS)"""
+    return any(count >= minimum for count, (_, minimum) in zip(window_counts, PANIC_WINDOWS))
+
+
+def should_end_panic(window_counts: Sequence[int]) -> bool:
+    """ตรวจสอบว่าข่าวลือ panic คลายตัวจนกลับเป็นปกติได้หรือไม่ (จำนวนรายงานตามลำดับ PANIC_WINDOW_SECONDS)"""
+    if should_trigger_panic_window(window_counts):
+        return False
+    return window_counts[len(PANIC_WINDOWS)] < PANIC_COOLDOWN_WINDOW[1]
+
+
 def is_panic_status(status: str) -> bool:
     """ตรวจสอบว่าสถานะเป็น panic หรือไม่"""
     return status == STATUS_PANIC
@@ -61,11 +90,23 @@ def can_verify_rumour(rumour: Dict, is_inspector: bool) -> bool:
     return True
 
 
-def filter_rumours_by_status(rumours: List[Dict], status: str) -> List[Dict]:
-    """กรองข่าวลือตามสถานะ"""
-    return [r for r in rumours if r.get("status") == status]
+def filter_rumours_by_status(rumours: Iterable[Dict], status: str) -> Iterator[Dict]:
+    """กรองข่าวลือตามสถานะ (คืนค่าทีละรายการ ต่อกันเป็นลำดับขั้นได้โดยไม่สร้าง list ใหม่)"""
+    return (r for r in rumours if r.get("status") == status)
+
+
+def filter_rumours_by_verified(rumours: Iterable[Dict], verified: Optional[bool]) -> Iterator[Dict]:
+    """กรองข่าวลือตามสถานะของการยืนยัน (คืนค่าทีละรายการ)"""
+    return (r for r in rumours if r.get("verified") is verified)
 
 
-def filter_rumours_by_verified(rumours: List[Dict], verified: Optional[bool]) -> List[Dict]:
-    """กรองข่าวลือตามสถานะของการยืนยัน"""
-    return [r for r in rumours if r.get("verified") is verified]
+def get_summary_buckets(rumour: Dict) -> Tuple[str, ...]:
+    """หาหมวดหมู่ในหน้าสรุปที่ข่าวลือนี้อยู่ (อาจอยู่ได้มากกว่าหนึ่งหมวด)"""
+    buckets: Tuple[str, ...] = ()
+    if rumour.get("status") == STATUS_PANIC:
+        buckets += (SUMMARY_PANIC,)
+    if rumour.get("verified") is True:
+        buckets += (SUMMARY_VERIFIED_TRUE,)
+    elif rumour.get("verified") is False:
+        buckets += (SUMMARY_VERIFIED_FALSE,)
+    return buckets
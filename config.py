@@ -1,10 +1,53 @@
 """ตั้งค่าทางเทคนิค สำหรับแอปพลิเคชันระบบตติดตามข่าวลือ"""
+import os
 from pathlib import Path
 
 # ตั้งค่าไดเรกทอรี่ (เส้นทางไฟล์ข้อมูล)
 BASE_DIR = Path(__file__).resolve().parent  # โฟลเดอร์หลักโปรเจค
 DATA_DIR = BASE_DIR / "Data"                # โฟลเดอร์เก็บไฟล์ JSON
 
+# ตั้งค่าที่เก็บข้อมูล: "json" (ไฟล์ใน Data/) หรือ "sqlite"
+STORAGE_BACKEND = "json"
+SQLITE_PATH = DATA_DIR / "rumours.db"       # ไฟล์ฐานข้อมูล SQLite (สร้างด้วย migrate_to_sqlite.py)
+
+# ตั้งค่าการบันทึกข่าวลือแบบ write-behind (รวมหลายการแก้ไขเป็นการบันทึกครั้งเดียว)
+RUMOUR_WRITE_BEHIND = False                   # เปิดใช้ write-behind สำหรับ rumours.json
+RUMOUR_SAVE_INTERVAL_MS = 2000                # ระยะเวลาระหว่างการบันทึกแต่ละรอบ (มิลลิวินาที)
+
+# ตั้งค่าการบันทึกรายงาน (journal แบบต่อท้ายไฟล์ reports.journal.jsonl)
+# ปิด journal แล้วทุกรายงานใหม่จะเขียน reports.json ทั้งไฟล์ และ process อื่นต้องโหลดใหม่ทั้งไฟล์ (ช้ามากเมื่อใช้หลาย process)
+REPORT_JOURNAL_ENABLED = True                 # เปิดใช้ journal แทนการเขียน reports.json ใหม่ทั้งไฟล์
+REPORT_JOURNAL_FSYNC = False                  # fsync ทุกครั้งที่ต่อท้ายรายงาน
+REPORT_JOURNAL_COMPACT_BYTES = 8 * 1024 * 1024  # ขนาด journal ที่จะรวมกลับเข้า reports.json (0 = ไม่รวมอัตโนมัติ)
+
+# ตั้งค่าการบันทึกเบื้องหลัง (เขียนไฟล์ใน thread แยก หน้าต่างไม่ค้างระหว่างบันทึก)
+BACKGROUND_IO = True                          # ให้ thread เบื้องหลังเขียน rumours.json / reports.json
+IO_POLL_MS = 50                               # ระยะเวลาตรวจผลการบันทึกจาก thread เบื้องหลัง (มิลลิวินาที)
+IO_MAX_PENDING = 2                            # จำนวนงานเขียนค้างสูงสุด เกินนี้จะรวมการแก้ไขไว้เขียนรอบถัดไป
+IO_RETRY_MAX_MS = 30000                       # ระยะรอสูงสุดก่อนลองบันทึกใหม่หลังล้มเหลว (เพิ่มเป็นสองเท่าทุกครั้งที่ล้มเหลวซ้ำ)
+
+# ตั้งค่าการเริ่มโปรแกรม (cache แบบ binary ของไฟล์ JSON ที่ parse แล้ว อยู่ใน Data/.cache/)
+SNAPSHOT_CACHE_ENABLED = True                 # อ่าน rumours.json / reports.json จาก cache เมื่อไฟล์ไม่เปลี่ยน
+PRELOAD_MODELS = True                         # โหลดข่าวลือ/รายงานใน thread เบื้องหลังระหว่างที่หน้า login เปิดอยู่
+STARTUP_TIMING = os.environ.get("RUMOUR_STARTUP_TIMING", "0") not in ("", "0")  # พิมพ์เวลาเริ่มโปรแกรมแต่ละขั้น
+
+# ตั้งค่าการสร้างรหัสข่าวลือ/รายงานใหม่ (ตัวนับอยู่ใน Data/*.ids ใช้ร่วมกันทุก process)
+ID_BLOCK_SIZE = 100                           # จำนวนรหัสที่แต่ละ process จองไว้ต่อครั้ง
+
+# ตั้งค่าการใช้ Data/ ร่วมกันหลาย process (ตรวจไฟล์ที่ process อื่นบันทึก แล้วรวมเข้ามา)
+SYNC_INTERVAL_MS = 1000                       # ระยะเวลาระหว่างการตรวจแต่ละรอบ (มิลลิวินาที, 0 = ปิด)
+
+# ตั้งค่าการตรวจสอบ panic ที่คลายตัวแล้ว (เกณฑ์หน้าต่างเวลาอยู่ใน business_rules.PANIC_WINDOWS)
+PANIC_COOLDOWN_CHECK_MS = 60000               # ระยะเวลาระหว่างการตรวจแต่ละรอบ (มิลลิวินาที, 0 = ปิด)
+
+# ตั้งค่าการค้นหาข่าวลือ (สร้างดัชนีทีละส่วนระหว่างที่หน้าต่างว่าง เพื่อไม่ให้หน้าจอค้าง)
+SEARCH_INDEX_CHUNK = 2000                     # จำนวนข่าวลือที่เพิ่มเข้าดัชนีค้นหาต่อรอบ
+
+# ตั้งค่าการเก็บสถิติประสิทธิภาพ (เปิดได้ด้วยตัวแปรสภาพแวดล้อม RUMOUR_METRICS=1 โดยไม่ต้องแก้ไฟล์นี้)
+METRICS_ENABLED = os.environ.get("RUMOUR_METRICS", "0") not in ("", "0")
+METRICS_PATH = Path(os.environ.get("RUMOUR_METRICS_PATH", DATA_DIR / "metrics.prom"))  # นามสกุล .json = เขียนเป็น JSON
+METRICS_DUMP_INTERVAL_MS = 10000              # ระยะเวลาระหว่างการเขียนไฟล์สถิติแต่ละรอบ (มิลลิวินาที)
+
 # ตั้งค่าหน้าต่างแอปพลิเคชัน
 WINDOW_WIDTH = 820
 WINDOW_HEIGHT = 720
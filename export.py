@@ -0,0 +1,235 @@
+"""Headless streaming export of rumours, reports and the summary categories.
+
+Usage:
+    python export.py rumours [--format csv|jsonl] [--output FILE] [--gzip] [filters]
+    python export.py reports [--format csv|jsonl] [--output FILE] [--gzip] [filters]
+    python export.py summary [--format csv|jsonl] [--output FILE] [--gzip] [--from DATE] [--to DATE]
+
+Filters: ``--status``, ``--verified true|false|none`` and ``--from`` /
+``--to`` (YYYY-MM-DD, inclusive). Rumours are filtered on their own fields
+and date (``createdDate``); reports on ``reportDate`` and on the status of
+the rumour they report. ``summary`` writes the three summary view
+categories (panic, verified true, verified false) with a ``category``
+column. Rumours carry their ``reportCount``.
+
+Records are written one at a time as they are read. With the JSON backend
+reports are streamed straight from ``reports.json`` and its journal (see
+``ReportModel.stream``) instead of loading the report model, so memory does
+not grow with the number of reports; the report counts take one entry per
+rumour. Output goes to standard output unless ``--output`` is given; a
+``.gz`` output name implies ``--gzip``.
+"""
+import argparse
+import csv
+import gzip
+import io
+import json
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Optional, Sequence, TextIO, Tuple
+
+from business_rules import SUMMARY_BUCKETS
+from config import DATA_DIR, STORAGE_BACKEND
+from Models import ModelLoader, ReportModel, ReportRecord, RumourQuery, RumourRecord
+from Services.rumour_service import SUMMARY_QUERIES
+
+VERIFIED_CHOICES = {"true": True, "false": False, "none": None}
+RUMOUR_COLUMNS = RumourRecord.FIELDS + ("reportCount",)
+REPORT_COLUMNS = ReportRecord.FIELDS
+SUMMARY_COLUMNS = ("category",) + RUMOUR_COLUMNS
+GZIP_LEVEL = 6  # ระดับเดียวกับ gzip command line: เร็วกว่าระดับ 9 หลายเท่า ไฟล์ใหญ่กว่าเล็กน้อย
+
+
+def _iso_date(value: str) -> str:
+    """argparse type for YYYY-MM-DD dates."""
+    try:
+        return date.fromisoformat(value).isoformat()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{value!r} is not a date (YYYY-MM-DD)")
+
+
+def _criteria(args: argparse.Namespace) -> Dict[str, Any]:
+    """Rumour conditions (keyword arguments for ``query``) from the command line."""
+    criteria: Dict[str, Any] = {}
+    if args.status:
+        criteria["status"] = args.status
+    if args.verified is not None:
+        criteria["verified"] = VERIFIED_CHOICES[args.verified]
+    return criteria
+
+
+def _report_filter(args: argparse.Namespace, rumour_model: Any) -> Optional[Callable[[Mapping], bool]]:
+    """Predicate for reports (date range and the reported rumour's status), or None to keep them all."""
+    start, end = args.date_from, args.date_to
+    criteria = _criteria(args)
+    rumour_matches = RumourQuery(**criteria).matches if criteria else None
+    if start is None and end is None and rumour_matches is None:
+        return None
+    get_rumour = rumour_model.get_by_id if rumour_matches else None
+
+    def keep(report: Mapping) -> bool:
+        # เทียบเฉพาะส่วนวันที่ของ reportDate (YYYY-MM-DDTHH:MM:SS)
+        day = (report.get("reportDate") or "")[:10]
+        if (start is not None and day < start) or (end is not None and (not day or day > end)):
+            return False
+        if get_rumour is not None:
+            rumour = get_rumour(report.get("rumourId"))
+            return rumour is not None and rumour_matches(rumour)
+        return True
+
+    return keep
+
+
+class _Source:
+    """Where the exported records come from, for either storage backend."""
+
+    def __init__(self, backend: str) -> None:
+        """Prepare to read the data of ``backend``; models are loaded on first use."""
+        self.backend = backend
+        self._models = ModelLoader(backend)
+
+    @property
+    def rumours(self) -> Any:
+        """The rumour model (rumours are far fewer than reports, so they are loaded whole)."""
+        return self._models.get("rumours")
+
+    def reports(self, predicate: Optional[Callable[[Mapping], bool]] = None) -> Iterator[Mapping]:
+        """Every report (matching ``predicate``), streamed."""
+        if self.backend == "json":
+            # อ่านจากไฟล์ทีละรายการ ไม่ต้องโหลด ReportModel ทั้งก้อนเข้าหน่วยความจำ
+            reports = ReportModel.stream(DATA_DIR / "reports.json")
+            return filter(predicate, reports) if predicate else reports
+        return self._models.get("reports").iter_where(predicate or (lambda report: True))
+
+    def report_counts(self) -> Mapping[str, int]:
+        """Number of reports of each rumour."""
+        if self.backend == "json":
+            return Counter(report.get("rumourId") for report in self.reports())
+        return self._models.get("reports").get_report_counts()
+
+
+def _rumour_rows(rumours: Iterable[Mapping], counts: Mapping[str, int]) -> Iterator[Dict[str, Any]]:
+    """Rumours as output rows with their report count."""
+    for rumour in rumours:
+        row = dict(rumour)
+        row["reportCount"] = counts.get(rumour.get("rumourId"), 0)
+        yield row
+
+
+def export_rumours(source: _Source, args: argparse.Namespace) -> Iterator[Dict[str, Any]]:
+    """Rows of the rumours matching the filters, in load order."""
+    counts = source.report_counts()
+    rumours = source.rumours.query(**_criteria(args), created_from=args.date_from, created_to=args.date_to)
+    return _rumour_rows(rumours, counts)
+
+
+def export_reports(source: _Source, args: argparse.Namespace) -> Iterator[Mapping]:
+    """Rows of the reports matching the filters."""
+    rumour_model = source.rumours if _criteria(args) else None
+    return source.reports(_report_filter(args, rumour_model))
+
+
+def export_summary(source: _Source, args: argparse.Namespace) -> Iterator[Dict[str, Any]]:
+    """Rows of the three summary categories (as in ``SummaryView``), each tagged with its ``category``."""
+    counts = source.report_counts()
+    dates = {"created_from": args.date_from, "created_to": args.date_to}
+    for name in SUMMARY_BUCKETS:
+        if args.date_from or args.date_to:
+            rumours = source.rumours.query(**SUMMARY_QUERIES[name], **dates)
+        else:
+            rumours = source.rumours.iter_bucket(name)
+        for row in _rumour_rows(rumours, counts):
+            row["category"] = name
+            yield row
+
+
+EXPORTS: Dict[str, Tuple[Callable[[_Source, argparse.Namespace], Iterator[Mapping]], Sequence[str]]] = {
+    "rumours": (export_rumours, RUMOUR_COLUMNS),
+    "reports": (export_reports, REPORT_COLUMNS),
+    "summary": (export_summary, SUMMARY_COLUMNS),
+}
+
+
+def _csv_value(value: Any) -> Any:
+    """A field as CSV text: booleans as true/false, missing values empty."""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return value
+
+
+def write_csv(rows: Iterable[Mapping], columns: Sequence[str], handle: TextIO) -> int:
+    """Write ``rows`` as CSV with a header line; return the number of rows."""
+    writer = csv.writer(handle)
+    writer.writerow(columns)
+    count = 0
+    for row in rows:
+        writer.writerow([_csv_value(row.get(column)) for column in columns])
+        count += 1
+    return count
+
+
+def write_jsonl(rows: Iterable[Mapping], columns: Sequence[str], handle: TextIO) -> int:
+    """Write ``rows`` as one JSON object per line (all keys kept); return the number of rows."""
+    count = 0
+    for row in rows:
+        handle.write(json.dumps(dict(row), ensure_ascii=False))
+        handle.write("\n")
+        count += 1
+    return count
+
+
+WRITERS = {"csv": write_csv, "jsonl": write_jsonl}
+
+
+@contextmanager
+def open_output(path: Optional[str], compress: bool) -> Iterator[TextIO]:
+    """Text stream for the output file (standard output for None or ``-``), gzip-compressed if asked."""
+    if path in (None, "-"):
+        if not compress:
+            yield sys.stdout
+            sys.stdout.flush()
+            return
+        binary = gzip.GzipFile(fileobj=sys.stdout.buffer, mode="wb", compresslevel=GZIP_LEVEL)
+    elif compress:
+        binary = gzip.open(path, "wb", compresslevel=GZIP_LEVEL)
+    else:
+        binary = open(path, "wb")
+    # newline="" ให้ csv จัดการท้ายบรรทัดเอง
+    with io.TextIOWrapper(binary, encoding="utf-8", newline="") as handle:
+        yield handle
+
+
+def main() -> int:
+    """Run one export and print how many records were written."""
+    parser = argparse.ArgumentParser(description="Export rumours, reports or summary categories as CSV/JSONL")
+    parser.add_argument("kind", choices=list(EXPORTS), help="what to export")
+    parser.add_argument("--format", choices=list(WRITERS), default="csv", help="output format (default csv)")
+    parser.add_argument("--output", "-o", help="output file (default: standard output)")
+    parser.add_argument("--gzip", action="store_true", help="compress the output with gzip")
+    parser.add_argument("--status", help="only rumours with this status (reports: of such rumours)")
+    parser.add_argument("--verified", choices=list(VERIFIED_CHOICES), help="only rumours verified true/false or not yet")
+    parser.add_argument("--from", dest="date_from", type=_iso_date, help="first date included (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="date_to", type=_iso_date, help="last date included (YYYY-MM-DD)")
+    parser.add_argument("--backend", choices=["json", "sqlite"], default=STORAGE_BACKEND, help="storage to read")
+    args = parser.parse_args()
+    if args.kind == "summary" and (args.status or args.verified is not None):
+        # หมวดหน้าสรุปกำหนด status / verified เอง
+        parser.error("--status and --verified cannot be used with summary")
+
+    export, columns = EXPORTS[args.kind]
+    compress = args.gzip or (args.output or "").endswith(".gz")
+    start = time.perf_counter()
+    with open_output(args.output, compress) as handle:
+        count = WRITERS[args.format](export(_Source(args.backend), args), columns, handle)
+    elapsed = time.perf_counter() - start
+    print(f"Exported {count} {args.kind} rows in {elapsed:.2f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
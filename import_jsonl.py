@@ -0,0 +1,191 @@
+"""Headless bulk import of rumours or reports from a JSONL file.
+
+Usage:
+    python import_jsonl.py rumours FILE [--chunk-size N]
+    python import_jsonl.py reports FILE [--chunk-size N]
+
+Each line is one JSON object. Rumour lines need ``title`` and may set
+``source``, ``credibilityScore``, ``createdDate`` and ``status``. Report lines
+need ``reporterId``, ``rumourId`` and ``reportType`` and may set ``reportDate``
+and ``description``. Use ``-`` as FILE to read from standard input.
+"""
+import argparse
+import json
+import sys
+import time
+from datetime import date, datetime
+from typing import Dict, Iterator, List, Optional, Set, TextIO, Tuple
+
+from business_rules import REPORT_TYPES, STATUS_NORMAL, STATUS_PANIC
+from Models import create_models
+from Services import RumourService
+
+MAX_ERRORS_SHOWN = 20
+
+
+def _read_chunks(handle: TextIO, chunk_size: int) -> Iterator[List[Tuple[int, str]]]:
+    """Yield (line number, line) chunks without reading the whole file."""
+    chunk: List[Tuple[int, str]] = []
+    for line_no, line in enumerate(handle, start=1):
+        if not line.strip():
+            continue
+        chunk.append((line_no, line))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _is_iso_date(value: object) -> bool:
+    """Check that a value is a YYYY-MM-DD date string."""
+    if not isinstance(value, str):
+        return False
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _is_iso_timestamp(value: object) -> bool:
+    """Check that a value is a YYYY-MM-DD date or an ISO date-time string."""
+    if not isinstance(value, str):
+        return False
+    try:
+        datetime.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _check_rumour(record: Dict) -> Optional[str]:
+    """Return an error message if a rumour record is invalid."""
+    if not isinstance(record.get("title"), str) or not record["title"].strip():
+        return "title is required"
+    if not isinstance(record.get("source", ""), str):
+        return "source must be a string"
+    score = record.get("credibilityScore", 0)
+    if not isinstance(score, int) or isinstance(score, bool):
+        return "credibilityScore must be an integer"
+    if record.get("status", STATUS_NORMAL) not in {STATUS_NORMAL, STATUS_PANIC}:
+        return f"unknown status: {record.get('status')}"
+    if "createdDate" in record and not _is_iso_date(record["createdDate"]):
+        return "createdDate must be YYYY-MM-DD"
+    return None
+
+
+def _check_report(record: Dict, rumour_model, report_model, chunk_pairs: Set[Tuple[str, str]]) -> Optional[str]:
+    """Return an error message if a report record is invalid or a duplicate."""
+    reporter_id = record.get("reporterId")
+    rumour_id = record.get("rumourId")
+    if not reporter_id or not rumour_id:
+        return "reporterId and rumourId are required"
+    if not isinstance(reporter_id, str) or not isinstance(rumour_id, str):
+        # ดัชนีทั้งหมดใช้ ID แบบข้อความ ID ตัวเลขจะไม่ตรงกับข้อมูลใด
+        return "reporterId and rumourId must be strings"
+    if record.get("reportType") not in REPORT_TYPES:
+        return f"unknown reportType: {record.get('reportType')}"
+    if "reportDate" in record and not _is_iso_timestamp(record["reportDate"]):
+        return "reportDate must be YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS"
+    rumour = rumour_model.get_by_id(rumour_id)
+    if not rumour:
+        return f"rumour {rumour_id} not found"
+    if rumour_model.is_verified(rumour):
+        return f"rumour {rumour_id} is already verified"
+    pair = (reporter_id, rumour_id)
+    if pair in chunk_pairs or report_model.has_report(reporter_id, rumour_id):
+        return f"{reporter_id} already reported rumour {rumour_id}"
+    return None
+
+
+def _positive_int(text: str) -> int:
+    """Parse a command-line integer that must be at least 1."""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def import_file(kind: str, handle: TextIO, chunk_size: int) -> Tuple[int, int, List[str]]:
+    """Import one JSONL stream; return (number imported, number rejected, first error messages).
+
+    Only the first ``MAX_ERRORS_SHOWN`` messages are kept, so a bad feed
+    does not grow memory with every rejected line.
+    """
+    rumour_model, report_model, user_model = create_models()
+    service = RumourService(rumour_model, report_model, user_model)
+    imported = 0
+    rejected = 0
+    errors: List[str] = []
+
+    def reject(message: str) -> None:
+        nonlocal rejected
+        rejected += 1
+        if len(errors) < MAX_ERRORS_SHOWN:
+            errors.append(message)
+
+    for chunk in _read_chunks(handle, chunk_size):
+        valid: List[Dict] = []
+        chunk_pairs: Set[Tuple[str, str]] = set()
+        for line_no, line in chunk:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as exc:
+                reject(f"line {line_no}: invalid JSON ({exc.msg})")
+                continue
+            if not isinstance(record, dict):
+                reject(f"line {line_no}: expected a JSON object")
+                continue
+            if kind == "rumours":
+                problem = _check_rumour(record)
+            else:
+                problem = _check_report(record, rumour_model, report_model, chunk_pairs)
+            if problem:
+                reject(f"line {line_no}: {problem}")
+                continue
+            if kind == "reports":
+                chunk_pairs.add((record["reporterId"], record["rumourId"]))
+            valid.append(record)
+
+        # บันทึกทั้ง chunk ในครั้งเดียว
+        if kind == "rumours":
+            rumour_model.add_rumours(valid)
+        else:
+            with rumour_model.batch():
+                with report_model.batch():
+                    report_model.add_reports(valid)
+                # ประเมินสถานะ panic ครั้งเดียวต่อข่าวลือที่ได้รับรายงานใน chunk นี้
+                service.refresh_after_reports(dict.fromkeys(record["rumourId"] for record in valid))
+        rumour_model.flush()
+        imported += len(valid)
+    return imported, rejected, errors
+
+
+def main() -> int:
+    """Run the import and print the achieved throughput."""
+    parser = argparse.ArgumentParser(description="Bulk import rumours or reports from JSONL")
+    parser.add_argument("kind", choices=["rumours", "reports"], help="type of records in the file")
+    parser.add_argument("file", help="JSONL file to import, or - for standard input")
+    parser.add_argument("--chunk-size", type=_positive_int, default=10000, help="records validated and saved per chunk")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.file == "-":
+        imported, rejected, errors = import_file(args.kind, sys.stdin, args.chunk_size)
+    else:
+        with open(args.file, "r", encoding="utf-8") as handle:
+            imported, rejected, errors = import_file(args.kind, handle, args.chunk_size)
+    elapsed = time.perf_counter() - start
+
+    for message in errors:
+        print(message, file=sys.stderr)
+    if rejected > len(errors):
+        print(f"... and {rejected - len(errors)} more errors", file=sys.stderr)
+    rate = imported / elapsed if elapsed > 0 else 0.0
+    print(f"Imported {imported} {args.kind} ({rejected} rejected) in {elapsed:.2f}s ({rate:,.0f} records/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
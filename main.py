@@ -1,11 +1,22 @@
+import sys
+import time
 import tkinter as tk
 
-from config import WINDOW_HEIGHT, WINDOW_TITLE, WINDOW_WIDTH
+from config import STARTUP_TIMING, WINDOW_HEIGHT, WINDOW_TITLE, WINDOW_WIDTH
 from Controllers.app_controller import AppController
 
 
+def print_startup_timing(controller: AppController, started: float) -> None:
+    """Print how long the login window took to appear (enabled with RUMOUR_STARTUP_TIMING=1)."""
+    steps = " | ".join(f"{name} {seconds:.2f}s" for name, seconds in controller.startup_times.items())
+    total = time.perf_counter() - started
+    # ข้อมูลข่าวลือ/รายงานโหลดเมื่อใช้ครั้งแรก (หรือเบื้องหลัง) จึงพิมพ์แยกเมื่อโหลดเสร็จ
+    print(f"startup: {steps} | login window {total:.2f}s", file=sys.stderr)
+
+
 def main() -> None:
     """Initialize and run the Rumour Tracking System application."""
+    started = time.perf_counter()
     # สร้าง Tkinter root window
     root = tk.Tk()
     root.title(WINDOW_TITLE)                          # ตั้งชื่อหน้าต่าง
@@ -14,7 +25,10 @@ def main() -> None:
     root.columnconfigure(0, weight=1)
 
     # เรียก controller หลัก ที่จัดการทั้งแอปพลิเคชัน
-    AppController(root)
+    controller = AppController(root)
+    if STARTUP_TIMING:
+        # พิมพ์เวลาเมื่อหน้าต่าง login แสดงผลเสร็จ (event loop ว่างครั้งแรก)
+        root.after_idle(print_startup_timing, controller, started)
     # เริ่มรัน event loop
     root.mainloop()
 
@@ -0,0 +1,219 @@
+"""Lightweight performance metrics: counters and latency histograms.
+
+Recording is off unless ``METRICS_ENABLED`` is set in ``config.py`` (or the
+``RUMOUR_METRICS=1`` environment variable). When off, ``timed`` wrappers and
+``timer`` blocks cost one flag check. The collected values can be dumped
+as Prometheus text or JSON and are shown in the hidden debug panel
+(Ctrl+Shift+D).
+"""
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Tuple, TypeVar
+
+from config import METRICS_ENABLED
+
+PREFIX = "rumour_"
+# ขอบบนของแต่ละช่วงเวลา (วินาที) ตามแบบ Prometheus
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+F = TypeVar("F", bound=Callable[..., Any])
+Key = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+_enabled = METRICS_ENABLED
+# ค่าถูกบันทึกจากทั้ง thread หลักและ thread เบื้องหลัง (IOWorker / HTTP executor)
+_lock = threading.Lock()
+_counters: Dict[Key, float] = {}
+_histograms: Dict[Key, "Histogram"] = {}
+
+
+class Histogram:
+    """Latency distribution over the fixed ``BUCKETS``, plus sum, count and max."""
+
+    __slots__ = ("counts", "total", "count", "max")
+
+    def __init__(self) -> None:
+        """Create an empty histogram."""
+        self.counts = [0] * (len(BUCKETS) + 1)  # ช่องสุดท้ายคือ +Inf
+        self.total = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        """Record one observation."""
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the ``q`` quantile (the max for the last bucket)."""
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+def is_enabled() -> bool:
+    """Whether metrics are being recorded."""
+    return _enabled
+
+
+def set_enabled(enabled: bool) -> None:
+    """Turn recording on or off at runtime (benchmarks, the debug panel)."""
+    global _enabled
+    _enabled = enabled
+
+
+def _key(name: str, labels: Dict[str, Any]) -> Key:
+    """Hashable key of a metric and its labels."""
+    return name, tuple(sorted((label, str(value)) for label, value in labels.items()))
+
+
+def inc(name: str, amount: float = 1, **labels: Any) -> None:
+    """Add ``amount`` to a counter (e.g. ``inc("bytes_written", n, file="rumours.json")``)."""
+    if not _enabled:
+        return
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + amount
+
+
+def observe(name: str, seconds: float, **labels: Any) -> None:
+    """Record one duration in the histogram ``name``."""
+    if not _enabled:
+        return
+    key = _key(name, labels)
+    with _lock:
+        histogram = _histograms.get(key)
+        if histogram is None:
+            histogram = _histograms[key] = Histogram()
+        histogram.add(seconds)
+
+
+@contextmanager
+def timer(name: str, **labels: Any) -> Iterator[None]:
+    """Time the block into the histogram ``name``."""
+    if not _enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - start, **labels)
+
+
+def timed(name: str, **labels: Any) -> Callable[[F], F]:
+    """Decorator: time every call of the function into the histogram ``name``."""
+
+    def decorate(func: F) -> F:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                observe(name, time.perf_counter() - start, **labels)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def reset() -> None:
+    """Forget everything recorded so far."""
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+
+
+def snapshot() -> Dict[str, List[Dict[str, Any]]]:
+    """Copy of all values: ``{"counters": [...], "histograms": [...]}`` sorted by name."""
+    with _lock:
+        counters = [
+            {"name": name, "labels": dict(labels), "value": value}
+            for (name, labels), value in sorted(_counters.items())
+        ]
+        histograms = [
+            {
+                "name": name,
+                "labels": dict(labels),
+                "count": histogram.count,
+                "sum": histogram.total,
+                "max": histogram.max,
+                "p50": histogram.quantile(0.5),
+                "p95": histogram.quantile(0.95),
+                "buckets": dict(zip([str(bound) for bound in BUCKETS] + ["+Inf"], histogram.counts)),
+            }
+            for (name, labels), histogram in sorted(_histograms.items())
+        ]
+    return {"counters": counters, "histograms": histograms}
+
+
+def _label_text(labels: Dict[str, str], extra: str = "") -> str:
+    """Render labels as ``{a="1",b="2"}`` (empty without labels)."""
+    parts = [f'{label}="{value}"' for label, value in labels.items()]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def to_prometheus() -> str:
+    """Render all values in the Prometheus text exposition format."""
+    data = snapshot()
+    lines: List[str] = []
+    typed = set()
+    for counter in data["counters"]:
+        name = f"{PREFIX}{counter['name']}_total"
+        if name not in typed:
+            typed.add(name)
+            lines.append(f"# TYPE {name} counter")
+        lines.append(f"{name}{_label_text(counter['labels'])} {counter['value']:g}")
+    for histogram in data["histograms"]:
+        name = f"{PREFIX}{histogram['name']}_seconds"
+        if name not in typed:
+            typed.add(name)
+            lines.append(f"# TYPE {name} histogram")
+        cumulative = 0
+        for bound, count in histogram["buckets"].items():
+            cumulative += count
+            le = f'le="{bound}"'
+            lines.append(f"{name}_bucket{_label_text(histogram['labels'], le)} {cumulative}")
+        lines.append(f"{name}_sum{_label_text(histogram['labels'])} {histogram['sum']:.6f}")
+        lines.append(f"{name}_count{_label_text(histogram['labels'])} {histogram['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def dump(path: Path) -> None:
+    """Write all values to ``path`` atomically: JSON for ``*.json``, Prometheus text otherwise."""
+    if path.suffix == ".json":
+        text = json.dumps({"generated": time.time(), **snapshot()}, ensure_ascii=False, indent=2)
+    else:
+        text = to_prometheus()
+    # แทนที่ไฟล์ในครั้งเดียว ตัวเก็บข้อมูล (เช่น node_exporter textfile) จะไม่อ่านได้ไฟล์ครึ่งเดียว
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(text)
+        os.chmod(tmp_name, 0o644)  # ให้ตัวเก็บข้อมูลที่รันด้วยผู้ใช้อื่นอ่านได้
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
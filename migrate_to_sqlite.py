@@ -0,0 +1,40 @@
+"""One-shot migration of Data/*.json into the SQLite backend.
+
+Usage: python migrate_to_sqlite.py [--db PATH] [--force]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+from config import DATA_DIR, SQLITE_PATH
+from Models import ReportModel, RumourModel, SQLiteDatabase, UserModel
+from Models.sqlite_models import import_json_data
+
+
+def main() -> int:
+    """Import rumours, reports and users from the JSON files into SQLite."""
+    parser = argparse.ArgumentParser(description="Import Data/*.json into a SQLite database")
+    parser.add_argument("--data-dir", type=Path, default=DATA_DIR, help="folder containing the JSON files")
+    parser.add_argument("--db", type=Path, default=SQLITE_PATH, help="SQLite database file to create")
+    parser.add_argument("--force", action="store_true", help="replace an existing database file")
+    args = parser.parse_args()
+
+    if args.db.exists():
+        if not args.force:
+            print(f"{args.db} already exists (use --force to replace it)", file=sys.stderr)
+            return 1
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{args.db}{suffix}").unlink(missing_ok=True)
+
+    # อ่านผ่าน JSON models เพื่อให้รวม reports.journal.jsonl ด้วย
+    rumours = RumourModel(args.data_dir / "rumours.json").view_all()
+    reports = ReportModel(args.data_dir / "reports.json").view_all()
+    users = UserModel(args.data_dir / "users.json").get_all()
+
+    import_json_data(SQLiteDatabase(args.db), rumours, reports, users)
+    print(f"Imported {len(rumours)} rumours, {len(reports)} reports, {len(users)} users into {args.db}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+"""Run the rumour workflow as an HTTP/JSON API (no Tkinter needed).
+
+Usage:
+    python server.py [--host HOST] [--port PORT]
+"""
+import argparse
+import asyncio
+import time
+
+from config import STARTUP_TIMING
+from Models import create_models
+from Services import RumourAPIServer, RumourService
+
+
+async def _serve(host: str, port: int) -> None:
+    """Serve until interrupted, then write pending changes."""
+    started = time.perf_counter()
+    service = RumourService(*create_models())
+    if STARTUP_TIMING:
+        print(f"Data loaded in {time.perf_counter() - started:.2f}s")
+    server = RumourAPIServer(service, host, port)
+    await server.start()
+    print(f"Serving on http://{server.host}:{server.port}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+def main() -> None:
+    """Parse arguments and run the API server."""
+    parser = argparse.ArgumentParser(description="Rumour Tracking System HTTP/JSON API")
+    parser.add_argument("--host", default="127.0.0.1", help="interface to listen on")
+    parser.add_argument("--port", type=int, default=8000, help="port to listen on")
+    args = parser.parse_args()
+    try:
+        asyncio.run(_serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()